@@ -0,0 +1,146 @@
+import time
+from datetime import timedelta
+
+import numpy as np
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from analytics.models import FunnelDailyRollup, TimeToHireDailyRollup
+from analytics.rollups import BATCH_SIZE, build_rollups, funnel_totals, reset_rollups, time_to_hire
+from applications.models import Application, ApplicationStatusEvent
+from jobs.models import Job
+from users.models import User
+
+# applied -> screening, then up to three more steps; dropouts get rejected
+PATH = ["review", "interview", "hired"]
+CHUNK = 50_000
+
+
+class Command(BaseCommand):
+    help = "Full and incremental rollup build time over N synthetic status events."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--events", type=int, default=10_000_000)
+        parser.add_argument("--jobs", type=int, default=2000)
+        parser.add_argument("--recruiters", type=int, default=100)
+        parser.add_argument("--days", type=int, default=730)
+        parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        rng = np.random.default_rng(7)
+        now = timezone.now()
+
+        with transaction.atomic():
+            reset_rollups()
+            jobs = self._seed_jobs(options["jobs"], options["recruiters"])
+
+            start = time.perf_counter()
+            events = self._seed_events(rng, jobs, options["events"], options["days"], now)
+            seeded = time.perf_counter() - start
+            self.stdout.write(f"seeded {events} events in {seeded:.1f}s")
+
+            start = time.perf_counter()
+            processed = build_rollups(batch_size=options["batch_size"], now=now)
+            full = time.perf_counter() - start
+
+            funnel_rows = FunnelDailyRollup.objects.count()
+            hire_rows = TimeToHireDailyRollup.objects.count()
+
+            # One more day of traffic (~1% of the data), then the next scheduled run
+            extra = self._seed_events(rng, jobs, max(events // 100, 1), 1, now - timedelta(hours=1))
+            start = time.perf_counter()
+            incremental = build_rollups(batch_size=options["batch_size"], now=now)
+            incremental_s = time.perf_counter() - start
+
+            end_day = timezone.localdate(now)
+            start_day = end_day - timedelta(days=options["days"])
+            start = time.perf_counter()
+            funnel_totals("global", 0, start_day, end_day)
+            hires = time_to_hire("global", 0, start_day, end_day)
+            read_ms = (time.perf_counter() - start) * 1000
+
+            transaction.set_rollback(True)
+
+        self.stdout.write(
+            f"full build         {full:8.1f}s  {processed} events "
+            f"({processed / max(full, 1e-9):,.0f} events/s)"
+        )
+        self.stdout.write(f"incremental build  {incremental_s:8.2f}s  {incremental} events (+{extra} seeded)")
+        self.stdout.write(f"rollup rows        funnel {funnel_rows}, time-to-hire {hire_rows}")
+        self.stdout.write(
+            f"global read        {read_ms:8.1f}ms  {hires['hires']} hires, "
+            f"percentiles {hires['percentiles_hours']}"
+        )
+
+    def _seed_jobs(self, count, recruiters):
+        owners = [
+            User.objects.create_user(email=f"bench-rollup-{i}@example.com", password="x")
+            for i in range(recruiters)
+        ]
+        Job.objects.bulk_create(
+            [
+                Job(
+                    title=f"Bench rollup {i}", slug=f"bench-rollup-{i}", description="x",
+                    location="Pune", work_mode="onsite", created_by=owners[i % recruiters],
+                )
+                for i in range(count)
+            ],
+            batch_size=2000,
+        )
+        return list(Job.objects.filter(slug__startswith="bench-rollup-").values_list("id", flat=True))
+
+    def _seed_events(self, rng, jobs, target, days, now):
+        """
+        Applications spread over `days` days before `now`, each with its
+        "applied" event plus 0-3 forward moves (or a rejection).
+        Returns the number of events written.
+        """
+        written = 0
+        day = 0
+        per_day = max(target // (days * 3), 1)  # ~3 events per application
+        while written < target:
+            applied_at = now - timedelta(days=days - day % days, hours=int(rng.integers(0, 24)))
+            day += 1
+
+            apps = Application.objects.bulk_create(
+                [
+                    Application(
+                        job_id=int(job_id), full_name="Bench",
+                        email=f"r{written}-{i}@example.com", phone="9000000000",
+                    )
+                    for i, job_id in enumerate(rng.choice(jobs, per_day))
+                ],
+                batch_size=2000,
+            )
+            # auto_now_add ignores the value passed to bulk_create
+            Application.objects.filter(id__in=[a.id for a in apps]).update(applied_at=applied_at)
+
+            steps = rng.integers(0, len(PATH) + 1, len(apps))
+            rejected = rng.random(len(apps)) < 0.5
+            gaps = rng.exponential(72, (len(apps), len(PATH) + 1))
+
+            batch = []
+            for app, k, reject, gap in zip(apps, steps, rejected, gaps):
+                at = applied_at
+                batch.append(ApplicationStatusEvent(
+                    application_id=app.id, job_id=app.job_id,
+                    from_status="", to_status="screening", created_at=at,
+                ))
+                status = "screening"
+                path = PATH[:k] + (["rejected"] if reject and k < len(PATH) else [])
+                for step, to_status in enumerate(path):
+                    at = min(at + timedelta(hours=float(gap[step])), now - timedelta(minutes=10))
+                    batch.append(ApplicationStatusEvent(
+                        application_id=app.id, job_id=app.job_id,
+                        from_status=status, to_status=to_status, created_at=at,
+                    ))
+                    status = to_status
+                if len(batch) >= CHUNK:
+                    ApplicationStatusEvent.objects.bulk_create(batch, batch_size=5000)
+                    written += len(batch)
+                    batch = []
+            ApplicationStatusEvent.objects.bulk_create(batch, batch_size=5000)
+            written += len(batch)
+        return written
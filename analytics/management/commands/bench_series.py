@@ -0,0 +1,90 @@
+import json
+import time
+from datetime import timedelta
+
+import numpy as np
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from analytics.management.commands import bench_rollups
+from analytics.rollups import build_rollups, reset_rollups
+from analytics.series import bump_series_version, chart_series, reset_series
+from jobs.models import Job
+
+
+class Command(BaseCommand):
+    help = "Chart series response size and latency for 2-year ranges."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--events", type=int, default=1_000_000)
+        parser.add_argument("--jobs", type=int, default=2000)
+        parser.add_argument("--recruiters", type=int, default=100)
+        parser.add_argument("--days", type=int, default=730)
+        parser.add_argument("--repeat", type=int, default=200)
+
+    def handle(self, *args, **options):
+        rng = np.random.default_rng(11)
+        now = timezone.now()
+        end = timezone.localdate(now)
+        start = end - timedelta(days=options["days"] - 1)
+        seeder = bench_rollups.Command()
+
+        with transaction.atomic():
+            reset_rollups()
+            reset_series()
+            jobs = seeder._seed_jobs(options["jobs"], options["recruiters"])
+            # Spread job postings over the range as well
+            for day in range(options["days"]):
+                Job.objects.filter(id__in=jobs[day::options["days"]]).update(
+                    created_at=now - timedelta(days=day, hours=1)
+                )
+            events = seeder._seed_events(rng, jobs, options["events"], options["days"], now)
+            self.stdout.write(f"seeded {events} events, {len(jobs)} jobs")
+
+            for name in ("applications", "jobs"):
+                self._report(name, start, end, options["repeat"])
+
+            # Same cold build, but seeded from the funnel rollups
+            build_rollups(now=now)
+            reset_series()
+            started = time.perf_counter()
+            chart_series("applications", start, end)
+            cold = (time.perf_counter() - started) * 1000
+            self.stdout.write(f"applications cold build from rollups {cold:8.1f}ms")
+
+            transaction.set_rollback(True)
+
+        reset_series()
+
+    def _report(self, name, start, end, repeat):
+        reset_series()
+        started = time.perf_counter()
+        chart_series(name, start, end)
+        cold = (time.perf_counter() - started) * 1000
+
+        # Response cache miss, store already built (what a new application costs)
+        misses = []
+        for _ in range(20):
+            bump_series_version()
+            started = time.perf_counter()
+            chart_series(name, start, end)
+            misses.append(time.perf_counter() - started)
+        miss = np.median(misses) * 1000
+
+        started = time.perf_counter()
+        for _ in range(repeat):
+            chart_series(name, start, end)
+        hit = (time.perf_counter() - started) / repeat * 1_000_000
+
+        self.stdout.write(
+            f"{name:<13} cold {cold:8.1f}ms   invalidated {miss:6.2f}ms   cached {hit:6.1f}us"
+        )
+        for bucket in ("day", "week", "month"):
+            payload = chart_series(name, start, end, bucket)
+            size = len(json.dumps(payload, separators=(",", ":")))
+            self.stdout.write(
+                f"    {bucket:<6} {len(payload['points']):4d} points x "
+                f"{len(payload['datasets'])} datasets  {size / 1024:6.1f} KB"
+            )
@@ -0,0 +1,27 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from analytics.rollups import BATCH_SIZE, build_rollups, reset_rollups
+
+
+class Command(BaseCommand):
+    help = "Fold new application status events into the analytics rollups (run hourly)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+        parser.add_argument(
+            "--rebuild",
+            action="store_true",
+            help="Drop all rollups and replay every event.",
+        )
+
+    def handle(self, *args, **options):
+        if options["rebuild"]:
+            reset_rollups()
+
+        start = time.perf_counter()
+        processed = build_rollups(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(
+            f"Folded {processed} events in {time.perf_counter() - start:.2f} s."
+        ))
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.10 on 2026-10-19 14:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RollupWatermark',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, unique=True)),
+                ('last_event_id', models.BigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='FunnelDailyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('scope', models.CharField(choices=[('global', 'Global'), ('recruiter', 'Recruiter'), ('job', 'Job')], max_length=10)),
+                ('scope_id', models.BigIntegerField(default=0)),
+                ('stage', models.CharField(max_length=20)),
+                ('count', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['scope', 'stage', 'day'], name='funnel_rollup_stage_idx')],
+                'unique_together': {('scope', 'scope_id', 'day', 'stage')},
+            },
+        ),
+        migrations.CreateModel(
+            name='TimeToHireDailyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('scope', models.CharField(choices=[('global', 'Global'), ('recruiter', 'Recruiter'), ('job', 'Job')], max_length=10)),
+                ('scope_id', models.BigIntegerField(default=0)),
+                ('hires', models.PositiveIntegerField(default=0)),
+                ('histogram', models.JSONField(default=list)),
+            ],
+            options={
+                'unique_together': {('scope', 'scope_id', 'day')},
+            },
+        ),
+    ]
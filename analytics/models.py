@@ -0,0 +1,70 @@
+# analytics/models.py
+#
+# Pre-aggregated hiring funnel rollups, built incrementally from
+# ApplicationStatusEvent by analytics/rollups.py. Dashboards and
+# /api/analytics/ read only these tables.
+
+from django.db import models
+
+SCOPES = [
+    ("global", "Global"),
+    ("recruiter", "Recruiter"),
+    ("job", "Job"),
+]
+
+# "applied" = first event of an application, the rest are STATUS_CHOICES
+STAGES = ["applied", "screening", "review", "interview", "hired", "rejected"]
+
+
+class RollupWatermark(models.Model):
+    """
+    Last ApplicationStatusEvent id already folded into the rollups, and
+    the [id, first seen (epoch seconds)] gaps below it: ids not committed
+    yet when their window was folded.
+    """
+    name = models.CharField(max_length=50, unique=True)
+    last_event_id = models.BigIntegerField(default=0)
+    gaps = models.JSONField(default=list)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.name} @ {self.last_event_id}"
+
+
+class FunnelDailyRollup(models.Model):
+    """Applications entering `stage` on `day`, per job / recruiter / globally."""
+    day = models.DateField()
+    scope = models.CharField(max_length=10, choices=SCOPES)
+    scope_id = models.BigIntegerField(default=0)  # job / recruiter id, 0 for global
+    stage = models.CharField(max_length=20)
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        # also the read index: WHERE scope = .. AND scope_id = .. AND day BETWEEN ..
+        unique_together = ("scope", "scope_id", "day", "stage")
+        indexes = [
+            # "top jobs / recruiters by stage" leaderboards
+            models.Index(fields=["scope", "stage", "day"], name="funnel_rollup_stage_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.day} {self.scope}:{self.scope_id} {self.stage}={self.count}"
+
+
+class TimeToHireDailyRollup(models.Model):
+    """
+    Hires on `day` with a histogram of applied -> hired hours
+    (buckets: analytics.rollups.HOUR_EDGES). Histograms add up across
+    days, so percentiles for any date range come from summed buckets.
+    """
+    day = models.DateField()
+    scope = models.CharField(max_length=10, choices=SCOPES)
+    scope_id = models.BigIntegerField(default=0)
+    hires = models.PositiveIntegerField(default=0)
+    histogram = models.JSONField(default=list)
+
+    class Meta:
+        unique_together = ("scope", "scope_id", "day")
+
+    def __str__(self):
+        return f"{self.day} {self.scope}:{self.scope_id} hires={self.hires}"
@@ -0,0 +1,310 @@
+# analytics/rollups.py
+#
+# Incremental hiring funnel rollups.
+# Each run folds the ApplicationStatusEvent rows added since the last
+# watermark into daily per-job / per-recruiter / global counters.
+# Ids are assigned at INSERT, not COMMIT, so a slow transaction can
+# commit an id the watermark already passed: ids missing from a folded
+# window are kept on the watermark as gaps and folded when they show up
+# (or dropped after ANALYTICS_ROLLUP_GAP_TTL: rolled back, never coming).
+# - the DB does the heavy GROUP BY (day, job, stage) per id window,
+# - time-to-hire goes into fixed log-spaced hour histograms (NumPy),
+#   which add up across days, so any date range gets exact-bucket
+#   percentiles without rereading events.
+
+from collections import Counter
+from datetime import timedelta
+
+import numpy as np
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Case, CharField, Count, F, Max, Sum, Value, When
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from analytics.models import STAGES, FunnelDailyRollup, RollupWatermark, TimeToHireDailyRollup
+from applications.models import ApplicationStatusEvent
+from core.scheduler import run_periodically
+
+WATERMARK = "status_events"
+BATCH_SIZE = 200_000
+MAX_GAPS = 10_000  # newest kept; ids skipped in bulk (sequence jumps) aren't late commits
+
+# Bucket i holds [HOUR_EDGES[i], HOUR_EDGES[i + 1]) hours; the last one is open-ended
+HOUR_EDGES = np.concatenate(([0.0], np.geomspace(1, 24 * 730, 47)))
+
+
+# =====================================================
+# Histogram math (NumPy, no DB access)
+# =====================================================
+def hour_buckets(hours):
+    return np.searchsorted(HOUR_EDGES, np.maximum(hours, 0), side="right") - 1
+
+
+def histogram_percentiles(histogram, percentiles):
+    """
+    Percentiles (0-100) of a bucketed distribution, linearly
+    interpolated inside the bucket. All percentiles in one pass.
+    """
+    counts = np.asarray(histogram, dtype=np.float64)
+    total = counts.sum()
+    if not total:
+        return [None] * len(percentiles)
+
+    cumulative = np.cumsum(counts)
+    targets = np.asarray(percentiles, dtype=np.float64) / 100 * total
+    idx = np.minimum(np.searchsorted(cumulative, targets, side="left"), len(counts) - 1)
+
+    below = cumulative[idx] - counts[idx]
+    fraction = np.where(counts[idx] > 0, (targets - below) / np.maximum(counts[idx], 1), 0)
+    lower = HOUR_EDGES[idx]
+    upper = np.where(idx + 1 < len(HOUR_EDGES), HOUR_EDGES[np.minimum(idx + 1, len(HOUR_EDGES) - 1)], lower)
+    return (lower + np.clip(fraction, 0, 1) * (upper - lower)).round(1).tolist()
+
+
+def _scope_keys(job_id, recruiter_id):
+    keys = [("global", 0), ("job", job_id)]
+    if recruiter_id:
+        keys.append(("recruiter", recruiter_id))
+    return keys
+
+
+# =====================================================
+# Incremental build
+# =====================================================
+def event_stage():
+    """Funnel stage an event counts towards: the first event is "applied"."""
+    return Case(
+        When(from_status="", then=Value("applied")),
+        default=F("to_status"),
+        output_field=CharField(),
+    )
+
+
+def build_rollups(batch_size=BATCH_SIZE, now=None):
+    """
+    Fold new status events into the rollup tables. Returns the number of
+    events processed. Safe to run from several workers: every step is
+    claimed with a conditional UPDATE of the watermark.
+    """
+    now = now or timezone.now()
+    cutoff = now - timedelta(seconds=settings.ANALYTICS_ROLLUP_LAG)
+
+    state, _ = RollupWatermark.objects.get_or_create(name=WATERMARK)
+    processed = 0
+
+    if state.gaps:
+        expired = (now - timedelta(seconds=settings.ANALYTICS_ROLLUP_GAP_TTL)).timestamp()
+        with transaction.atomic():
+            if not _claim(state):
+                return processed  # another worker is running
+            late = set(
+                ApplicationStatusEvent.objects.filter(id__in=[gap[0] for gap in state.gaps])
+                .values_list("id", flat=True)
+            )
+            if late:
+                processed += _fold_events(ApplicationStatusEvent.objects.filter(id__in=late))
+            _claim(state, gaps=[gap for gap in state.gaps if gap[0] not in late and gap[1] > expired])
+
+    high = (
+        ApplicationStatusEvent.objects
+        .filter(id__gt=state.last_event_id, created_at__lt=cutoff)
+        .aggregate(high=Max("id"))["high"]
+    )
+    low = state.last_event_id
+    while high and low < high:
+        upper = min(low + batch_size, high)
+        with transaction.atomic():
+            if not _claim(state, last_event_id=upper):
+                break  # another worker moved the watermark
+            events = ApplicationStatusEvent.objects.filter(id__gt=low, id__lte=upper)
+            folded = _fold_events(events)
+            if folded < upper - low:
+                seen = set(events.values_list("id", flat=True))
+                missing = [[i, now.timestamp()] for i in range(low + 1, upper + 1) if i not in seen]
+                _claim(state, gaps=(state.gaps + missing)[-MAX_GAPS:])
+            processed += folded
+        low = upper
+
+    return processed
+
+
+def _claim(state, **changes):
+    """
+    Apply `changes` to the watermark unless another worker has moved it
+    since `state` was read (then False, nothing written). Holds the row
+    until the transaction ends.
+    """
+    changes["updated_at"] = timezone.now()
+    claimed = RollupWatermark.objects.filter(pk=state.pk, updated_at=state.updated_at).update(**changes)
+    if claimed:
+        for field, value in changes.items():
+            setattr(state, field, value)
+    return bool(claimed)
+
+
+def _fold_events(events):
+    """Add `events` (a queryset) to the rollups. Returns how many there were."""
+    rows = (
+        events.annotate(day=TruncDate("created_at"), stage=event_stage())
+        .values("day", "job_id", "job__created_by_id", "stage")
+        .annotate(n=Count("id"))
+        .order_by()
+    )
+
+    funnel = Counter()
+    processed = 0
+    for row in rows:
+        processed += row["n"]
+        for scope, scope_id in _scope_keys(row["job_id"], row["job__created_by_id"]):
+            funnel[(scope, scope_id, row["day"], row["stage"])] += row["n"]
+    _merge_funnel(funnel)
+
+    # Transitions into "hired" only: a first event ("" -> hired, e.g.
+    # backfilled) counts as "applied" in the funnel, not as a hire
+    hires = list(
+        events.filter(to_status="hired").exclude(from_status="").values_list(
+            "created_at", "application__applied_at", "job_id", "job__created_by_id"
+        )
+    )
+    if hires:
+        _merge_hires(_hire_histograms(hires))
+
+    return processed
+
+
+def _hire_histograms(hires):
+    """{(scope, scope_id, day): histogram array} for a batch of hire events."""
+    hired_at = np.fromiter((h[0].timestamp() for h in hires), dtype=np.float64, count=len(hires))
+    applied_at = np.fromiter((h[1].timestamp() for h in hires), dtype=np.float64, count=len(hires))
+    buckets = hour_buckets((hired_at - applied_at) / 3600)
+
+    key_index = {}
+    rows, cols = [], []
+    for (created_at, _, job_id, recruiter_id), bucket in zip(hires, buckets):
+        day = timezone.localdate(created_at)
+        for scope, scope_id in _scope_keys(job_id, recruiter_id):
+            rows.append(key_index.setdefault((scope, scope_id, day), len(key_index)))
+            cols.append(bucket)
+
+    matrix = np.zeros((len(key_index), len(HOUR_EDGES)), dtype=np.int64)
+    np.add.at(matrix, (np.asarray(rows), np.asarray(cols)), 1)
+    return {key: matrix[i] for key, i in key_index.items()}
+
+
+def _existing(model, keys, key_fields):
+    days = {key[2] for key in keys}
+    scope_ids = {key[1] for key in keys}
+    existing = model.objects.filter(day__in=days, scope_id__in=scope_ids)
+    return {tuple(getattr(obj, f) for f in key_fields): obj for obj in existing}
+
+
+def _merge_funnel(funnel):
+    if not funnel:
+        return
+    existing = _existing(FunnelDailyRollup, funnel, ("scope", "scope_id", "day", "stage"))
+
+    to_update, to_create = [], []
+    for key, n in funnel.items():
+        obj = existing.get(key)
+        if obj:
+            obj.count += n
+            to_update.append(obj)
+        else:
+            scope, scope_id, day, stage = key
+            to_create.append(FunnelDailyRollup(
+                scope=scope, scope_id=scope_id, day=day, stage=stage, count=n,
+            ))
+
+    FunnelDailyRollup.objects.bulk_update(to_update, ["count"], batch_size=2000)
+    FunnelDailyRollup.objects.bulk_create(to_create, batch_size=2000)
+
+
+def _merge_hires(histograms):
+    existing = _existing(TimeToHireDailyRollup, histograms, ("scope", "scope_id", "day"))
+
+    to_update, to_create = [], []
+    for key, histogram in histograms.items():
+        obj = existing.get(key)
+        if obj:
+            merged = np.asarray(obj.histogram or [0] * len(HOUR_EDGES)) + histogram
+            obj.histogram = merged.tolist()
+            obj.hires = int(merged.sum())
+            to_update.append(obj)
+        else:
+            scope, scope_id, day = key
+            to_create.append(TimeToHireDailyRollup(
+                scope=scope, scope_id=scope_id, day=day,
+                hires=int(histogram.sum()), histogram=histogram.tolist(),
+            ))
+
+    TimeToHireDailyRollup.objects.bulk_update(to_update, ["hires", "histogram"], batch_size=2000)
+    TimeToHireDailyRollup.objects.bulk_create(to_create, batch_size=2000)
+
+
+def reset_rollups():
+    """Drop all rollups; the next build_rollups() replays every event."""
+    with transaction.atomic():
+        FunnelDailyRollup.objects.all().delete()
+        TimeToHireDailyRollup.objects.all().delete()
+        RollupWatermark.objects.filter(name=WATERMARK).update(last_event_id=0, gaps=[])
+
+
+def start_rollup_scheduler():
+    """Daemon thread per web worker when ANALYTICS_ROLLUP_INTERVAL > 0."""
+    return run_periodically("analytics-rollups", settings.ANALYTICS_ROLLUP_INTERVAL, build_rollups)
+
+
+# =====================================================
+# Reads (rollup tables only)
+# =====================================================
+def _window(model, scope, scope_id, start, end):
+    return model.objects.filter(scope=scope, scope_id=scope_id, day__gte=start, day__lte=end)
+
+
+def funnel_totals(scope, scope_id, start, end):
+    """{stage: count} plus conversion from "applied" for the date range."""
+    totals = dict(
+        _window(FunnelDailyRollup, scope, scope_id, start, end)
+        .values_list("stage")
+        .annotate(n=Sum("count"))
+        .order_by()
+    )
+    applied = totals.get("applied", 0)
+    return [
+        {
+            "stage": stage,
+            "count": totals.get(stage, 0),
+            "conversion": round(totals.get(stage, 0) / applied, 4) if applied else None,
+        }
+        for stage in STAGES
+    ]
+
+
+def time_to_hire(scope, scope_id, start, end, percentiles=(50, 75, 90)):
+    histograms = list(
+        _window(TimeToHireDailyRollup, scope, scope_id, start, end)
+        .values_list("histogram", flat=True)
+    )
+    if not histograms:
+        return {"hires": 0, "percentiles_hours": {str(p): None for p in percentiles}}
+
+    width = len(HOUR_EDGES)
+    summed = np.array([h + [0] * (width - len(h)) for h in histograms], dtype=np.int64).sum(axis=0)
+    values = histogram_percentiles(summed, percentiles)
+    return {
+        "hires": int(summed.sum()),
+        "percentiles_hours": {str(p): v for p, v in zip(percentiles, values)},
+    }
+
+
+def top_scopes(scope, stage, start, end, limit=10):
+    """[(scope_id, count)] with the most entries into `stage`."""
+    return list(
+        FunnelDailyRollup.objects
+        .filter(scope=scope, stage=stage, day__gte=start, day__lte=end)
+        .values_list("scope_id")
+        .annotate(n=Sum("count"))
+        .order_by("-n")[:limit]
+    )
@@ -0,0 +1,279 @@
+# analytics/series.py
+#
+# Time series for the dashboard charts.
+# Each series has a store in the cache: a dense (label x day) NumPy count
+# matrix plus the last source id folded into it, so a refresh only reads
+# rows added since. Rows younger than ANALYTICS_ROLLUP_LAG are added as a
+# live tail on every response but never persisted (a slow transaction can
+# still commit an older id behind them). Responses are downsampled to at
+# most MAX_POINTS day / week / month buckets and cached under a version
+# bumped by new applications, status changes and new jobs.
+
+from datetime import timedelta
+
+import numpy as np
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Max
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from analytics.models import STAGES, FunnelDailyRollup, RollupWatermark
+from analytics.rollups import WATERMARK, event_stage
+from applications.models import ApplicationStatusEvent
+from jobs.models import Job
+from users.models import User
+
+SERIES_VERSION_KEY = "analytics:series:version"
+STORE_KEY = "analytics:series:store:{}"
+MAX_POINTS = 120
+MAX_RANGE_DAYS = 3660
+BUCKETS = {"day": 1, "week": 7, "month": 30}
+
+
+def bump_series_version():
+    """Invalidate every cached chart response (stores stay valid)."""
+    try:
+        cache.incr(SERIES_VERSION_KEY)
+    except ValueError:
+        cache.set(SERIES_VERSION_KEY, 1, None)
+
+
+def reset_series():
+    """Drop the stores too; the next request rebuilds them."""
+    cache.delete_many([STORE_KEY.format(name) for name in SOURCES])
+    bump_series_version()
+
+
+# =====================================================
+# Sources: (day, label, count) rows with id in (low, high]
+# =====================================================
+def _application_rows(low, high=None):
+    events = ApplicationStatusEvent.objects.filter(id__gt=low)
+    if high is not None:
+        events = events.filter(id__lte=high)
+    return (
+        events.annotate(day=TruncDate("created_at"), stage=event_stage())
+        .values_list("day", "stage")
+        .annotate(n=Count("id"))
+        .order_by()
+    )
+
+
+def _seed_applications(store):
+    # Start from the global funnel rollups when they exist
+    state = RollupWatermark.objects.filter(name=WATERMARK).first()
+    if not state or not state.last_event_id:
+        return
+    _add_rows(
+        store,
+        FunnelDailyRollup.objects.filter(scope="global", scope_id=0, day__gte=store["start"])
+        .values_list("day", "stage", "count"),
+    )
+    store["through"] = state.last_event_id
+
+
+def _job_rows(low, high=None):
+    jobs = Job.objects.filter(id__gt=low)
+    if high is not None:
+        jobs = jobs.filter(id__lte=high)
+    return (
+        jobs.annotate(day=TruncDate("created_at"))
+        .values_list("day", "created_by_id")
+        .annotate(n=Count("id"))
+        .order_by()
+    )
+
+
+# name -> (source model, rows(low, high), optional seed(store))
+SOURCES = {
+    "applications": (ApplicationStatusEvent, _application_rows, _seed_applications),
+    "jobs": (Job, _job_rows, None),
+}
+
+
+# =====================================================
+# Store (label x day matrix)
+# =====================================================
+def _empty_store(start):
+    return {"start": start, "labels": [], "counts": np.zeros((0, 0), dtype=np.int64), "through": 0}
+
+
+def _add_rows(store, rows):
+    """Fold (day, label, n) rows in; days before the store start are dropped."""
+    start = store["start"]
+    rows = [row for row in rows if row[0] >= start]
+    if not rows:
+        return
+
+    labels = store["labels"]
+    index = {label: i for i, label in enumerate(labels)}
+    for _, label, _ in rows:
+        if label not in index:
+            index[label] = len(labels)
+            labels.append(label)
+
+    old = store["counts"]
+    width = max(old.shape[1], (max(row[0] for row in rows) - start).days + 1)
+    counts = np.zeros((len(labels), width), dtype=np.int64)
+    counts[:old.shape[0], :old.shape[1]] = old
+
+    np.add.at(
+        counts,
+        (
+            np.fromiter((index[label] for _, label, _ in rows), dtype=np.int64, count=len(rows)),
+            np.fromiter(((day - start).days for day, _, _ in rows), dtype=np.int64, count=len(rows)),
+        ),
+        np.fromiter((n for _, _, n in rows), dtype=np.int64, count=len(rows)),
+    )
+    store["counts"] = counts
+
+
+def _refresh_store(name, today, now):
+    """Load the store, trim it to the window and fold in settled rows."""
+    model, rows, seed = SOURCES[name]
+    start = today - timedelta(days=settings.ANALYTICS_SERIES_DAYS - 1)
+    key = STORE_KEY.format(name)
+
+    store = cache.get(key)
+    changed = False
+    if store is None or store["start"] > start:
+        store = _empty_store(start)
+        if seed:
+            seed(store)
+        changed = True
+    elif store["start"] < start:
+        shift = (start - store["start"]).days
+        store["counts"] = store["counts"][:, shift:]
+        store["start"] = start
+        changed = True
+
+    cutoff = now - timedelta(seconds=settings.ANALYTICS_ROLLUP_LAG)
+    high = (
+        model.objects.filter(id__gt=store["through"], created_at__lt=cutoff)
+        .aggregate(high=Max("id"))["high"]
+    )
+    if high:
+        _add_rows(store, rows(store["through"], high))
+        store["through"] = high
+        changed = True
+
+    if changed:
+        cache.set(key, store, None)
+    return store
+
+
+def _window(store, start, end):
+    """(labels x days) counts for start..end, zero outside the store."""
+    days = (end - start).days + 1
+    counts = store["counts"]
+    window = np.zeros((len(store["labels"]), days), dtype=np.int64)
+
+    offset = (start - store["start"]).days
+    lo, hi = max(offset, 0), min(offset + days, counts.shape[1])
+    if lo < hi:
+        window[:counts.shape[0], lo - offset:hi - offset] = counts[:, lo:hi]
+    return window
+
+
+# =====================================================
+# Downsampling (NumPy, no DB access)
+# =====================================================
+def pick_bucket(days, bucket="auto"):
+    if bucket in BUCKETS:
+        return bucket
+    for name, size in BUCKETS.items():
+        if days <= MAX_POINTS * size:
+            return name
+    return "month"
+
+
+def downsample(counts, start, bucket):
+    """Sum daily columns into day / week (Monday) / month buckets."""
+    keys = []
+    for i in range(counts.shape[1]):
+        day = start + timedelta(days=i)
+        if bucket == "week":
+            day -= timedelta(days=day.weekday())
+        elif bucket == "month":
+            day = day.replace(day=1)
+        keys.append(day)
+
+    edges = [i for i in range(len(keys)) if i == 0 or keys[i] != keys[i - 1]]
+    return [keys[i] for i in edges], np.add.reduceat(counts, edges, axis=1)
+
+
+# =====================================================
+# Presentation per series
+# =====================================================
+def _present_applications(labels, counts, limit):
+    rows = {label: counts[i] for i, label in enumerate(labels)}
+    zeros = np.zeros(counts.shape[1], dtype=np.int64)
+    return [(stage, rows.get(stage, zeros)) for stage in STAGES]
+
+
+def _present_jobs(labels, counts, limit):
+    # Top `limit` recruiters in the range, everyone else as "Other"
+    totals = counts.sum(axis=1)
+    order = [i for i in np.argsort(-totals, kind="stable") if totals[i] > 0]
+    top, rest = order[:limit], order[limit:]
+
+    emails = dict(
+        User.objects.filter(id__in=[labels[i] for i in top if labels[i]]).values_list("id", "email")
+    )
+    datasets = [(emails.get(labels[i], "Unassigned"), counts[i]) for i in top]
+    if rest:
+        datasets.append(("Other", counts[rest].sum(axis=0)))
+    return datasets
+
+
+PRESENTERS = {
+    "applications": _present_applications,
+    "jobs": _present_jobs,
+}
+
+
+# =====================================================
+# Public entry point
+# =====================================================
+def chart_series(name, start, end, bucket="auto", limit=5):
+    """
+    JSON-ready chart data for `name` between two dates (inclusive):
+    {"series", "bucket", "start", "end", "points": [...], "datasets": [{"label", "data"}]}
+    Raises KeyError for unknown series, ValueError for bad ranges.
+    """
+    if name not in SOURCES:
+        raise KeyError(name)
+    days = (end - start).days + 1
+    if days < 1 or days > MAX_RANGE_DAYS:
+        raise ValueError(f"range must be 1-{MAX_RANGE_DAYS} days")
+    bucket = pick_bucket(days, bucket)
+
+    version = cache.get_or_set(SERIES_VERSION_KEY, 1, None)
+    key = f"analytics:series:{version}:{name}:{start}:{end}:{bucket}:{limit}"
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+
+    now = timezone.now()
+    store = _refresh_store(name, timezone.localdate(now), now)
+
+    # Unsettled rows: counted in this response, never persisted
+    live = {**store, "labels": list(store["labels"])}
+    _add_rows(live, SOURCES[name][1](store["through"]))
+
+    points, counts = downsample(_window(live, start, end), start, bucket)
+    payload = {
+        "series": name,
+        "bucket": bucket,
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+        "points": [point.isoformat() for point in points],
+        "datasets": [
+            {"label": label, "data": data.tolist()}
+            for label, data in PRESENTERS[name](live["labels"], counts, limit)
+        ],
+    }
+    cache.set(key, payload, settings.ANALYTICS_SERIES_TIMEOUT)
+    return payload
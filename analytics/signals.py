@@ -0,0 +1,22 @@
+# analytics/signals.py
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from analytics.series import bump_series_version, reset_series
+from applications.models import ApplicationStatusEvent
+from jobs.models import Job
+
+
+@receiver(post_save, sender=ApplicationStatusEvent)
+@receiver(post_save, sender=Job)
+def series_source_added(sender, created, **kwargs):
+    # New application / status change / job -> cached chart responses are stale
+    if created:
+        bump_series_version()
+
+
+@receiver(post_delete, sender=Job)
+def job_deleted(sender, **kwargs):
+    # Hard deletes remove counts already folded into the stores
+    reset_series()
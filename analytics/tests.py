@@ -0,0 +1,186 @@
+from datetime import date, timedelta
+
+import numpy as np
+
+from django.conf import settings
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+
+from analytics.models import STAGES, RollupWatermark
+from analytics.rollups import (
+    HOUR_EDGES, WATERMARK, build_rollups, funnel_totals, histogram_percentiles, time_to_hire,
+)
+from analytics.series import STORE_KEY, chart_series, downsample, pick_bucket
+from applications.models import Application, ApplicationStatusEvent
+from applications.status import change_status
+from jobs.models import Job
+from users.models import User
+
+
+class RollupTests(TestCase):
+
+    def setUp(self):
+        self.recruiter = User.objects.create_user(
+            email="rec@example.com", password="pw-12345!", role="RECRUITER", is_active=True
+        )
+        self.job = Job.objects.create(
+            title="Backend", description="x", location="Pune", work_mode="onsite", created_by=self.recruiter,
+        )
+        self.apps = [
+            Application.objects.create(
+                job=self.job, full_name="Asha Rao", email=f"c{i}@example.com", phone="9876543210",
+            )
+            for i in range(4)
+        ]
+        self.today = timezone.localdate()
+        # Everything so far is older than ANALYTICS_ROLLUP_LAG
+        self.later = timezone.now() + timedelta(seconds=settings.ANALYTICS_ROLLUP_LAG + 1)
+
+    def totals(self, scope="job", scope_id=None):
+        scope_id = self.job.pk if scope_id is None else scope_id
+        rows = funnel_totals(scope, scope_id, self.today - timedelta(days=1), self.today + timedelta(days=1))
+        return {row["stage"]: row["count"] for row in rows if row["count"]}
+
+    def test_funnel_totals_per_scope_and_incremental(self):
+        change_status(self.apps[0], "interview")
+        change_status(self.apps[1], "interview")
+        change_status(self.apps[1], "hired")
+
+        self.assertEqual(build_rollups(now=self.later), 7)
+        expected = {"applied": 4, "interview": 2, "hired": 1}
+        self.assertEqual(self.totals(), expected)
+        self.assertEqual(self.totals("recruiter", self.recruiter.pk), expected)
+        self.assertEqual(self.totals("global", 0), expected)
+
+        # Next run folds only what was added since
+        self.assertEqual(build_rollups(now=self.later), 0)
+        change_status(self.apps[2], "rejected")
+        self.assertEqual(build_rollups(now=self.later), 1)
+        self.assertEqual(self.totals()["rejected"], 1)
+        self.assertEqual(funnel_totals("job", self.job.pk, self.today, self.today)[4]["conversion"], 0.25)
+
+    def test_histogram_percentiles_interpolate_inside_buckets(self):
+        histogram = [0] * len(HOUR_EDGES)
+        histogram[0] = 2   # [0, 1) hours
+        histogram[5] = 2
+        low, high = HOUR_EDGES[5], HOUR_EDGES[6]
+
+        self.assertEqual(
+            histogram_percentiles(histogram, [25, 50, 75, 100]),
+            [0.5, 1.0, round(low + (high - low) / 2, 1), round(high, 1)],
+        )
+        self.assertEqual(histogram_percentiles([0] * len(HOUR_EDGES), [50]), [None])
+
+    def test_time_to_hire_percentiles(self):
+        for app in self.apps:
+            Application.objects.filter(pk=app.pk).update(applied_at=timezone.now() - timedelta(minutes=30))
+            change_status(app, "hired")
+        build_rollups(now=self.later)
+
+        result = time_to_hire("job", self.job.pk, self.today, self.today, percentiles=(50, 100))
+        self.assertEqual(result["hires"], 4)
+        self.assertEqual(result["percentiles_hours"], {"50": 0.5, "100": 1.0})
+
+    def test_backfilled_first_event_is_applied_not_a_hire(self):
+        # Like migration 0009: a "" -> current status event at applied_at
+        backfilled = self.apps[0]
+        backfilled.status_events.all().delete()
+        ApplicationStatusEvent.objects.create(
+            application=backfilled, job=self.job, from_status="", to_status="hired",
+            created_at=backfilled.applied_at,
+        )
+        change_status(self.apps[1], "hired")
+        build_rollups(now=self.later)
+
+        result = time_to_hire("job", self.job.pk, self.today, self.today)
+        self.assertEqual(result["hires"], 1)
+        self.assertEqual(self.totals()["hired"], result["hires"])
+        self.assertEqual(self.totals()["applied"], 4)
+
+    def test_event_committed_behind_watermark_is_folded_later(self):
+        change_status(self.apps[0], "interview")
+        late = ApplicationStatusEvent.objects.latest("id")
+        change_status(self.apps[1], "interview")
+        # `late` was inserted but not committed when the rollup ran
+        ApplicationStatusEvent.objects.filter(pk=late.pk).delete()
+
+        build_rollups(now=self.later)
+        self.assertEqual(self.totals()["interview"], 1)
+        state = RollupWatermark.objects.get(name=WATERMARK)
+        self.assertEqual([gap[0] for gap in state.gaps], [late.pk])
+
+        # Commits now, same id
+        ApplicationStatusEvent.objects.create(
+            id=late.pk, application_id=late.application_id, job_id=late.job_id,
+            from_status=late.from_status, to_status=late.to_status, created_at=late.created_at,
+        )
+        self.assertEqual(build_rollups(now=self.later), 1)
+        self.assertEqual(self.totals()["interview"], 2)
+        self.assertEqual(RollupWatermark.objects.get(name=WATERMARK).gaps, [])
+
+    def test_gap_that_never_commits_expires(self):
+        change_status(self.apps[0], "interview")
+        ApplicationStatusEvent.objects.latest("id").delete()  # rolled back
+        change_status(self.apps[1], "interview")
+        build_rollups(now=self.later)
+        self.assertEqual(len(RollupWatermark.objects.get(name=WATERMARK).gaps), 1)
+
+        build_rollups(now=self.later + timedelta(seconds=settings.ANALYTICS_ROLLUP_GAP_TTL + 1))
+        self.assertEqual(RollupWatermark.objects.get(name=WATERMARK).gaps, [])
+
+
+class SeriesTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.recruiter = User.objects.create_user(
+            email="rec@example.com", password="pw-12345!", role="RECRUITER", is_active=True
+        )
+        self.other = User.objects.create_user(
+            email="other@example.com", password="pw-12345!", role="RECRUITER", is_active=True
+        )
+        self.jobs = [
+            Job.objects.create(
+                title=f"Job {i}", description="x", location="Pune", work_mode="onsite", created_by=owner,
+            )
+            for i, owner in enumerate([self.recruiter, self.recruiter, self.recruiter, self.other])
+        ]
+        self.today = timezone.localdate()
+
+    def dataset(self, payload, label):
+        return next(row["data"] for row in payload["datasets"] if row["label"] == label)
+
+    def test_jobs_per_recruiter_with_other_bucket(self):
+        payload = chart_series("jobs", self.today - timedelta(days=6), self.today, limit=1)
+        self.assertEqual(payload["bucket"], "day")
+        self.assertEqual(len(payload["points"]), 7)
+        self.assertEqual(self.dataset(payload, "rec@example.com"), [0] * 6 + [3])
+        self.assertEqual(self.dataset(payload, "Other"), [0] * 6 + [1])
+
+        with self.assertRaises(ValueError):
+            chart_series("jobs", self.today, self.today - timedelta(days=1))
+        with self.assertRaises(KeyError):
+            chart_series("salaries", self.today, self.today)
+
+    def test_application_stages_include_unsettled_tail(self):
+        app = Application.objects.create(
+            job=self.jobs[0], full_name="Asha Rao", email="c@example.com", phone="9876543210",
+        )
+        payload = chart_series("applications", self.today, self.today)
+        self.assertEqual([row["label"] for row in payload["datasets"]], STAGES)
+        self.assertEqual(self.dataset(payload, "applied"), [1])
+
+        # The status change bumps the version: no stale cached response
+        change_status(app, "interview")
+        payload = chart_series("applications", self.today, self.today)
+        self.assertEqual(self.dataset(payload, "interview"), [1])
+        # Younger than ANALYTICS_ROLLUP_LAG: counted live, not folded into the store
+        self.assertEqual(cache.get(STORE_KEY.format("applications"))["through"], 0)
+
+    def test_downsample_to_monday_weeks(self):
+        start = date(2026, 1, 7)  # Wednesday
+        points, counts = downsample(np.ones((1, 14), dtype=np.int64), start, "week")
+        self.assertEqual(points, [date(2026, 1, 5), date(2026, 1, 12), date(2026, 1, 19)])
+        self.assertEqual(counts.tolist(), [[5, 7, 2]])
+        self.assertEqual(pick_bucket(400), "week")
@@ -1,6 +1,6 @@
 from rest_framework import serializers
 from users.models import User
-from jobs.models import Job
+from jobs.models import Job, Location
 from applications.models import Application
 
 
@@ -14,12 +14,24 @@ class UserSerializer(serializers.ModelSerializer):
         fields = ["id", "email", "first_name", "last_name", "role"]
 
 
+# ==========================================
+# LOCATION SERIALIZER
+# ==========================================
+
+class LocationSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Location
+        fields = ["id", "city", "state", "country", "latitude", "longitude"]
+
+
 # ==========================================
 # JOB SERIALIZER
 # ==========================================
 
 class JobSerializer(serializers.ModelSerializer):
     created_by = UserSerializer(read_only=True)
+    canonical_location = LocationSerializer(read_only=True)
+    is_open = serializers.BooleanField(read_only=True)
 
     class Meta:
         model = Job
@@ -29,13 +41,18 @@ class JobSerializer(serializers.ModelSerializer):
             "slug",
             "description",
             "location",
+            "canonical_location",
             "work_mode",
             "employment_type",
             "min_experience",
             "max_experience",
             "min_salary",
             "max_salary",
+            "annual_min_salary",
+            "annual_max_salary",
             "vacancies",
+            "deadline",
+            "is_open",
             "created_by",
             "created_at",
         ]
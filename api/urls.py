@@ -1,10 +1,12 @@
 from django.urls import path
 from .views import (
     LoginAPI, LogoutAPI, MeAPI,
-    PublicJobListAPI, PublicJobDetailAPI,
+    PublicJobListAPI, PublicJobDetailAPI, PublicJobFacetsAPI, PublicJobSuggestAPI,
     RecruiterJobCreateAPI, RecruiterJobUpdateAPI, RecruiterJobDeleteAPI,
     ApplyJobAPI,
-    RecruiterApplicationListAPI, RecruiterApplicationDetailAPI, RecruiterUpdateStatusAPI
+    RecruiterApplicationListAPI, RecruiterApplicationDetailAPI, RecruiterUpdateStatusAPI,
+    RecruiterBulkStatusAPI,
+    AnalyticsFunnelAPI, AnalyticsTimeToHireAPI, AnalyticsLeaderboardAPI, AnalyticsSeriesAPI,
 )
 
 urlpatterns = [
@@ -13,6 +15,8 @@ urlpatterns = [
     path("auth/me/", MeAPI.as_view()),
 
     path("jobs/", PublicJobListAPI.as_view()),
+    path("jobs/facets/", PublicJobFacetsAPI.as_view()),
+    path("jobs/suggest/", PublicJobSuggestAPI.as_view()),
     path("jobs/<slug:slug>/", PublicJobDetailAPI.as_view()),
 
     path("jobs/create/", RecruiterJobCreateAPI.as_view()),
@@ -22,6 +26,12 @@ urlpatterns = [
     path("apply/<slug:slug>/", ApplyJobAPI.as_view()),
 
     path("applications/", RecruiterApplicationListAPI.as_view()),
+    path("applications/bulk-status/", RecruiterBulkStatusAPI.as_view()),
     path("applications/<int:id>/", RecruiterApplicationDetailAPI.as_view()),
     path("applications/<int:id>/status/", RecruiterUpdateStatusAPI.as_view()),
+
+    path("analytics/funnel/", AnalyticsFunnelAPI.as_view()),
+    path("analytics/time-to-hire/", AnalyticsTimeToHireAPI.as_view()),
+    path("analytics/top/", AnalyticsLeaderboardAPI.as_view()),
+    path("analytics/series/<str:name>/", AnalyticsSeriesAPI.as_view()),
 ]
\ No newline at end of file
@@ -1,5 +1,9 @@
 from django.shortcuts import get_object_or_404
 from django.contrib.auth import authenticate
+from django.utils import timezone
+from datetime import date, timedelta
+import logging
+from django.db import IntegrityError, transaction
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.generics import (
@@ -14,7 +18,17 @@ from rest_framework.authtoken.models import Token
 
 from users.models import User
 from jobs.models import Job
+from jobs.facets import compute_facets
+from jobs.suggest import suggest
+from jobs.filters import apply_facet_filters, apply_search_filters, apply_sorting, public_jobs
 from applications.models import Application
+from applications.matching import sort_by_match
+from applications.duplicates import flag_if_repeat
+from applications.idempotency import KeyInUse, claim, clean_key, complete, release
+from applications.status import VALID_STATUSES, bulk_change_status, change_status
+from analytics.models import SCOPES
+from analytics.rollups import funnel_totals, time_to_hire, top_scopes
+from analytics.series import SOURCES, chart_series
 
 from .serializers import (
     UserSerializer,
@@ -23,7 +37,9 @@ from .serializers import (
     PublicApplicationSerializer,
 )
 
-from .permissions import IsRecruiter
+from .permissions import IsAdmin, IsRecruiter
+
+logger = logging.getLogger(__name__)
 
 
 # ============================
@@ -66,13 +82,53 @@ class MeAPI(APIView):
 # ============================
 
 class PublicJobListAPI(ListAPIView):
-    queryset = Job.objects.filter(is_deleted=False)
+    """
+    GET /api/jobs/?search=&location=&radius_km=&work_mode=&job_type=&min_salary=&max_salary=&sort=
+    """
     serializer_class = JobSerializer
     permission_classes = [AllowAny]
 
+    def get_queryset(self):
+        params = self.request.query_params
+        qs = public_jobs().select_related("created_by", "canonical_location")
+        qs = apply_search_filters(qs, params)
+        qs = apply_facet_filters(qs, params)
+        return apply_sorting(qs, params.get("sort"))
+
+
+class PublicJobFacetsAPI(APIView):
+    """
+    GET /api/jobs/facets/?search=&location=&work_mode=&job_type=&min_salary=&max_salary=
+    Counts per work mode, job type, top locations and salary bucket.
+    """
+    permission_classes = [AllowAny]
+
+    def get(self, request):
+        return Response(compute_facets(request.query_params))
+
+
+class PublicJobSuggestAPI(APIView):
+    """
+    GET /api/jobs/suggest/?q=back&limit=8
+    Search-as-you-type: top job titles and locations for a prefix,
+    served from the in-memory trie (no DB query).
+    """
+    permission_classes = [AllowAny]
+
+    def get(self, request):
+        prefix = request.query_params.get("q", "")
+        try:
+            limit = min(max(int(request.query_params.get("limit", 8)), 1), 10)
+        except ValueError:
+            limit = 8
+
+        if not prefix.strip():
+            return Response([])
+        return Response(suggest(prefix, limit))
+
 
 class PublicJobDetailAPI(RetrieveAPIView):
-    queryset = Job.objects.filter(is_deleted=False)
+    queryset = Job.objects.filter(is_deleted=False)  # archived jobs stay viewable (is_open=false)
     serializer_class = JobSerializer
     permission_classes = [AllowAny]
     lookup_field = "slug"
@@ -113,27 +169,72 @@ class RecruiterJobDeleteAPI(DestroyAPIView):
 # ============================
 
 class ApplyJobAPI(APIView):
+    """
+    POST /api/apply/<slug>/ with an optional Idempotency-Key header: a
+    retry with the same key gets the first response back (marked
+    Idempotent-Replayed) instead of "already applied".
+    """
     permission_classes = [AllowAny]
 
     def post(self, request, slug):
         job = get_object_or_404(Job, slug=slug)
 
+        if not job.is_open:
+            return Response(
+                {"error": "This job is no longer accepting applications."},
+                status=400
+            )
+
+        key = clean_key(request.headers.get("Idempotency-Key"))
+        if key is None:
+            return self.submit(request, job, None)
+
+        scope = f"api-apply:{job.pk}"
+        try:
+            replay = claim(scope, key)
+        except KeyInUse:
+            return Response(
+                {"error": "A request with this Idempotency-Key is still in progress."},
+                status=409
+            )
+        if replay is not None:
+            return Response(replay["body"], status=replay["status"], headers={"Idempotent-Replayed": "true"})
+
+        try:
+            return self.submit(request, job, (scope, key))
+        finally:
+            release(scope, key)
+
+    def submit(self, request, job, idempotency):
         serializer = PublicApplicationSerializer(data=request.data)
 
         if not serializer.is_valid():
             return Response(serializer.errors, status=400)
 
-        email = serializer.validated_data["email"]
-
-        if Application.objects.filter(job=job, email=email).exists():
+        # Unique (job, email) constraint is the duplicate check
+        try:
+            with transaction.atomic():
+                application = serializer.save(job=job)
+                body = {
+                    "message": "Application submitted successfully",
+                    "application_id": application.application_id,
+                    "tracking_token": application.tracking_token,
+                }
+                if idempotency:
+                    complete(*idempotency, {"status": 200, "body": body})
+        except IntegrityError:
             return Response(
                 {"error": "You already applied for this job."},
                 status=400
             )
 
-        serializer.save(job=job)
+        # Best effort, as on the HTML form: the application is already saved
+        try:
+            flag_if_repeat(application)
+        except Exception:
+            logger.exception("Repeat applicant check failed")
 
-        return Response({"message": "Application submitted successfully"})
+        return Response(body)
 
 
 # ============================
@@ -145,11 +246,16 @@ class RecruiterApplicationListAPI(ListAPIView):
     permission_classes = [IsRecruiter]
 
     def get_queryset(self):
-        return Application.objects.filter(
+        qs = Application.objects.filter(
             job__created_by=self.request.user,
             job__is_deleted=False
         ).order_by("-applied_at")
 
+        if self.request.query_params.get("sort") == "match":
+            qs = sort_by_match(qs)
+
+        return qs
+
 
 class RecruiterApplicationDetailAPI(RetrieveAPIView):
     serializer_class = ApplicationSerializer
@@ -173,12 +279,143 @@ class RecruiterUpdateStatusAPI(APIView):
         )
 
         status_value = request.data.get("status")
-        valid = ["screening", "review", "interview", "hired", "rejected"]
 
-        if status_value not in valid:
+        if status_value not in VALID_STATUSES:
             return Response({"error": "Invalid status"}, status=400)
 
-        app.status = status_value
-        app.save()
+        change_status(
+            app, status_value, changed_by=request.user, site_url=request.build_absolute_uri("/")
+        )
+
+        return Response({"message": "Status updated"})
 
-        return Response({"message": "Status updated"})
\ No newline at end of file
+
+class RecruiterBulkStatusAPI(APIView):
+    """
+    POST /api/applications/bulk-status/  {"ids": [1, 2, 3], "status": "rejected"}
+    One UPDATE + one bulk event insert, recruiter's own applications only.
+    """
+    permission_classes = [IsRecruiter]
+
+    def post(self, request):
+        status_value = request.data.get("status")
+        ids = request.data.get("ids") or []
+
+        if status_value not in VALID_STATUSES:
+            return Response({"error": "Invalid status"}, status=400)
+        if not isinstance(ids, list) or not all(isinstance(i, int) for i in ids):
+            return Response({"error": "ids must be a list of application ids"}, status=400)
+
+        updated = bulk_change_status(
+            Application.objects.filter(id__in=ids, job__created_by=request.user),
+            status_value,
+            changed_by=request.user,
+            site_url=request.build_absolute_uri("/"),
+        )
+        return Response({"updated": updated})
+
+# ============================
+# ADMIN ANALYTICS (ROLLUPS ONLY)
+# ============================
+
+def analytics_window(params):
+    """
+    (scope, scope_id, start, end) from ?scope=&id=&start=&end=
+    Defaults: global scope, last 30 days. Raises ValueError on bad input.
+    """
+    scope = params.get("scope", "global")
+    if scope not in dict(SCOPES):
+        raise ValueError("scope must be global, recruiter or job")
+    scope_id = 0 if scope == "global" else int(params.get("id", ""))
+
+    end = date.fromisoformat(params["end"]) if params.get("end") else timezone.localdate()
+    start = date.fromisoformat(params["start"]) if params.get("start") else end - timedelta(days=29)
+    if start > end:
+        raise ValueError("start must be before end")
+    return scope, scope_id, start, end
+
+
+class AnalyticsFunnelAPI(APIView):
+    """
+    GET /api/analytics/funnel/?scope=global|recruiter|job&id=&start=YYYY-MM-DD&end=YYYY-MM-DD
+    Stage entries and conversion from "applied" over the range.
+    """
+    permission_classes = [IsAdmin]
+
+    def get(self, request):
+        try:
+            scope, scope_id, start, end = analytics_window(request.query_params)
+        except (KeyError, ValueError) as e:
+            return Response({"error": str(e)}, status=400)
+
+        return Response({
+            "scope": scope,
+            "id": scope_id,
+            "start": start,
+            "end": end,
+            "stages": funnel_totals(scope, scope_id, start, end),
+        })
+
+
+class AnalyticsTimeToHireAPI(APIView):
+    """
+    GET /api/analytics/time-to-hire/?scope=&id=&start=&end=
+    Hires and p50 / p75 / p90 applied -> hired time in hours.
+    """
+    permission_classes = [IsAdmin]
+
+    def get(self, request):
+        try:
+            scope, scope_id, start, end = analytics_window(request.query_params)
+        except (KeyError, ValueError) as e:
+            return Response({"error": str(e)}, status=400)
+
+        return Response({
+            "scope": scope,
+            "id": scope_id,
+            "start": start,
+            "end": end,
+            **time_to_hire(scope, scope_id, start, end),
+        })
+
+
+class AnalyticsLeaderboardAPI(APIView):
+    """
+    GET /api/analytics/top/?scope=job|recruiter&stage=applied&start=&end=&limit=10
+    """
+    permission_classes = [IsAdmin]
+
+    def get(self, request):
+        params = request.query_params
+        try:
+            _, _, start, end = analytics_window({**params.dict(), "scope": "global"})
+            limit = min(int(params.get("limit", 10)), 100)
+        except (KeyError, ValueError) as e:
+            return Response({"error": str(e)}, status=400)
+
+        scope = params.get("scope", "job")
+        if scope not in ("job", "recruiter"):
+            return Response({"error": "scope must be job or recruiter"}, status=400)
+
+        rows = top_scopes(scope, params.get("stage", "applied"), start, end, limit)
+        return Response([{"id": scope_id, "count": count} for scope_id, count in rows])
+
+
+class AnalyticsSeriesAPI(APIView):
+    """
+    GET /api/analytics/series/applications|jobs/?start=&end=&bucket=auto|day|week|month&limit=5
+    Chart-ready time series; long ranges are downsampled to week / month.
+    """
+    permission_classes = [IsAdmin]
+
+    def get(self, request, name):
+        if name not in SOURCES:
+            return Response({"error": "Unknown series"}, status=404)
+
+        params = request.query_params
+        try:
+            _, _, start, end = analytics_window({**params.dict(), "scope": "global"})
+            limit = min(int(params.get("limit", 5)), 20)
+            return Response(chart_series(name, start, end, params.get("bucket", "auto"), limit))
+        except (KeyError, ValueError) as e:
+            return Response({"error": str(e)}, status=400)
@@ -5,3 +5,6 @@ class ApplicationsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'applications'
 
+
+    def ready(self):
+        import applications.signals  # noqa: F401  (registers receivers)
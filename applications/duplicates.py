@@ -0,0 +1,172 @@
+# applications/duplicates.py
+#
+# Cross-job "repeat applicant" detection.
+# Each web worker keeps a Bloom filter of every email / phone that has
+# applied so far. Most applicants are new, and for them the filter answers
+# "definitely not seen" in memory with no DB query. Only a "maybe" costs
+# one indexed UPDATE, which both confirms and flags the earlier applications.
+
+import hashlib
+import logging
+import math
+import threading
+import time
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.db.models import Count, Q
+
+from applications.models import Application
+
+logger = logging.getLogger(__name__)
+
+
+class BloomFilter:
+    """
+    Fixed size bit array + k hash functions (double hashing over blake2b).
+    False positives possible, false negatives never.
+    """
+
+    def __init__(self, capacity, error_rate=0.01):
+        capacity = max(capacity, 1)
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, key):
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, key):
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+
+# Keys match the exact (indexed) equality lookups used to confirm a hit.
+# ApplicationForm already strips emails and normalizes phones to digits.
+def email_key(email):
+    return f"e:{email}"
+
+
+def phone_key(phone):
+    return f"p:{phone}"
+
+
+# =====================================================
+# Per-worker filter, rebuilt from the DB periodically
+# =====================================================
+_filter = None
+_built_at = 0.0
+_rebuild_keys = None  # keys added while a rebuild runs (None: no rebuild)
+_lock = threading.Lock()
+
+
+def _build_filter():
+    count = Application.objects.count()
+    bloom = BloomFilter(
+        max(count * 2, settings.REPEAT_APPLICANT_FILTER_CAPACITY),
+    )
+    rows = Application.objects.values_list("email", "phone").iterator(chunk_size=5000)
+    for email, phone in rows:
+        bloom.add(email_key(email))
+        bloom.add(phone_key(phone))
+    return bloom
+
+
+def _rebuild_in_thread():
+    global _filter, _built_at, _rebuild_keys
+    try:
+        bloom = _build_filter()
+    except Exception:
+        logger.exception("Repeat applicant filter rebuild failed")
+        bloom = None
+    finally:
+        close_old_connections()
+
+    with _lock:
+        if bloom is not None:
+            # Applicants seen since the rebuild read its rows
+            for key in _rebuild_keys:
+                bloom.add(key)
+            _filter = bloom
+        _built_at = time.monotonic()  # failed: retry after another interval
+        _rebuild_keys = None
+
+
+def get_filter():
+    """
+    The worker's filter. The first call builds it; once stale, a
+    background thread builds the next one while requests keep using
+    the current filter, and swaps it in when done.
+    """
+    global _filter, _built_at, _rebuild_keys
+    with _lock:
+        if _filter is None:
+            _filter = _build_filter()
+            _built_at = time.monotonic()
+        elif _rebuild_keys is None and time.monotonic() - _built_at > settings.REPEAT_APPLICANT_FILTER_REFRESH:
+            _rebuild_keys = []
+            threading.Thread(target=_rebuild_in_thread, name="repeat-applicant-filter", daemon=True).start()
+        return _filter
+
+
+def flag_if_repeat(application):
+    """
+    Call right after a new application is inserted.
+    Sets is_repeat_applicant on it (and on the candidate's earlier
+    applications to other jobs). Returns True for repeat applicants.
+    """
+    if not settings.REPEAT_APPLICANT_DETECTION:
+        return False
+
+    bloom = get_filter()
+    keys = (email_key(application.email), phone_key(application.phone))
+
+    maybe_seen = any(key in bloom for key in keys)
+
+    with _lock:
+        for key in keys:
+            _filter.add(key)  # may have been swapped since get_filter()
+        if _rebuild_keys is not None:
+            _rebuild_keys.extend(keys)
+
+    if not maybe_seen:
+        return False
+
+    earlier = Application.objects.filter(
+        Q(email=application.email) | Q(phone=application.phone)
+    ).exclude(job_id=application.job_id)
+
+    if not earlier.update(is_repeat_applicant=True):
+        return False  # Bloom false positive
+
+    Application.objects.filter(pk=application.pk).update(is_repeat_applicant=True)
+    application.is_repeat_applicant = True
+    return True
+
+
+def backfill_repeat_flags():
+    """
+    Exact recompute for all rows (GROUP BY). Used by the
+    flag_repeat_applicants command after imports or for old data.
+    """
+    repeated_emails = (
+        Application.objects.values("email")
+        .annotate(jobs=Count("job", distinct=True))
+        .filter(jobs__gt=1)
+        .values("email")
+    )
+    repeated_phones = (
+        Application.objects.values("phone")
+        .annotate(jobs=Count("job", distinct=True))
+        .filter(jobs__gt=1)
+        .values("phone")
+    )
+    return Application.objects.filter(
+        Q(email__in=repeated_emails) | Q(phone__in=repeated_phones)
+    ).update(is_repeat_applicant=True)
@@ -2,6 +2,8 @@ from django import forms
 from applications.models import Application
 from django.core.validators import FileExtensionValidator, validate_email
 from django.core.exceptions import ValidationError
+from django.core.files.uploadedfile import SimpleUploadedFile
+from applications.resume_check import check_resume
 import re
 
 
@@ -80,4 +82,9 @@ class ApplicationForm(forms.ModelForm):
         if resume.size > 5 * 1024 * 1024:
             raise ValidationError("Resume size cannot exceed 5MB.")
 
-        return resume
+        # Magic bytes, page count, structure; active content stripped.
+        # What gets stored is the rewritten copy, not the upload.
+        resume.seek(0)
+        checked = check_resume(resume.read())
+
+        return SimpleUploadedFile(resume.name, checked.data, content_type="application/pdf")
@@ -0,0 +1,138 @@
+# applications/idempotency.py
+#
+# Repeated submissions (double-clicks, client retries) carry the same
+# key: the Idempotency-Key header on the API, a hidden token rendered
+# into the apply form. The first request with a key claims it and does
+# the work; repeats get its response back instead of running again
+# (no second resume upload, no "already applied" error).
+#
+# Claim: cache.add() on the key, then an insert of the IdempotencyKey
+# row, whose unique (scope, key) constraint is the guard across
+# processes when the cache isn't shared. The owner stores its response
+# on the row in the same transaction as the application (complete()),
+# and in the cache after commit. A repeat arriving meanwhile polls for
+# that response for up to IDEMPOTENCY_WAIT seconds.
+#
+# Only successful responses are stored; on failure the owner release()s
+# the key so a retry with it runs again. A claim with no response after
+# IDEMPOTENCY_LOCK_TIMEOUT (owner died) can be taken over. Keys are kept
+# IDEMPOTENCY_KEY_TTL seconds.
+
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from applications.models import IdempotencyKey
+from core.scheduler import run_periodically
+
+IN_PROGRESS = "in-progress"
+POLL_INTERVAL = 0.05
+MAX_KEY_LENGTH = 128
+
+
+class KeyInUse(Exception):
+    """The first request with this key is still running."""
+
+
+def clean_key(value):
+    """The client's key, or None when missing or unusable."""
+    value = (value or "").strip()
+    if not value or len(value) > MAX_KEY_LENGTH:
+        return None
+    return value
+
+
+def _cache_key(scope, key):
+    return f"idempotency:{scope}:{key}"
+
+
+def _claim_row(scope, key):
+    """Insert the row: None when ours, else the stored response or IN_PROGRESS."""
+    now = timezone.now()
+    try:
+        with transaction.atomic():
+            IdempotencyKey.objects.create(scope=scope, key=key, created_at=now)
+        return None
+    except IntegrityError:
+        pass
+
+    row = IdempotencyKey.objects.filter(scope=scope, key=key).first()
+    if row is None:
+        return IN_PROGRESS  # released meanwhile: try again
+    if row.response is not None and row.created_at > now - timedelta(seconds=settings.IDEMPOTENCY_KEY_TTL):
+        return row.response
+
+    # Expired key, or owner gone without answering: take it over
+    stale = now - timedelta(seconds=settings.IDEMPOTENCY_LOCK_TIMEOUT)
+    expired = now - timedelta(seconds=settings.IDEMPOTENCY_KEY_TTL)
+    taken = IdempotencyKey.objects.filter(
+        Q(response__isnull=True, created_at__lt=stale) | Q(created_at__lt=expired),
+        pk=row.pk,
+        created_at=row.created_at,
+    ).update(response=None, created_at=now)
+    return None if taken else IN_PROGRESS
+
+
+def claim(scope, key):
+    """
+    None when this request owns `key` and must run (then complete() or
+    release() it), else the stored response of the first request.
+    Raises KeyInUse when that request hasn't answered within
+    IDEMPOTENCY_WAIT seconds.
+    """
+    cache_key = _cache_key(scope, key)
+    deadline = time.monotonic() + settings.IDEMPOTENCY_WAIT
+
+    while True:
+        state = cache.get(cache_key)
+        if state is None and cache.add(cache_key, IN_PROGRESS, settings.IDEMPOTENCY_LOCK_TIMEOUT):
+            state = _claim_row(scope, key)
+            if state is None:
+                return None
+            if state == IN_PROGRESS:
+                # Owned by another process: drop our marker so the next
+                # round checks the row again
+                cache.delete(cache_key)
+            else:
+                cache.set(cache_key, state, settings.IDEMPOTENCY_KEY_TTL)
+
+        if state is not None and state != IN_PROGRESS:
+            return state
+        if time.monotonic() >= deadline:
+            raise KeyInUse(key)
+        time.sleep(POLL_INTERVAL)
+
+
+def complete(scope, key, response):
+    """Store the owner's response (JSON-able); call in its transaction."""
+    IdempotencyKey.objects.filter(scope=scope, key=key).update(response=response)
+    transaction.on_commit(
+        lambda: cache.set(_cache_key(scope, key), response, settings.IDEMPOTENCY_KEY_TTL)
+    )
+
+
+def release(scope, key):
+    """
+    Give up the claim unless complete() stored a response: a retry with
+    `key` runs again.
+    """
+    deleted, _ = IdempotencyKey.objects.filter(scope=scope, key=key, response__isnull=True).delete()
+    if deleted:
+        cache.delete(_cache_key(scope, key))
+
+
+def purge_idempotency_keys():
+    """Drop keys older than IDEMPOTENCY_KEY_TTL. Returns rows deleted."""
+    cutoff = timezone.now() - timedelta(seconds=settings.IDEMPOTENCY_KEY_TTL)
+    deleted, _ = IdempotencyKey.objects.filter(created_at__lt=cutoff).delete()
+    return deleted
+
+
+def start_idempotency_purge():
+    """Daemon thread per web worker when IDEMPOTENCY_PURGE_INTERVAL > 0."""
+    return run_periodically("idempotency-purge", settings.IDEMPOTENCY_PURGE_INTERVAL, purge_idempotency_keys)
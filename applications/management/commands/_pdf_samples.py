@@ -0,0 +1,84 @@
+# Synthetic resume PDFs for benchmarks (no external PDF writer needed).
+
+import random
+
+SKILLS = (
+    "python django flask fastapi postgresql mysql redis celery docker kubernetes "
+    "aws gcp azure terraform linux git java spring kotlin golang rust c++ c# "
+    "node.js react angular vue typescript javascript html css sql pandas numpy "
+    "spark kafka airflow tableau excel figma selenium pytest jenkins graphql"
+).split()
+
+FILLER = (
+    "experience project team delivered built designed managed improved led "
+    "developed implemented optimized migrated reduced increased customers "
+    "services platform pipeline reporting analytics backend frontend api"
+).split()
+
+
+def resume_lines(rng, lines=40, words_per_line=12):
+    out = []
+    for _ in range(lines):
+        words = [
+            rng.choice(SKILLS) if rng.random() < 0.3 else rng.choice(FILLER)
+            for _ in range(words_per_line)
+        ]
+        out.append(" ".join(words))
+    return out
+
+
+def make_text_pdf(lines, pages=1):
+    """
+    Minimal valid PDF (Helvetica text, one content stream per page).
+    """
+    def esc(text):
+        return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+    objects = []
+    page_ids = []
+    font_id = 3 + pages * 2
+
+    for p in range(pages):
+        page_id = 3 + p * 2
+        content_id = page_id + 1
+        page_ids.append(page_id)
+
+        body = "BT /F1 10 Tf 50 760 Td 14 TL " + " ".join(
+            f"({esc(line)}) Tj T*" for line in lines
+        ) + " ET"
+        objects.append((
+            page_id,
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Contents {content_id} 0 R /Resources << /Font << /F1 {font_id} 0 R >> >> >>",
+        ))
+        objects.append((
+            content_id,
+            f"<< /Length {len(body)} >>\nstream\n{body}\nendstream",
+        ))
+
+    kids = " ".join(f"{i} 0 R" for i in page_ids)
+    objects = [
+        (1, "<< /Type /Catalog /Pages 2 0 R >>"),
+        (2, f"<< /Type /Pages /Kids [{kids}] /Count {pages} >>"),
+        *objects,
+        (font_id, "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"),
+    ]
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = {}
+    for obj_id, body in objects:
+        offsets[obj_id] = len(out)
+        out += f"{obj_id} 0 obj\n{body}\nendobj\n".encode("latin-1")
+
+    xref = len(out)
+    size = len(objects) + 1
+    out += f"xref\n0 {size}\n0000000000 65535 f \n".encode()
+    for obj_id in range(1, size):
+        out += f"{offsets[obj_id]:010d} 00000 n \n".encode()
+    out += f"trailer\n<< /Size {size} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    return bytes(out)
+
+
+def sample_resume_pdf(seed, pages=1):
+    rng = random.Random(seed)
+    return make_text_pdf(resume_lines(rng), pages=pages)
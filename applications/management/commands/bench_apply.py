@@ -0,0 +1,88 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import IntegrityError, transaction
+
+from applications.duplicates import flag_if_repeat
+from applications.models import Application
+from jobs.models import Job
+from users.models import User
+
+
+class Command(BaseCommand):
+    help = "Apply-path DB throughput: exists() pre-check vs atomic insert + IntegrityError."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--applies", type=int, default=5000)
+        parser.add_argument("--jobs", type=int, default=50)
+        parser.add_argument("--duplicate-rate", type=float, default=0.1)
+
+    def handle(self, *args, **options):
+        for label, fn in (
+            ("pre-check + insert", self._apply_precheck),
+            ("atomic insert", self._apply_atomic),
+            ("atomic insert + repeat flag", self._apply_atomic_flag),
+        ):
+            with transaction.atomic():
+                jobs = self._seed(options["jobs"])
+                payloads = self._payloads(jobs, options["applies"], options["duplicate_rate"])
+
+                start = time.perf_counter()
+                created = sum(fn(job, email, phone) for job, email, phone in payloads)
+                elapsed = time.perf_counter() - start
+
+                transaction.set_rollback(True)
+
+            self.stdout.write(self.style.MIGRATE_HEADING(label))
+            self.stdout.write(
+                f"  {len(payloads) / elapsed:,.0f} applies/s "
+                f"({created} created, {len(payloads) - created} duplicates rejected)"
+            )
+
+    def _seed(self, count):
+        recruiter = User.objects.create_user(email="bench-apply@example.com", password="x")
+        return [
+            Job.objects.create(
+                title=f"Bench {i}", description="x", location="Pune",
+                work_mode="onsite", created_by=recruiter,
+            )
+            for i in range(count)
+        ]
+
+    def _payloads(self, jobs, count, duplicate_rate):
+        rng = random.Random(3)
+        payloads = []
+        for i in range(count):
+            if payloads and rng.random() < duplicate_rate:
+                payloads.append(rng.choice(payloads))
+            else:
+                payloads.append((rng.choice(jobs), f"c{i}@example.com", f"9{i:09d}"))
+        return payloads
+
+    def _new(self, job, email, phone):
+        return Application(job=job, full_name="Bench", email=email, phone=phone)
+
+    def _apply_precheck(self, job, email, phone):
+        if Application.objects.filter(job=job, email=email).exists():
+            return 0
+        self._new(job, email, phone).save()
+        return 1
+
+    def _apply_atomic(self, job, email, phone):
+        try:
+            with transaction.atomic():
+                self._new(job, email, phone).save()
+        except IntegrityError:
+            return 0
+        return 1
+
+    def _apply_atomic_flag(self, job, email, phone):
+        try:
+            with transaction.atomic():
+                application = self._new(job, email, phone)
+                application.save()
+        except IntegrityError:
+            return 0
+        flag_if_repeat(application)
+        return 1
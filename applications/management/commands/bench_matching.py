@@ -0,0 +1,57 @@
+import random
+import time
+from collections import Counter
+
+import numpy as np
+
+from django.core.management.base import BaseCommand
+
+from applications.management.commands._pdf_samples import FILLER, SKILLS
+from applications.matching import BATCH_SIZE, score_pairs
+
+
+class Command(BaseCommand):
+    help = "Benchmark batch TF-IDF scoring (vectorize + score, no DB I/O)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--applications", type=int, default=1_000_000)
+        parser.add_argument("--jobs", type=int, default=2_000)
+        parser.add_argument("--terms", type=int, default=120, help="Terms per resume")
+
+    def handle(self, *args, **options):
+        rng = random.Random(11)
+        vocabulary = SKILLS + FILLER + [f"term{i}" for i in range(5000)]
+        total = options["applications"]
+        n_jobs = options["jobs"]
+
+        job_counts = [Counter(rng.choices(vocabulary, k=200)) for _ in range(n_jobs)]
+        df = {t: rng.randint(1, total) for t in vocabulary}
+
+        vector_seconds = 0.0
+        started = time.perf_counter()
+
+        for start in range(0, total, BATCH_SIZE):
+            size = min(BATCH_SIZE, total - start)
+            resumes = [Counter(rng.choices(vocabulary, k=options["terms"])) for _ in range(size)]
+            job_index = np.asarray([rng.randrange(n_jobs) for _ in range(size)])
+
+            t0 = time.perf_counter()
+            score_pairs(resumes, job_counts, job_index, df, total)
+            vector_seconds += time.perf_counter() - t0
+
+        wall = time.perf_counter() - started
+        self.stdout.write(self.style.MIGRATE_HEADING(
+            f"{total} applications x {n_jobs} jobs, batches of {BATCH_SIZE}"
+        ))
+        self.stdout.write(f"  vectorize + score : {vector_seconds:.2f} s "
+                          f"({total / vector_seconds:,.0f} apps/s)")
+        self.stdout.write(f"  incl. synthetic data generation : {wall:.2f} s")
+        self.stdout.write(f"  one new applicant (incremental) : "
+                          f"{self._single(job_counts, df, total, vocabulary, rng):.3f} ms")
+
+    def _single(self, job_counts, df, total, vocabulary, rng):
+        resume = [Counter(rng.choices(vocabulary, k=120))]
+        start = time.perf_counter()
+        for _ in range(100):
+            score_pairs(resume, job_counts[:1], [0], df, total)
+        return (time.perf_counter() - start) * 10
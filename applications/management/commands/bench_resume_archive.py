@@ -0,0 +1,171 @@
+import io
+import random
+import shutil
+import tempfile
+import threading
+import time
+import zipfile
+from pathlib import Path
+from unittest import mock
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import Client, override_settings
+from django.urls import reverse
+
+from applications import storage
+from applications.management.commands._pdf_samples import sample_resume_pdf
+from applications.models import Application, ResumeArchive, ResumeBlob
+from applications.resume_archive import archive_entries, build_archive, job_resumes
+from applications.resume_store import blob_path
+from jobs.models import Job
+from users.models import User
+
+
+def _rss():
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) * 1024
+    return 0
+
+
+class PeakRSS:
+    """Sample resident memory every 5ms; .peak is the growth over the start."""
+
+    def __enter__(self):
+        self.start = self.peak_rss = _rss()
+        self.stop = threading.Event()
+        self.thread = threading.Thread(target=self._sample, daemon=True)
+        self.thread.start()
+        return self
+
+    def _sample(self):
+        while not self.stop.wait(0.005):
+            self.peak_rss = max(self.peak_rss, _rss())
+
+    def __exit__(self, *exc):
+        self.stop.set()
+        self.thread.join()
+        self.peak = self.peak_rss - self.start
+
+
+class Command(BaseCommand):
+    help = "Download all resumes for a job: in-memory ZIP vs streamed ZIP vs background archive."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--resumes", type=int, default=5000)
+        parser.add_argument("--fetch-ms", type=float, default=15.0, help="simulated storage round trip")
+        parser.add_argument("--workers", type=int, default=8)
+
+    def handle(self, *args, **options):
+        root = tempfile.mkdtemp()
+        storages_setting = {
+            **settings.STORAGES,
+            "resumes": {"BACKEND": "django.core.files.storage.FileSystemStorage", "OPTIONS": {"location": root}},
+        }
+        try:
+            with override_settings(
+                STORAGES=storages_setting,
+                RESUME_STORAGE_BACKEND="applications.storage",
+                RESUME_ARCHIVE_FETCH_WORKERS=options["workers"],
+                RESUME_ARCHIVE_STREAM_LIMIT=options["resumes"],
+                ALLOWED_HOSTS=["testserver"],
+            ), transaction.atomic():
+                self._bench(Path(root), options)
+                transaction.set_rollback(True)
+        finally:
+            shutil.rmtree(root)
+
+    def _dataset(self, root, options):
+        rng = random.Random(44)
+        recruiter = User.objects.create_user(
+            email="bench-archive@example.com", password="x", role="RECRUITER", is_active=True
+        )
+        job = Job.objects.create(
+            title="Bench archive", description="x", location="Pune", work_mode="onsite", created_by=recruiter,
+        )
+        blobs = []
+        text = [sample_resume_pdf(i, pages=2) for i in range(50)]
+        for i in range(options["resumes"]):
+            # ~150 KB median: text PDF plus filler for fonts/photos
+            data = text[i % 50] + rng.randbytes(int(rng.lognormvariate(11.9, 0.4)))
+            sha = f"{i:064x}"
+            path = root / blob_path(sha)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(data)
+            blobs.append(ResumeBlob(sha256=sha, size=len(data), path=blob_path(sha), ref_count=1))
+        blobs = ResumeBlob.objects.bulk_create(blobs)
+        Application.objects.bulk_create(
+            Application(
+                job=job, full_name=f"Candidate {i}", email=f"a{i}@example.com", phone="9000000000",
+                resume_blob=blob,
+            )
+            for i, blob in enumerate(blobs)
+        )
+        return recruiter, job, sum(blob.size for blob in blobs)
+
+    def _bench(self, root, options):
+        recruiter, job, total = self._dataset(root, options)
+        self.stdout.write(
+            f"{options['resumes']} resumes, {total / 1024 / 1024:.0f} MB, "
+            f"{options['fetch_ms']:g}ms per storage fetch"
+        )
+
+        download = storage.download_resume
+
+        def slow_download(path):
+            time.sleep(options["fetch_ms"] / 1000)
+            return download(path)
+
+        client = Client()
+        client.force_login(recruiter)
+        url = reverse("download_job_resumes", args=[job.id])
+        results = []
+
+        with mock.patch("applications.storage.download_resume", slow_download):
+            for label, workers in ((f"streamed, {options['workers']} fetch threads", options["workers"]),
+                                   ("streamed, sequential fetch", 1)):
+                with override_settings(RESUME_ARCHIVE_FETCH_WORKERS=workers), PeakRSS() as rss:
+                    start = time.perf_counter()
+                    response = client.post(url)
+                    sent = 0
+                    first = None
+                    for chunk in response.streaming_content:
+                        first = first or time.perf_counter() - start
+                        sent += len(chunk)
+                    results.append((label, time.perf_counter() - start, first, sent, rss))
+
+            # Background archive in parts of RESUME_ARCHIVE_PART_SIZE
+            archive = ResumeArchive.objects.create(
+                job=job, requested_by=recruiter,
+                last_application_id=job_resumes(job).last().pk, total=options["resumes"],
+            )
+            with PeakRSS() as rss:
+                start = time.perf_counter()
+                build_archive(archive.pk)
+                elapsed = time.perf_counter() - start
+            archive.refresh_from_db()
+            parts = sum((root / part["path"]).stat().st_size for part in archive.parts)
+            results.append((f"background archive, {len(archive.parts)} parts", elapsed, None, parts, rss))
+
+            # Before: whole ZIP assembled in memory, then sent
+            with PeakRSS() as rss:
+                start = time.perf_counter()
+                buffer = io.BytesIO()
+                with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as archive_file:
+                    for name, path, _ in archive_entries(job_resumes(job)):
+                        archive_file.writestr(name, slow_download(path))
+                body = buffer.getvalue()
+                elapsed = time.perf_counter() - start
+                results.append(("in-memory ZIP (before)", elapsed, elapsed, len(body), rss))
+                del body, buffer
+
+        for label, elapsed, first, size, rss in results:
+            self.stdout.write(self.style.MIGRATE_HEADING(label))
+            first_byte = f"   first byte {first * 1000:7.1f}ms" if first is not None else ""
+            self.stdout.write(
+                f"  total {elapsed:6.1f}s{first_byte}   {size / 1024 / 1024:6.0f} MB   "
+                f"peak memory +{rss.peak / 1024 / 1024:.1f} MB"
+            )
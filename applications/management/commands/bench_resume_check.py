@@ -0,0 +1,106 @@
+import io
+import logging
+import os
+import random
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+from pypdf import PdfReader, PdfWriter
+from pypdf.actions import JavaScript
+
+from applications.management.commands._pdf_samples import sample_resume_pdf
+from applications.pdf_sanitize import PdfRejected, sanitize_pdf
+from applications.resume_check import check_resume
+
+
+def _with_active_content(data):
+    """Same resume plus document JavaScript and an embedded file."""
+    writer = PdfWriter(clone_from=PdfReader(io.BytesIO(data)))
+    writer.add_open_action(JavaScript("app.alert('hi');"))
+    writer.add_attachment("notes.txt", b"attached " * 200)
+    out = io.BytesIO()
+    writer.write(out)
+    return out.getvalue()
+
+
+def _check(data, max_pages, compress):
+    try:
+        return len(sanitize_pdf(data, max_pages, compress).data)
+    except PdfRejected:
+        return None
+
+
+class Command(BaseCommand):
+    help = "Resume validation throughput per core and stored size reduction."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--pdfs", type=int, default=300)
+        parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+        parser.add_argument("--corpus", help="directory of real PDFs to use instead of synthetic ones")
+
+    def handle(self, *args, **options):
+        corpus = self._corpus(options["pdfs"], options["corpus"])
+        size_in = sum(len(data) for data in corpus)
+        self.stdout.write(f"corpus: {len(corpus)} PDFs, {size_in / 1024 / 1024:.1f} MB")
+
+        for compress in (False, True):
+            check = partial(_check, max_pages=settings.RESUME_MAX_PAGES, compress=compress)
+            start = time.perf_counter()
+            sizes = [check(data) for data in corpus]
+            single = len(corpus) / (time.perf_counter() - start)
+
+            workers = options["workers"]
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                list(pool.map(check, corpus[:workers]))  # warm workers
+                start = time.perf_counter()
+                list(pool.map(check, corpus, chunksize=4))
+                pooled = len(corpus) / (time.perf_counter() - start)
+
+            accepted = [(len(data), size) for data, size in zip(corpus, sizes) if size is not None]
+            before = sum(original for original, _ in accepted)
+            after = sum(size for _, size in accepted)
+
+            self.stdout.write(self.style.MIGRATE_HEADING(f"compress={compress}"))
+            self.stdout.write(f"  1 core     : {single:.1f} pdf/s")
+            self.stdout.write(
+                f"  {workers} workers  : {pooled:.1f} pdf/s ({pooled / workers:.1f} pdf/s per core)"
+            )
+            self.stdout.write(
+                f"  stored size: {before / 1024:.0f} KB -> {after / 1024:.0f} KB "
+                f"({(1 - after / before) * 100:.1f}% smaller, {len(corpus) - len(accepted)} rejected)"
+            )
+
+        # What a request thread sees: submit to the pool and wait
+        logging.getLogger("applications.resume_check").setLevel(logging.WARNING)
+        with override_settings(RESUME_CHECK_WORKERS=max(options["workers"], 1)):
+            check_resume(corpus[0])  # start the pool
+            samples = []
+            for data in corpus[:100]:
+                start = time.perf_counter()
+                try:
+                    check_resume(data)
+                except Exception:
+                    pass
+                samples.append(time.perf_counter() - start)
+        self.stdout.write(
+            f"check_resume() via pool: median {statistics.median(samples) * 1000:.1f}ms per upload"
+        )
+
+    def _corpus(self, count, directory):
+        if directory:
+            return [path.read_bytes() for path in sorted(Path(directory).glob("*.pdf"))[:count]]
+
+        rng = random.Random(9)
+        corpus = []
+        for i in range(count):
+            data = sample_resume_pdf(i, pages=rng.choice((1, 2, 2, 3)))
+            if i % 10 == 0:
+                data = _with_active_content(data)
+            corpus.append(data)
+        return corpus
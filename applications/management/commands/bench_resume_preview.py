@@ -0,0 +1,130 @@
+import io
+import random
+import re
+import shutil
+import statistics
+import tempfile
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import Client, override_settings
+from django.urls import reverse
+from pypdf import PdfReader, PdfWriter
+
+from applications.management.commands._pdf_samples import sample_resume_pdf
+from applications.models import Application, ResumeBlob
+from applications.resume_preview import schedule_thumbnail, signed_urls
+from applications.resume_store import store_resume
+from jobs.models import Job
+from users.models import User
+
+THUMBNAIL_SRC = re.compile(r'class="resume-thumb">\s*<img src="([^"]+)"')
+
+
+def _realistic_pdf(rng, seed):
+    """2-page text resume plus ~150 KB of embedded data (fonts/photo stand-in)."""
+    writer = PdfWriter(clone_from=PdfReader(io.BytesIO(sample_resume_pdf(seed, pages=2))))
+    writer.add_attachment("photo.jpg", rng.randbytes(int(rng.lognormvariate(11.9, 0.4))))
+    out = io.BytesIO()
+    writer.write(out)
+    return out.getvalue()
+
+
+def _body(response):
+    if response.streaming:
+        return b"".join(response.streaming_content)
+    return response.content
+
+
+class Command(BaseCommand):
+    help = "Recruiter detail page: load with inline thumbnail vs opening the full PDF."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--applications", type=int, default=50)
+        parser.add_argument("--mbps", type=float, default=10.0, help="modelled client bandwidth")
+        parser.add_argument("--rtt-ms", type=float, default=60.0, help="modelled round trip per request")
+
+    def handle(self, *args, **options):
+        root = tempfile.mkdtemp()
+        storages_setting = {
+            **settings.STORAGES,
+            "resumes": {"BACKEND": "django.core.files.storage.FileSystemStorage", "OPTIONS": {"location": root}},
+        }
+        try:
+            with override_settings(
+                STORAGES=storages_setting,
+                RESUME_STORAGE_BACKEND="applications.storage",
+                RESUME_EXTRACT_WORKERS=0,
+                ALLOWED_HOSTS=["testserver"],
+            ), transaction.atomic():
+                self._bench(options)
+                transaction.set_rollback(True)
+        finally:
+            shutil.rmtree(root)
+
+    def _bench(self, options):
+        rng = random.Random(21)
+        recruiter = User.objects.create_user(
+            email="bench-preview@example.com", password="x", role="RECRUITER", is_active=True
+        )
+        job = Job.objects.create(
+            title="Bench preview", description="x", location="Pune", work_mode="onsite", created_by=recruiter,
+        )
+        apps = []
+        for i in range(options["applications"]):
+            data = _realistic_pdf(rng, i)
+            blob = store_resume(SimpleUploadedFile("cv.pdf", data, content_type="application/pdf"))
+            schedule_thumbnail(blob, data)
+            apps.append(Application.objects.create(
+                job=job, full_name="Bench", email=f"p{i}@example.com", phone="9000000000", resume_blob=blob,
+            ))
+
+        client = Client()
+        client.force_login(recruiter)
+        results = {"full PDF": [], "thumbnail": []}
+
+        for app in apps:
+            detail_url = reverse("recruiter_application_detail", args=[app.pk])
+
+            # Before: the page shows nothing of the resume until the PDF is opened
+            start = time.perf_counter()
+            page = client.get(detail_url)
+            redirect = client.get(reverse("preview_resume", args=[app.pk]))
+            pdf = _body(client.get(redirect.url))
+            results["full PDF"].append((time.perf_counter() - start, len(page.content) + len(pdf), 3))
+
+            start = time.perf_counter()
+            page = client.get(detail_url)
+            image = _body(client.get(THUMBNAIL_SRC.search(page.content.decode()).group(1)))
+            results["thumbnail"].append((time.perf_counter() - start, len(page.content) + len(image), 2))
+
+        rtt = options["rtt_ms"] / 1000
+        bandwidth = options["mbps"] * 125_000  # bytes/s
+        for label, rows in results.items():
+            server = statistics.median(row[0] for row in rows) * 1000
+            size = statistics.median(row[1] for row in rows)
+            modelled = statistics.median(row[0] + row[2] * rtt + row[1] / bandwidth for row in rows) * 1000
+            self.stdout.write(self.style.MIGRATE_HEADING(label))
+            self.stdout.write(f"  server time {server:6.1f}ms   transferred {size / 1024:7.1f} KB")
+            self.stdout.write(
+                f"  modelled load at {options['mbps']:g} Mbit/s, {options['rtt_ms']:g}ms RTT: {modelled:7.1f}ms"
+            )
+
+        # Signed URLs for a 10-row list page: cold vs cached
+        paths = list(
+            ResumeBlob.objects.filter(applications__in=apps[:10]).values_list("thumbnail_path", flat=True)
+        )
+        cache.clear()
+        start = time.perf_counter()
+        signed_urls(paths)
+        cold = (time.perf_counter() - start) * 1_000_000
+        start = time.perf_counter()
+        signed_urls(paths)
+        warm = (time.perf_counter() - start) * 1_000_000
+        self.stdout.write(
+            f"signed URLs for 10 rows: {cold:.0f}us signing (one backend call), {warm:.0f}us cached"
+        )
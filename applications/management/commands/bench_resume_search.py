@@ -0,0 +1,98 @@
+import os
+import random
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from applications.management.commands._pdf_samples import SKILLS, sample_resume_pdf
+from applications.models import Application, ResumeKeyword
+from applications.pdf_text import extract_pdf_text, tokenize
+from applications.resume_index import search_applications
+from applications.views.recruiter import app_queryset_for
+from jobs.models import Job
+from users.models import User
+
+
+class Command(BaseCommand):
+    help = "Benchmark PDF extraction throughput per core and keyword search latency."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--pdfs", type=int, default=200)
+        parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+        parser.add_argument("--resumes", type=int, default=100_000)
+        parser.add_argument("--queries", type=int, default=50)
+
+    def handle(self, *args, **options):
+        self._bench_extraction(options["pdfs"], options["workers"])
+        self._bench_search(options["resumes"], options["queries"])
+
+    # -------------------------------------------------
+    def _bench_extraction(self, count, workers):
+        pdfs = [sample_resume_pdf(i, pages=2) for i in range(count)]
+
+        start = time.perf_counter()
+        for data in pdfs:
+            extract_pdf_text(data)
+        single = count / (time.perf_counter() - start)
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(extract_pdf_text, pdfs[:workers]))  # warm workers
+            start = time.perf_counter()
+            list(pool.map(extract_pdf_text, pdfs, chunksize=4))
+            pooled = count / (time.perf_counter() - start)
+
+        self.stdout.write(self.style.MIGRATE_HEADING("Extraction (2-page PDFs)"))
+        self.stdout.write(f"  1 core        : {single:.1f} pdf/s")
+        self.stdout.write(
+            f"  {workers} workers     : {pooled:.1f} pdf/s ({pooled / workers:.1f} pdf/s per core)"
+        )
+
+    # -------------------------------------------------
+    def _bench_search(self, resumes, queries):
+        rng = random.Random(7)
+
+        with transaction.atomic():
+            recruiter = User.objects.create_user(
+                email="bench-search@example.com", password="x", role="RECRUITER"
+            )
+            job = Job.objects.create(
+                title="Bench", description="Bench", location="Pune",
+                work_mode="onsite", created_by=recruiter,
+            )
+
+            self.stdout.write(f"Seeding {resumes} resumes...")
+            batch = 5000
+            for start in range(0, resumes, batch):
+                apps = Application.objects.bulk_create(
+                    Application(
+                        job=job,
+                        application_id=f"B-{i}",
+                        full_name=f"Candidate {i}",
+                        email=f"c{i}@example.com",
+                        phone="9999999999",
+                    )
+                    for i in range(start, min(start + batch, resumes))
+                )
+                ResumeKeyword.objects.bulk_create(
+                    ResumeKeyword(application=app, term=term)
+                    for app in apps
+                    for term in tokenize(" ".join(rng.sample(SKILLS, 12)))
+                )
+
+            qs = app_queryset_for(recruiter)
+            timings = []
+            for _ in range(queries):
+                query = " ".join(rng.sample(SKILLS, 2))
+                start = time.perf_counter()
+                list(search_applications(qs, query).order_by("-applied_at")[:10])
+                timings.append((time.perf_counter() - start) * 1000)
+
+            transaction.set_rollback(True)
+
+        timings.sort()
+        self.stdout.write(self.style.MIGRATE_HEADING(f"Search over {resumes} resumes (2-term AND, top 10)"))
+        self.stdout.write(f"  p50 : {statistics.median(timings):.2f} ms")
+        self.stdout.write(f"  p95 : {timings[int(len(timings) * 0.95) - 1]:.2f} ms")
@@ -0,0 +1,116 @@
+import random
+import statistics
+import tempfile
+import time
+import uuid
+from unittest import mock
+
+from django.core.files.storage import FileSystemStorage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Sum
+from django.test import override_settings
+
+from applications.management.commands._pdf_samples import sample_resume_pdf
+from applications.models import Application, ResumeBlob
+from applications.resume_store import store_resume
+from jobs.models import Job
+
+
+def _percentile(samples, q):
+    return sorted(samples)[int(len(samples) * q)] * 1000
+
+
+class Command(BaseCommand):
+    help = "Content-addressed resume storage: bytes stored and apply latency, old vs new."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--candidates", type=int, default=500)
+        parser.add_argument("--jobs", type=int, default=300)
+        parser.add_argument("--mean-applies", type=float, default=5.0, help="applications per candidate")
+        parser.add_argument("--reexport-rate", type=float, default=0.15,
+                            help="share of candidates who upload an edited resume part way through")
+        parser.add_argument("--upload-ms", type=float, default=80.0, help="simulated storage round trip")
+        parser.add_argument("--mbps", type=float, default=20.0, help="simulated upload bandwidth")
+
+    def handle(self, *args, **options):
+        rng = random.Random(17)
+        applies = self._dataset(rng, options)
+        total_bytes = sum(len(data) for _, _, data in applies)
+        self.stdout.write(
+            f"{len(applies)} applications from {options['candidates']} candidates, "
+            f"{total_bytes / 1024 / 1024:.0f} MB of uploads"
+        )
+
+        with tempfile.TemporaryDirectory() as root:
+            storage = FileSystemStorage(location=root)
+
+            def upload(file, path):
+                # Object-store stand-in: local write + latency + bandwidth
+                time.sleep(options["upload_ms"] / 1000 + file.size / (options["mbps"] * 125_000))
+                file.seek(0)
+                return storage.url(storage.save(path, file))
+
+            old = self._run(applies, lambda file: upload(file, f"legacy/{uuid.uuid4()}.pdf"), options)
+            with override_settings(RESUME_STORAGE_BACKEND="applications.storage"), \
+                    mock.patch("applications.storage.upload_resume", upload):
+                new = self._run(applies, None, options)
+
+        for label, (latencies, files, stored) in (("per-upload files", old), ("content-addressed", new)):
+            self.stdout.write(self.style.MIGRATE_HEADING(label))
+            self.stdout.write(f"  stored: {files} files, {stored / 1024 / 1024:.1f} MB")
+            self.stdout.write(
+                f"  apply latency: median {statistics.median(latencies) * 1000:.1f}ms, "
+                f"p95 {_percentile(latencies, 0.95):.1f}ms"
+            )
+        self.stdout.write(f"storage saved: {(1 - new[2] / old[2]) * 100:.1f}%")
+
+    def _dataset(self, rng, options):
+        """(candidate, job index, bytes) in apply order, duplicate heavy."""
+        applies = []
+        for candidate in range(options["candidates"]):
+            # Median résumé ~150 KB: text PDF plus filler standing in for
+            # embedded fonts/images (only the size matters here)
+            pad = rng.randbytes(int(rng.lognormvariate(11.9, 0.6)))
+            versions = [sample_resume_pdf(candidate, pages=rng.choice((1, 2))) + pad]
+            if rng.random() < options["reexport_rate"]:
+                versions.append(versions[0] + b"\n% edited\n")
+
+            count = min(1 + int(rng.expovariate(1 / (options["mean_applies"] - 1))), options["jobs"])
+            jobs = rng.sample(range(options["jobs"]), count)
+            for n, job in enumerate(jobs):
+                data = versions[-1] if n >= count // 2 else versions[0]
+                applies.append((candidate, job, data))
+        rng.shuffle(applies)
+        return applies
+
+    def _run(self, applies, legacy_upload, options):
+        latencies = []
+        with transaction.atomic():
+            jobs = [
+                Job.objects.create(title=f"Bench {i}", description="x", location="Pune", work_mode="onsite")
+                for i in range(options["jobs"])
+            ]
+            for candidate, job, data in applies:
+                file = SimpleUploadedFile("cv.pdf", data, content_type="application/pdf")
+                start = time.perf_counter()
+                application = Application(
+                    job=jobs[job], full_name="Bench", email=f"c{candidate}@example.com", phone="9000000000",
+                )
+                with transaction.atomic():
+                    application.save()
+                    if legacy_upload:
+                        application.resume_url = legacy_upload(file)
+                    else:
+                        application.resume_blob = store_resume(file)
+                    application.save(update_fields=["resume_blob", "resume_url"])
+                latencies.append(time.perf_counter() - start)
+
+            if legacy_upload:
+                files, stored = len(applies), sum(len(data) for _, _, data in applies)
+            else:
+                files = ResumeBlob.objects.count()
+                stored = ResumeBlob.objects.aggregate(total=Sum("size"))["total"]
+            transaction.set_rollback(True)
+        return latencies, files, stored
@@ -0,0 +1,67 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from applications.models import Application, ApplicationStatusEvent
+from applications.status import bulk_change_status, change_status
+from jobs.models import Job
+from users.models import User
+
+CYCLE = ["review", "interview", "screening"]
+
+
+class Command(BaseCommand):
+    help = "Write overhead of the status event log per status change."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--applications", type=int, default=2000)
+        parser.add_argument("--changes", type=int, default=3)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            apps = self._seed(options["applications"])
+            total = len(apps) * options["changes"]
+
+            # Baseline: what the views did before (plain UPDATE, no history)
+            start = time.perf_counter()
+            for status in CYCLE[:options["changes"]]:
+                for app in apps:
+                    app.status = status
+                    app.save(update_fields=["status"])
+            plain = (time.perf_counter() - start) / total * 1_000_000
+
+            start = time.perf_counter()
+            for status in CYCLE[:options["changes"]]:
+                for app in apps:
+                    change_status(app, "rejected" if app.status == status else status)
+            logged = (time.perf_counter() - start) / total * 1_000_000
+
+            qs = Application.objects.filter(id__in=[app.id for app in apps])
+            start = time.perf_counter()
+            changed = bulk_change_status(qs, "hired")
+            bulk = (time.perf_counter() - start) / max(changed, 1) * 1_000_000
+
+            events = ApplicationStatusEvent.objects.filter(application__in=apps).count()
+            transaction.set_rollback(True)
+
+        self.stdout.write(f"save(update_fields=['status'])   {plain:8.1f} us / change")
+        self.stdout.write(
+            f"change_status() + event          {logged:8.1f} us / change "
+            f"(+{logged - plain:.1f} us)"
+        )
+        self.stdout.write(f"bulk_change_status() + events    {bulk:8.1f} us / change ({changed} rows)")
+        self.stdout.write(f"{events} events written")
+
+    def _seed(self, count):
+        recruiter = User.objects.create_user(email="bench-status@example.com", password="x")
+        job = Job.objects.create(
+            title="Bench status", description="x", location="Pune",
+            work_mode="onsite", created_by=recruiter,
+        )
+        return [
+            Application.objects.create(
+                job=job, full_name="Bench", email=f"s{i}@example.com", phone=f"8{i:09d}",
+            )
+            for i in range(count)
+        ]
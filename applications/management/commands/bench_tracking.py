@@ -0,0 +1,93 @@
+import random
+import statistics
+import time
+
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import Client, override_settings
+
+from applications.models import Application
+from applications.tracking import TRACK_CACHE_KEY, tracking_state
+from jobs.models import Job
+
+CHUNK = 20_000
+
+
+def _median_us(func, args):
+    samples = []
+    for arg in args:
+        start = time.perf_counter()
+        func(arg)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1_000_000
+
+
+class Command(BaseCommand):
+    help = "Tracking lookup latency: sequential application_id vs indexed token vs cache."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--applications", type=int, default=5_000_000)
+        parser.add_argument("--lookups", type=int, default=200)  # < LocMemCache MAX_ENTRIES
+
+    def handle(self, *args, **options):
+        rng = random.Random(5)
+        total = options["applications"]
+
+        with transaction.atomic():
+            start = time.perf_counter()
+            job = Job.objects.create(
+                title="Bench tracking", description="x", location="Pune", work_mode="onsite",
+            )
+            for low in range(0, total, CHUNK):
+                Application.objects.bulk_create(
+                    [
+                        Application(
+                            job=job, application_id=f"HF-{i:07d}", full_name="Bench",
+                            email=f"t{i}@example.com", phone="9000000000",
+                        )
+                        for i in range(low, min(low + CHUNK, total))
+                    ],
+                    batch_size=5000,
+                )
+            self.stdout.write(f"seeded {total} applications in {time.perf_counter() - start:.1f}s")
+
+            sample = list(
+                Application.objects.filter(job=job)
+                .order_by("?")
+                .values_list("application_id", "tracking_token")[:options["lookups"]]
+            )
+            ids = [app_id for app_id, _ in sample]
+            tokens = [token for _, token in sample]
+
+            # Before: unindexed application_id (a table scan per poll)
+            legacy = _median_us(
+                lambda app_id: Application.objects.filter(application_id=app_id).first(),
+                ids[:max(len(ids) // 25, 5)],
+            )
+            indexed = _median_us(lambda token: Application.objects.get(tracking_token=token), tokens)
+
+            cache.delete_many([TRACK_CACHE_KEY.format(token) for token in tokens])
+            cold = _median_us(tracking_state, tokens)
+            warm = _median_us(tracking_state, tokens)
+
+            with override_settings(ALLOWED_HOSTS=["testserver"]):
+                client = Client()
+                etags = {
+                    token: client.get(f"/applications/track/{token}/status/")["ETag"]
+                    for token in tokens[:100]
+                }
+                not_modified = _median_us(
+                    lambda token: client.get(
+                        f"/applications/track/{token}/status/", HTTP_IF_NONE_MATCH=etags[token]
+                    ),
+                    rng.sample(tokens[:100], 100),
+                )
+
+            transaction.set_rollback(True)
+
+        self.stdout.write(f"application_id lookup (no index)   {legacy:10.1f} us")
+        self.stdout.write(f"tracking_token lookup (unique idx) {indexed:10.1f} us")
+        self.stdout.write(f"tracking_state() cache miss        {cold:10.1f} us  (application + timeline)")
+        self.stdout.write(f"tracking_state() cache hit         {warm:10.1f} us")
+        self.stdout.write(f"GET .../status/ -> 304             {not_modified:10.1f} us  (full request cycle)")
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from applications.resume_archive import resume_archives
+
+
+class Command(BaseCommand):
+    help = "Finish interrupted bulk resume archives and delete expired ones."
+
+    def handle(self, *args, **options):
+        resumed, deleted = resume_archives()
+        self.stdout.write(
+            self.style.SUCCESS(f"Finished {resumed} archives, deleted {deleted} expired ones.")
+        )
@@ -0,0 +1,50 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from applications.models import ResumeBlob
+from applications.pdf_render import render_thumbnail
+from applications.resume_index import get_executor
+from applications.resume_preview import save_thumbnail
+from applications.resume_store import storage_backend
+
+
+class Command(BaseCommand):
+    help = "Backfill first-page thumbnails for stored resumes that have none."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--limit", type=int, default=None)
+        parser.add_argument("--batch-size", type=int, default=50)
+
+    def handle(self, *args, **options):
+        qs = ResumeBlob.objects.filter(thumbnail_path="").order_by("id").values_list("id", "sha256", "path")
+        if options["limit"]:
+            qs = qs[: options["limit"]]
+
+        pending = list(qs)
+        backend = storage_backend()
+        executor = get_executor()
+        width = settings.RESUME_THUMBNAIL_WIDTH
+        batch_size = options["batch_size"]
+        built = failed = 0
+
+        for start in range(0, len(pending), batch_size):
+            batch = []
+            for blob_id, sha256, path in pending[start:start + batch_size]:
+                try:
+                    batch.append((blob_id, sha256, backend.download_resume(path)))
+                except Exception as e:
+                    failed += 1
+                    self.stderr.write(f"Download failed for {path}: {e}")
+
+            # Rendering fans out over the process pool
+            images = executor.map(render_thumbnail, [data for *_, data in batch], [width] * len(batch))
+
+            for (blob_id, sha256, _), png in zip(batch, images):
+                if save_thumbnail(blob_id, sha256, png):
+                    built += 1
+                else:
+                    failed += 1
+
+            self.stdout.write(f"Thumbnails {built}/{len(pending)}")
+
+        self.stdout.write(self.style.SUCCESS(f"Done: {built} built, {failed} failed."))
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from applications.resume_store import collect_resume_blobs, recount_blobs
+
+
+class Command(BaseCommand):
+    help = "Delete stored resume files no application references any more."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--grace", type=int,
+            help="Seconds a blob must have been unreferenced (default RESUME_BLOB_GC_GRACE).",
+        )
+        parser.add_argument(
+            "--recount", action="store_true",
+            help="Rebuild reference counts from applications first.",
+        )
+
+    def handle(self, *args, **options):
+        if options["recount"]:
+            fixed = recount_blobs()
+            self.stdout.write(f"Corrected {fixed} reference counts.")
+
+        deleted = collect_resume_blobs(grace=options["grace"])
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} unreferenced resume files."))
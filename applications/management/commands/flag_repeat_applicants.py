@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from applications.duplicates import backfill_repeat_flags
+
+
+class Command(BaseCommand):
+    help = "Recompute is_repeat_applicant exactly (same email/phone on several jobs)."
+
+    def handle(self, *args, **options):
+        count = backfill_repeat_flags()
+        self.stdout.write(self.style.SUCCESS(f"Flagged {count} applications."))
@@ -0,0 +1,64 @@
+import requests
+
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from applications.models import Application
+from applications.pdf_text import extract_pdf_text
+from applications.resume_index import get_executor, index_resume
+from applications.resume_store import storage_backend
+
+
+def _download(url, path):
+    if path:  # private storage (ResumeBlob)
+        return storage_backend().download_resume(path)
+    response = requests.get(url, timeout=30)
+    response.raise_for_status()
+    return response.content
+
+
+class Command(BaseCommand):
+    help = "Backfill resume text + keyword index for applications not indexed yet."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--limit", type=int, default=None)
+        parser.add_argument("--batch-size", type=int, default=50)
+
+    def handle(self, *args, **options):
+        qs = (
+            Application.objects.filter(resume_text__isnull=True)
+            .filter(Q(resume_blob__isnull=False) | Q(resume_url__isnull=False))
+            .order_by("id")
+            .values_list("id", "resume_url", "resume_blob__path")
+        )
+        if options["limit"]:
+            qs = qs[: options["limit"]]
+
+        pending = list(qs)
+        executor = get_executor()
+        batch_size = options["batch_size"]
+        indexed = failed = 0
+
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start:start + batch_size]
+
+            payloads = []
+            for app_id, url, path in batch:
+                try:
+                    payloads.append((app_id, _download(url, path)))
+                except Exception as e:
+                    failed += 1
+                    self.stderr.write(f"Download failed for application {app_id}: {e}")
+
+            # CPU heavy part fans out over the process pool
+            texts = executor.map(extract_pdf_text, [data for _, data in payloads])
+
+            for (app_id, _), text in zip(payloads, texts):
+                index_resume(app_id, text)
+                indexed += 1
+
+            self.stdout.write(f"Indexed {indexed}/{len(pending)}")
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Done: {indexed} indexed, {failed} failed.")
+        )
@@ -0,0 +1,28 @@
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+
+from applications.matching import DF_CACHE_KEY, score_applications
+from applications.models import Application
+
+
+class Command(BaseCommand):
+    help = "(Re)compute resume/job match scores in batch, optionally for one job."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--job", type=int, default=None, help="Only this job id")
+        parser.add_argument(
+            "--unscored", action="store_true", help="Only applications without a score"
+        )
+
+    def handle(self, *args, **options):
+        qs = Application.objects.filter(job__is_deleted=False)
+        if options["job"]:
+            qs = qs.filter(job_id=options["job"])
+        if options["unscored"]:
+            qs = qs.filter(match_score__isnull=True)
+
+        # Full rescore -> refresh idf statistics first
+        cache.delete(DF_CACHE_KEY)
+        count = score_applications(qs)
+
+        self.stdout.write(self.style.SUCCESS(f"Scored {count} applications."))
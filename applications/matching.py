@@ -0,0 +1,159 @@
+# applications/matching.py
+#
+# Candidate <-> job matching: TF-IDF cosine similarity between the job text
+# (title, description, education) and the extracted resume text.
+
+from collections import Counter
+
+import numpy as np
+from scipy.sparse import csr_matrix, diags
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, F
+
+from applications.models import Application, ResumeKeyword, ResumeText
+from applications.pdf_text import iter_terms
+from jobs.models import Job
+
+DF_CACHE_KEY = "matching:document_frequencies"
+BATCH_SIZE = 5000
+
+
+# =====================================================
+# Vectorization (pure NumPy / SciPy, no DB access)
+# =====================================================
+def _tf_matrix(term_counts, vocab):
+    """
+    Sublinear TF (1 + log n) rows. New terms are appended to `vocab`,
+    so resumes and jobs share one column space.
+    """
+    indptr = [0]
+    indices = []
+    data = []
+    for counts in term_counts:
+        for term, n in counts.items():
+            indices.append(vocab.setdefault(term, len(vocab)))
+            data.append(n)
+        indptr.append(len(indices))
+
+    values = 1.0 + np.log(np.asarray(data, dtype=np.float32))
+    return csr_matrix(
+        (values, np.asarray(indices, dtype=np.int32), np.asarray(indptr, dtype=np.int64)),
+        shape=(len(term_counts), max(len(vocab), 1)),
+    )
+
+
+def _l2_normalize(matrix):
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    return diags(1.0 / norms) @ matrix
+
+
+def score_pairs(resume_counts, job_counts, job_index, df, n_docs):
+    """
+    Cosine similarity of resume i against job job_index[i], for all i at once.
+
+    resume_counts / job_counts: lists of Counter(term -> occurrences)
+    df: {term: number of resumes containing it}, n_docs: number of resumes
+    Returns a float32 array with one score in [0, 1] per resume.
+    """
+    if not resume_counts:
+        return np.zeros(0, dtype=np.float32)
+
+    vocab = {}
+    resumes = _tf_matrix(resume_counts, vocab)
+    jobs = _tf_matrix(job_counts, vocab)
+    width = max(len(vocab), 1)
+    resumes.resize((resumes.shape[0], width))
+    jobs.resize((jobs.shape[0], width))
+
+    doc_freq = np.fromiter((df.get(t, 0) for t in vocab), dtype=np.float32, count=len(vocab))
+    idf = diags(np.log((n_docs + 1) / (doc_freq + 1)) + 1.0)
+
+    resumes = _l2_normalize(resumes @ idf).tocsr()
+    jobs = _l2_normalize(jobs @ idf).tocsr()
+
+    # Row-wise dot product of each resume with its own job row
+    paired = jobs[np.asarray(job_index, dtype=np.int64)]
+    return np.asarray(resumes.multiply(paired).sum(axis=1), dtype=np.float32).ravel()
+
+
+def job_text(title, description, required_education):
+    # Title counted twice: it is the strongest signal of what the role is.
+    return " ".join([title, title, description or "", required_education or ""])
+
+
+# =====================================================
+# DB layer
+# =====================================================
+def document_frequencies():
+    """
+    IDF statistics come straight from the resume keyword index
+    (one row per distinct term per resume) and are cached, so incremental
+    scoring of a single new applicant does not rescan the index.
+    """
+    cached = cache.get(DF_CACHE_KEY)
+    if cached is not None:
+        return cached
+
+    df = dict(
+        ResumeKeyword.objects.values_list("term").annotate(n=Count("id")).order_by()
+    )
+    stats = (df, ResumeText.objects.count())
+    cache.set(DF_CACHE_KEY, stats, settings.MATCH_IDF_CACHE_TIMEOUT)
+    return stats
+
+
+def score_applications(queryset, batch_size=BATCH_SIZE):
+    """
+    Score every application in `queryset` that has extracted resume text
+    and store the result in Application.match_score. Returns the count.
+    """
+    df, n_docs = document_frequencies()
+    ids = list(
+        queryset.filter(resume_text__isnull=False)
+        .order_by("id")
+        .values_list("id", flat=True)
+    )
+    scored = 0
+
+    for start in range(0, len(ids), batch_size):
+        rows = list(
+            Application.objects.filter(id__in=ids[start:start + batch_size])
+            .values_list("id", "job_id", "resume_text__text")
+        )
+
+        jobs = Job.objects.filter(
+            id__in={job_id for _, job_id, _ in rows}
+        ).values_list("id", "title", "description", "required_education")
+
+        job_pos = {}
+        job_counts = []
+        for job_id, title, description, education in jobs:
+            job_pos[job_id] = len(job_counts)
+            job_counts.append(Counter(iter_terms(job_text(title, description, education))))
+
+        scores = score_pairs(
+            [Counter(iter_terms(text or "")) for _, _, text in rows],
+            job_counts,
+            [job_pos[job_id] for _, job_id, _ in rows],
+            df,
+            n_docs,
+        )
+
+        Application.objects.bulk_update(
+            [
+                Application(id=app_id, match_score=round(float(score), 4))
+                for (app_id, _, _), score in zip(rows, scores)
+            ],
+            ["match_score"],
+        )
+        scored += len(rows)
+
+    return scored
+
+
+def sort_by_match(qs):
+    """Best match first; unscored applications last, newest first."""
+    return qs.order_by(F("match_score").desc(nulls_last=True), "-applied_at")
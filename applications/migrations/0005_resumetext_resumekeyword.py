@@ -0,0 +1,34 @@
+# Generated by Django 5.2.10 on 2026-10-19 14:07
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0004_application_application_id'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResumeText',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('text', models.TextField(blank=True)),
+                ('extracted_at', models.DateTimeField(auto_now=True)),
+                ('application', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='resume_text', to='applications.application')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ResumeKeyword',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=40)),
+                ('application', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='resume_keywords', to='applications.application')),
+            ],
+            options={
+                'unique_together': {('term', 'application')},
+            },
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.10 on 2026-10-19 14:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0006_application_match_score'),
+        ('jobs', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='application',
+            name='is_repeat_applicant',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['email'], name='app_email_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['phone'], name='app_phone_idx'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.10 on 2026-10-19 14:31
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0007_application_is_repeat_applicant'),
+        ('jobs', '0007_job_archive'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApplicationStatusEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('from_status', models.CharField(blank=True, choices=[('screening', 'Screening'), ('review', 'Review'), ('interview', 'Interview'), ('hired', 'Hired'), ('rejected', 'Rejected')], max_length=20)),
+                ('to_status', models.CharField(choices=[('screening', 'Screening'), ('review', 'Review'), ('interview', 'Interview'), ('hired', 'Hired'), ('rejected', 'Rejected')], max_length=20)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('application', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='status_events', to='applications.application')),
+                ('changed_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='status_events', to='jobs.job')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['application', 'created_at'], name='status_event_app_idx'), models.Index(fields=['job', 'to_status', 'created_at'], name='status_event_funnel_idx')],
+            },
+        ),
+    ]
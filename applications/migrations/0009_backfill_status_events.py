@@ -0,0 +1,36 @@
+from django.db import migrations
+
+
+def backfill_status_events(apps, schema_editor):
+    """
+    One "applied" event per existing application. Earlier transitions
+    were never recorded, so the current status is logged at applied_at.
+    """
+    Application = apps.get_model("applications", "Application")
+    ApplicationStatusEvent = apps.get_model("applications", "ApplicationStatusEvent")
+
+    rows = Application.objects.values_list("id", "job_id", "status", "applied_at")
+    batch = []
+    for app_id, job_id, status, applied_at in rows.iterator(chunk_size=2000):
+        batch.append(ApplicationStatusEvent(
+            application_id=app_id,
+            job_id=job_id,
+            from_status="",
+            to_status=status,
+            created_at=applied_at,
+        ))
+        if len(batch) >= 2000:
+            ApplicationStatusEvent.objects.bulk_create(batch)
+            batch = []
+    ApplicationStatusEvent.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0008_applicationstatusevent'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_status_events, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0009_backfill_status_events'),
+    ]
+
+    operations = [
+        # Nullable first: a callable default would give every existing row the same token
+        migrations.AddField(
+            model_name='application',
+            name='tracking_token',
+            field=models.CharField(editable=False, max_length=32, null=True),
+        ),
+    ]
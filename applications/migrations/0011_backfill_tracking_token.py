@@ -0,0 +1,25 @@
+import secrets
+
+from django.db import migrations
+
+
+def backfill_tracking_tokens(apps, schema_editor):
+    Application = apps.get_model("applications", "Application")
+
+    ids = list(Application.objects.filter(tracking_token__isnull=True).values_list("id", flat=True))
+    for i in range(0, len(ids), 2000):
+        Application.objects.bulk_update(
+            [Application(id=app_id, tracking_token=secrets.token_urlsafe(16)) for app_id in ids[i:i + 2000]],
+            ["tracking_token"],
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0010_application_tracking_token'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_tracking_tokens, migrations.RunPython.noop),
+    ]
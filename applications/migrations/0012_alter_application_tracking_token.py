@@ -0,0 +1,17 @@
+import applications.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0011_backfill_tracking_token'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='application',
+            name='tracking_token',
+            field=models.CharField(default=applications.models.generate_tracking_token, editable=False, max_length=32, unique=True),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.10 on 2026-10-19 15:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0013_resumeblob'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='resumeblob',
+            name='url',
+        ),
+        migrations.AddField(
+            model_name='resumeblob',
+            name='thumbnail_path',
+            field=models.CharField(blank=True, max_length=255),
+        ),
+    ]
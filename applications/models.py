@@ -1,6 +1,10 @@
 # applications/models.py
 
+import secrets
+
+from django.conf import settings
 from django.db import models
+from django.utils import timezone
 from jobs.models import Job
 
 
@@ -13,6 +17,10 @@ STATUS_CHOICES = [
 ]
 
 
+def generate_tracking_token():
+    return secrets.token_urlsafe(16)
+
+
 class Application(models.Model):
     job = models.ForeignKey(
         Job,
@@ -30,8 +38,19 @@ class Application(models.Model):
     email = models.EmailField()
     phone = models.CharField(max_length=20)
 
+    # Public URL of uploads made before private storage; NULL since then
     resume_url = models.URLField(null=True, blank=True)
 
+    # Stored file, shared with other applications that uploaded the same
+    # bytes (applications/resume_store.py). NULL for older uploads.
+    resume_blob = models.ForeignKey(
+        "ResumeBlob",
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name="applications"
+    )
+
     status = models.CharField(
         max_length=20,
         choices=STATUS_CHOICES,
@@ -40,8 +59,29 @@ class Application(models.Model):
 
     applied_at = models.DateTimeField(auto_now_add=True)
 
+    # TF-IDF similarity to the job (applications/matching.py), NULL until scored
+    match_score = models.FloatField(null=True, blank=True)
+
+    # Same email / phone has applied to another job (applications/duplicates.py)
+    is_repeat_applicant = models.BooleanField(default=False)
+
+    # Public tracking link key (applications/tracking.py). application_id
+    # is sequential, so it is only displayed, never looked up from a URL.
+    tracking_token = models.CharField(
+        max_length=32,
+        unique=True,
+        default=generate_tracking_token,
+        editable=False,
+    )
+
     class Meta:
         unique_together = ("job", "email")
+        indexes = [
+            models.Index(fields=["job", "-match_score"], name="app_job_match_idx"),
+            # cross-job duplicate lookups
+            models.Index(fields=["email"], name="app_email_idx"),
+            models.Index(fields=["phone"], name="app_phone_idx"),
+        ]
 
     # ✅ NEW SAVE METHOD (AUTO GENERATE ID)
     def save(self, *args, **kwargs):
@@ -58,4 +98,176 @@ class Application(models.Model):
 
             self.application_id = f"HF-{str(new_id).zfill(4)}"
 
-        super().save(*args, **kwargs)
\ No newline at end of file
+        adding = self._state.adding
+        super().save(*args, **kwargs)
+
+        # First timeline entry ("applied"), same transaction as the insert
+        if adding:
+            ApplicationStatusEvent.objects.create(
+                application=self,
+                job_id=self.job_id,
+                from_status="",
+                to_status=self.status,
+                created_at=self.applied_at,
+            )
+
+# ==========================================
+# STATUS HISTORY (append-only)
+# Written by applications/status.py in the same transaction as the
+# status change. `job` is denormalized for funnel / per-stage queries.
+# ==========================================
+class ApplicationStatusEvent(models.Model):
+    application = models.ForeignKey(
+        Application,
+        on_delete=models.CASCADE,
+        related_name="status_events"
+    )
+    job = models.ForeignKey(
+        Job,
+        on_delete=models.CASCADE,
+        related_name="status_events"
+    )
+    from_status = models.CharField(max_length=20, choices=STATUS_CHOICES, blank=True)  # "" = applied
+    to_status = models.CharField(max_length=20, choices=STATUS_CHOICES)
+    changed_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+"
+    )  # NULL = candidate / system
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            # timeline of one application
+            models.Index(fields=["application", "created_at"], name="status_event_app_idx"),
+            # funnel: entries into a stage per job over time
+            models.Index(fields=["job", "to_status", "created_at"], name="status_event_funnel_idx"),
+        ]
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            raise ValueError("Status events are append-only.")
+        super().save(*args, **kwargs)
+
+    def __str__(self):
+        return f"{self.application_id}: {self.from_status or 'applied'} -> {self.to_status}"
+
+
+# ==========================================
+# RESUME TEXT + KEYWORD INDEX
+# Filled in the background by applications/resume_index.py
+# ==========================================
+class ResumeText(models.Model):
+    application = models.OneToOneField(
+        Application,
+        on_delete=models.CASCADE,
+        related_name="resume_text"
+    )
+    text = models.TextField(blank=True)
+    extracted_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Resume text for {self.application.application_id}"
+
+
+class ResumeKeyword(models.Model):
+    """
+    Inverted index: one row per distinct term per resume.
+    unique_together gives a (term, application) index, so a keyword
+    lookup is an index range scan instead of a LIKE over resume text.
+    """
+    application = models.ForeignKey(
+        Application,
+        on_delete=models.CASCADE,
+        related_name="resume_keywords"
+    )
+    term = models.CharField(max_length=40)
+
+    class Meta:
+        unique_together = ("term", "application")
+
+
+# ==========================================
+# RESUME FILES (content-addressed)
+# One row per distinct stored file, keyed by the SHA-256 of its bytes.
+# ref_count = applications pointing at it; kept by applications/resume_store.py
+# ==========================================
+class ResumeBlob(models.Model):
+    sha256 = models.CharField(max_length=64, unique=True)
+    size = models.PositiveIntegerField()
+    path = models.CharField(max_length=255)  # key in the (private) storage bucket
+    thumbnail_path = models.CharField(max_length=255, blank=True)  # "" until rendered
+    ref_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    # Set when ref_count drops to 0; garbage collected after a grace period
+    unreferenced_at = models.DateTimeField(null=True, blank=True, db_index=True)
+
+    def __str__(self):
+        return f"{self.sha256[:12]} ({self.ref_count} refs)"
+
+
+# ==========================================
+# BULK RESUME DOWNLOAD (background-built, for very large jobs)
+# Built in parts of RESUME_ARCHIVE_PART_SIZE resumes by
+# applications/resume_archive.py; `parts` is the checkpoint, so an
+# interrupted build carries on with the next part.
+# ==========================================
+class ResumeArchive(models.Model):
+    STATUS_CHOICES = [
+        ("pending", "Pending"),
+        ("building", "Building"),
+        ("ready", "Ready"),
+        ("failed", "Failed"),
+    ]
+
+    job = models.ForeignKey(
+        Job,
+        on_delete=models.CASCADE,
+        related_name="resume_archives"
+    )
+    requested_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+"
+    )
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="pending")
+
+    # Snapshot: applications with pk <= last_application_id, in pk order
+    last_application_id = models.PositiveBigIntegerField()
+    total = models.PositiveIntegerField()
+    parts = models.JSONField(default=list)  # finished parts: {"path", "last", "count"}
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(default=timezone.now)  # builder heartbeat
+
+    def __str__(self):
+        return f"Resumes for job {self.job_id} ({self.status}, {len(self.parts)} parts)"
+
+
+class IdempotencyKey(models.Model):
+    """
+    Client-chosen key of one submission (Idempotency-Key header, apply
+    form token). The row is the claim; `response` is what the first
+    request answered, replayed to repeats (applications/idempotency.py).
+    """
+
+    scope = models.CharField(max_length=64)  # e.g. "apply:<job id>"
+    key = models.CharField(max_length=128)
+    response = models.JSONField(null=True, blank=True)  # None = in progress
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["scope", "key"], name="idempotency_scope_key_uniq"),
+        ]
+        indexes = [
+            models.Index(fields=["created_at"], name="idempotency_created_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.scope} {self.key}"
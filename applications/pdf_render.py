@@ -0,0 +1,59 @@
+# applications/pdf_render.py
+#
+# Pure functions with NO Django imports: they run inside worker processes
+# of the resume extraction pool (see applications/resume_preview.py).
+
+import logging
+import struct
+import zlib
+
+import numpy as np
+import pypdfium2 as pdfium
+
+logger = logging.getLogger(__name__)
+
+
+def _png_chunk(kind, body):
+    return (
+        struct.pack(">I", len(body)) + kind + body
+        + struct.pack(">I", zlib.crc32(kind + body) & 0xFFFFFFFF)
+    )
+
+
+def encode_png(pixels):
+    """
+    8-bit grayscale PNG from a 2-D uint8 array. Every row uses the "Up"
+    filter (difference to the row above): resume pages are mostly blank
+    runs and repeated text lines, which then deflate very well.
+    """
+    height, width = pixels.shape
+    up = np.empty_like(pixels)
+    up[0] = pixels[0]
+    up[1:] = pixels[1:] - pixels[:-1]  # uint8 wraps = mod 256, as PNG expects
+    rows = np.hstack([np.full((height, 1), 2, dtype=np.uint8), up])
+
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + _png_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 0, 0, 0, 0))
+        + _png_chunk(b"IDAT", zlib.compress(rows.tobytes(), 9))
+        + _png_chunk(b"IEND", b"")
+    )
+
+
+def render_thumbnail(data: bytes, width: int) -> bytes:
+    """
+    First page of a PDF as a grayscale PNG `width` pixels wide.
+    Unrenderable files return b"" instead of raising, so one bad upload
+    never kills a pool worker.
+    """
+    try:
+        pdf = pdfium.PdfDocument(data)
+        try:
+            page = pdf[0]
+            bitmap = page.render(scale=width / page.get_width(), grayscale=True)
+            return encode_png(bitmap.to_numpy())
+        finally:
+            pdf.close()
+    except Exception as e:
+        logger.warning(f"Resume thumbnail failed: {e}")
+        return b""
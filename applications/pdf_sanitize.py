@@ -0,0 +1,138 @@
+# applications/pdf_sanitize.py
+#
+# Pure functions with NO Django imports: they run inside worker processes
+# of the resume validation pool (see applications/resume_check.py).
+#
+# A resume is rebuilt page by page into a new document, so nothing from
+# the source catalog survives: document JavaScript (/Names /JavaScript),
+# embedded files, /OpenAction, forms (/AcroForm) and outlines are gone.
+# Page-level actions and active annotations are removed on top of that.
+
+import io
+from typing import NamedTuple
+
+from pypdf import PdfReader, PdfWriter
+from pypdf.generic import ArrayObject, NameObject
+
+HEADER_WINDOW = 1024  # the spec allows junk before %PDF- / after %%EOF
+
+# Actions that run code, open files/URLs outside the viewer or post data
+ACTIVE_ACTIONS = frozenset({
+    "/JavaScript", "/Launch", "/ImportData", "/SubmitForm", "/ResetForm",
+    "/GoToE", "/Rendition", "/RichMediaExecute", "/Sound", "/Movie", "/Hide",
+})
+ACTIVE_ANNOTATIONS = frozenset({
+    "/FileAttachment", "/RichMedia", "/Screen", "/Movie", "/Sound", "/3D",
+})
+CATALOG_ACTIVE_KEYS = ("/OpenAction", "/AA", "/AcroForm")
+NAME_TREE_ACTIVE_KEYS = ("/JavaScript", "/EmbeddedFiles")
+
+
+class PdfRejected(Exception):
+    """The upload is not a usable PDF; the message is shown to the candidate."""
+
+
+class SanitizedPdf(NamedTuple):
+    data: bytes
+    pages: int
+    removed: tuple  # what was stripped, e.g. ("/JavaScript", "/AA")
+
+
+def _is_active(action, depth=0):
+    # Follow /Next chains: a harmless /URI can be followed by JavaScript
+    if action is None or depth > 16:
+        return False
+    action = action.get_object()
+    if action.get("/S") in ACTIVE_ACTIONS:
+        return True
+    chained = action.get("/Next")
+    if chained is None:
+        return False
+    chained = chained.get_object()
+    if isinstance(chained, ArrayObject):
+        return any(_is_active(item, depth + 1) for item in chained)
+    return _is_active(chained, depth + 1)
+
+
+def _catalog_findings(reader):
+    root = reader.trailer["/Root"].get_object()
+    found = [key for key in CATALOG_ACTIVE_KEYS if key in root]
+    names = root.get("/Names")
+    if names is not None:
+        names = names.get_object()
+        found += [key for key in NAME_TREE_ACTIVE_KEYS if key in names]
+    return found
+
+
+def _strip_page(page, removed):
+    if "/AA" in page:
+        del page[NameObject("/AA")]
+        removed.append("/AA")
+
+    annotations = page.get("/Annots")
+    if annotations is None:
+        return
+    kept = ArrayObject()
+    for ref in annotations.get_object():
+        annotation = ref.get_object()
+        subtype = annotation.get("/Subtype")
+        if subtype in ACTIVE_ANNOTATIONS:
+            removed.append(subtype)
+            continue
+        if _is_active(annotation.get("/A")):
+            removed.append("/A")
+            continue
+        if "/AA" in annotation:
+            del annotation[NameObject("/AA")]
+            removed.append("/AA")
+        kept.append(ref)
+    if kept:
+        page[NameObject("/Annots")] = kept
+    else:
+        del page[NameObject("/Annots")]
+
+
+def sanitize_pdf(data: bytes, max_pages: int, compress: bool = True) -> SanitizedPdf:
+    """
+    Validate an uploaded PDF and return a rebuilt copy without active
+    content. Raises PdfRejected for anything that is not a readable,
+    unencrypted PDF of 1..max_pages pages.
+    """
+    if b"%PDF-" not in data[:HEADER_WINDOW]:
+        raise PdfRejected("File is not a PDF.")
+    if b"%%EOF" not in data[-HEADER_WINDOW:]:
+        raise PdfRejected("PDF file is incomplete. Please upload it again.")
+
+    try:
+        reader = PdfReader(io.BytesIO(data), strict=False)
+        if reader.is_encrypted and not reader.decrypt(""):
+            raise PdfRejected("Password-protected PDFs are not accepted.")
+
+        page_count = len(reader.pages)
+        if page_count == 0:
+            raise PdfRejected("PDF has no pages.")
+        if page_count > max_pages:
+            raise PdfRejected(f"Resume cannot be longer than {max_pages} pages.")
+
+        removed = _catalog_findings(reader)
+        writer = PdfWriter()
+        for page in reader.pages:
+            writer.add_page(page)
+
+        for page in writer.pages:
+            page.mediabox  # noqa: B018  (structure check: every page must resolve)
+            _strip_page(page, removed)
+            if compress:
+                page.compress_content_streams(level=9)
+
+        if compress:
+            writer.compress_identical_objects(remove_identicals=True, remove_orphans=True)
+
+        out = io.BytesIO()
+        writer.write(out)
+    except PdfRejected:
+        raise
+    except Exception:
+        raise PdfRejected("PDF file is damaged and could not be read.")
+
+    return SanitizedPdf(out.getvalue(), page_count, tuple(removed))
@@ -0,0 +1,64 @@
+# applications/pdf_text.py
+#
+# Pure functions with NO Django imports: they run inside worker processes
+# of the resume extraction pool (see applications/resume_index.py).
+
+import io
+import logging
+import re
+
+from pypdf import PdfReader
+
+logger = logging.getLogger(__name__)
+
+MAX_TERMS_PER_RESUME = 1000
+MAX_TERM_LENGTH = 40
+
+# Keeps tech tokens intact: c++, c#, node.js, asp.net
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+
+STOP_WORDS = frozenset(
+    """
+    a an and are as at be by for from has have in is it its of on or that the
+    to was were will with i me my we our you your he she they them this these
+    those am been being do does did not no but if so than then there their
+    """.split()
+)
+
+
+def extract_pdf_text(data: bytes) -> str:
+    """
+    Extract plain text from PDF bytes.
+    Broken / encrypted PDFs return "" instead of raising, so one bad upload
+    never kills a pool worker.
+    """
+    try:
+        reader = PdfReader(io.BytesIO(data))
+        return "\n".join(page.extract_text() or "" for page in reader.pages)
+    except Exception as e:
+        logger.warning(f"PDF text extraction failed: {e}")
+        return ""
+
+
+def iter_terms(text: str):
+    """
+    Lowercased terms in document order (with repeats), stop words removed.
+    """
+    for match in TOKEN_RE.findall(text.lower()):
+        term = match.rstrip(".")
+        if len(term) < 2 or len(term) > MAX_TERM_LENGTH or term in STOP_WORDS:
+            continue
+        yield term
+
+
+def tokenize(text: str, limit: int = MAX_TERMS_PER_RESUME) -> list[str]:
+    """
+    Lowercased distinct terms in first-seen order, stop words removed.
+    """
+    seen = {}
+    for term in iter_terms(text):
+        if term not in seen:
+            seen[term] = None
+            if len(seen) >= limit:
+                break
+    return list(seen)
@@ -0,0 +1,44 @@
+# applications/realtime.py
+#
+# Status changes and new applications pushed over core.realtime (SSE):
+#   application:<id>  candidate track page   -> "status"
+#   recruiter:<id>    recruiter pages         -> "application", "status"
+# Published after commit, from ApplicationStatusEvent rows.
+
+from core.realtime import get_broker, publish
+from jobs.models import Job
+
+
+def application_channel(application_pk):
+    return f"application:{application_pk}"
+
+
+def recruiter_channel(user_id):
+    return f"recruiter:{user_id}"
+
+
+def publish_status_events(events):
+    """Fan out a batch of ApplicationStatusEvent rows (one Job query)."""
+    if not events or not get_broker().active():
+        return
+
+    recruiters = dict(
+        Job.objects.filter(id__in={event.job_id for event in events})
+        .values_list("id", "created_by_id")
+    )
+    for event in events:
+        if event.from_status:
+            publish(application_channel(event.application_id), "status", {
+                "status": event.to_status,
+                "status_display": event.get_to_status_display(),
+                "at": event.created_at,
+            })
+
+        recruiter_id = recruiters.get(event.job_id)
+        if recruiter_id:
+            publish(recruiter_channel(recruiter_id), "status" if event.from_status else "application", {
+                "application": event.application_id,
+                "job": event.job_id,
+                "status": event.to_status,
+                "at": event.created_at,
+            })
@@ -0,0 +1,291 @@
+# applications/resume_archive.py
+#
+# "Download all resumes" for a job.
+#
+# Up to RESUME_ARCHIVE_STREAM_LIMIT resumes the ZIP is built while it is
+# sent: resumes are fetched from storage by a small thread pool (at most
+# 2 x RESUME_ARCHIVE_FETCH_WORKERS in flight) and each entry is written
+# and flushed to the client as soon as its download finishes. Entries are
+# STORED (PDFs are already compressed), sizes go in data descriptors, so
+# memory stays at the fetch window whatever the job size.
+#
+# Bigger jobs get a ResumeArchive built in the background, in parts of
+# RESUME_ARCHIVE_PART_SIZE resumes uploaded to storage one at a time.
+# Finished parts are the checkpoint: a build interrupted by a deploy or
+# crash (heartbeat older than RESUME_ARCHIVE_STALE) is picked up again by
+# resume_archives() at the next unfinished part.
+
+import logging
+import tempfile
+import threading
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import timedelta
+
+import requests
+from django.conf import settings
+from django.core.files import File
+from django.db import close_old_connections, transaction
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.text import slugify
+
+from applications.models import Application, ResumeArchive
+from applications.resume_store import storage_backend
+from core.db_router import PRIMARY
+from core.scheduler import run_periodically
+from jobs.models import Job
+
+logger = logging.getLogger(__name__)
+
+
+def job_resumes(job):
+    """Applications of `job` that have a resume, oldest first."""
+    return (
+        Application.objects.filter(job=job)
+        .filter(Q(resume_blob__isnull=False) | Q(resume_url__isnull=False))
+        .exclude(resume_blob__isnull=True, resume_url="")
+        .order_by("pk")
+    )
+
+
+def archive_entries(applications):
+    """
+    [(file name in the ZIP, storage path, legacy URL)] for `applications`.
+    application_id isn't unique, so names start with the pk: two entries
+    with the same name would both be written, and unzip keeps one.
+    """
+    rows = applications.values_list(
+        "pk", "application_id", "full_name", "resume_blob__path", "resume_url"
+    )
+    return [
+        ("_".join(filter(None, [str(pk), app_id, slugify(name) or "resume"])) + ".pdf", path, url)
+        for pk, app_id, name, path, url in rows
+    ]
+
+
+def fetch_resume(entry):
+    _, path, url = entry
+    if path:
+        return storage_backend().download_resume(path)
+    # Applications from before content-addressed storage
+    response = requests.get(url, timeout=30)
+    response.raise_for_status()
+    return response.content
+
+
+def fetch_concurrently(entries, fetch=fetch_resume, workers=None):
+    """
+    Yield (entry, bytes or None) in completion order with at most
+    2 x workers downloads in flight; None when the fetch failed.
+    """
+    workers = workers or settings.RESUME_ARCHIVE_FETCH_WORKERS
+    entries = iter(entries)
+    pool = ThreadPoolExecutor(workers, thread_name_prefix="resume-fetch")
+    pending = {}
+
+    def fill():
+        while len(pending) < workers * 2:
+            entry = next(entries, None)
+            if entry is None:
+                return
+            pending[pool.submit(fetch, entry)] = entry
+
+    try:
+        fill()
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                entry = pending.pop(future)
+                try:
+                    data = future.result()
+                except Exception as e:
+                    logger.warning(f"Could not fetch resume {entry[0]}: {e}")
+                    data = None
+                yield entry, data
+            fill()
+    finally:
+        # Client went away mid-download: drop what hasn't started
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+class _Chunks:
+    """Write-only, unseekable sink for ZipFile, drained after each entry."""
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b"".join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def stream_zip(entries, fetch=fetch_resume, workers=None):
+    """
+    Generate a ZIP of `entries` chunk by chunk (one chunk per resume).
+    Resumes that can't be fetched are listed in _missing.txt instead.
+    """
+    sink = _Chunks()
+    missing = []
+    date_time = timezone.localtime().timetuple()[:6]
+
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_STORED, allowZip64=True) as archive:
+        for entry, data in fetch_concurrently(entries, fetch, workers):
+            if data is None:
+                missing.append(entry[0])
+                continue
+            archive.writestr(zipfile.ZipInfo(entry[0], date_time=date_time), data)
+            yield sink.drain()
+
+        if missing:
+            archive.writestr("_missing.txt", "\n".join(sorted(missing)) + "\n")
+    yield sink.drain()
+
+
+# =====================================================
+# Background archives for very large jobs
+# =====================================================
+def part_path(archive, n):
+    return f"archives/{archive.pk}/part-{n:03d}.zip"
+
+
+def request_archive(job, user):
+    """
+    Latest ResumeArchive for `job` if it still covers every application
+    and hasn't failed, else a new one; its build starts after commit.
+    """
+    applications = job_resumes(job).using(PRIMARY)
+    last = applications.last()
+    last_id = last.pk if last else 0
+
+    # Primary, under the job's row lock: a lagging replica or a
+    # concurrent request would otherwise start a second build
+    with transaction.atomic(using=PRIMARY):
+        Job.objects.using(PRIMARY).select_for_update().filter(pk=job.pk).first()
+        archive = (
+            ResumeArchive.objects.using(PRIMARY)
+            .filter(job=job, last_application_id=last_id)
+            .exclude(status="failed")
+            .order_by("-created_at")
+            .first()
+        )
+        if archive is None:
+            archive = ResumeArchive.objects.create(
+                job=job,
+                requested_by=user,
+                last_application_id=last_id,
+                total=applications.count(),
+            )
+            transaction.on_commit(lambda: start_build(archive.pk), using=PRIMARY)
+    return archive
+
+
+def start_build(pk):
+    threading.Thread(target=_build_in_thread, args=(pk,), name=f"resume-archive-{pk}", daemon=True).start()
+
+
+def _build_in_thread(pk):
+    try:
+        build_archive(pk)
+    finally:
+        close_old_connections()
+
+
+def _claim(pk):
+    """Take the build if nobody else holds it (fresh heartbeat)."""
+    stale = timezone.now() - timedelta(seconds=settings.RESUME_ARCHIVE_STALE)
+    return ResumeArchive.objects.filter(
+        Q(status="pending") | Q(status="building", updated_at__lt=stale), pk=pk
+    ).update(status="building", updated_at=timezone.now())
+
+
+def build_archive(pk, fetch=fetch_resume):
+    """Build the parts still missing from archive `pk`. Returns True when ready."""
+    if not _claim(pk):
+        return False
+
+    archive = ResumeArchive.objects.select_related("job").get(pk=pk)
+    applications = job_resumes(archive.job).filter(pk__lte=archive.last_application_id)
+    size = settings.RESUME_ARCHIVE_PART_SIZE
+    backend = storage_backend()
+
+    try:
+        # Keyset over pk, so deleting an application mid-build can't shift
+        # later parts; the last part's "last" is where a resumed build starts
+        after = archive.parts[-1]["last"] if archive.parts else 0
+        while True:
+            pks = list(applications.filter(pk__gt=after).values_list("pk", flat=True)[:size])
+            if not pks:
+                break
+            path = part_path(archive, len(archive.parts) + 1)
+
+            with tempfile.NamedTemporaryFile() as tmp:
+                for chunk in stream_zip(archive_entries(applications.filter(pk__in=pks)), fetch):
+                    tmp.write(chunk)
+                tmp.flush()
+                # Read-only handle: upload_resume() streams it from disk
+                with open(tmp.name, "rb") as data:
+                    part = File(data, name=path.rsplit("/", 1)[-1])
+                    part.content_type = "application/zip"
+                    backend.delete_resume(path)  # leftover of an interrupted attempt
+                    backend.upload_resume(part, path)
+
+            after = pks[-1]
+            archive.parts.append({"path": path, "last": after, "count": len(pks)})
+            archive.updated_at = timezone.now()
+            archive.save(update_fields=["parts", "updated_at"])
+    except Exception:
+        logger.exception(f"Resume archive {pk} failed at part {len(archive.parts) + 1}")
+        ResumeArchive.objects.filter(pk=pk).update(status="failed", updated_at=timezone.now())
+        return False
+
+    ResumeArchive.objects.filter(pk=pk).update(status="ready", updated_at=timezone.now())
+    return True
+
+
+def delete_archive(archive):
+    backend = storage_backend()
+    for part in archive.parts:
+        path = part["path"]
+        try:
+            backend.delete_resume(path)
+        except Exception:
+            logger.exception(f"Could not delete archive part {path}")
+    archive.delete()
+
+
+def resume_archives():
+    """
+    Continue builds left without a live builder, and delete archives older
+    than RESUME_ARCHIVE_TTL. Returns (resumed, deleted).
+    """
+    now = timezone.now()
+    stale = now - timedelta(seconds=settings.RESUME_ARCHIVE_STALE)
+
+    resumed = 0
+    for pk in ResumeArchive.objects.filter(
+        Q(status="pending") | Q(status="building", updated_at__lt=stale)
+    ).values_list("pk", flat=True):
+        resumed += build_archive(pk)
+
+    expired = ResumeArchive.objects.filter(
+        created_at__lt=now - timedelta(seconds=settings.RESUME_ARCHIVE_TTL)
+    ).exclude(status="building", updated_at__gte=stale)
+    deleted = 0
+    for archive in expired:
+        delete_archive(archive)
+        deleted += 1
+    return resumed, deleted
+
+
+def start_archive_scheduler():
+    """Daemon thread per web worker when RESUME_ARCHIVE_INTERVAL > 0."""
+    return run_periodically("resume-archives", settings.RESUME_ARCHIVE_INTERVAL, resume_archives)
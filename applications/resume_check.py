@@ -0,0 +1,87 @@
+# applications/resume_check.py
+
+import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError
+from concurrent.futures.process import BrokenProcessPool
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+
+from applications.pdf_sanitize import PdfRejected, sanitize_pdf
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+_slots = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """
+    One lazily created process pool per web worker, separate from the text
+    extraction pool so uploads never queue behind background indexing.
+    `_slots` caps how many checks may be queued or running at once.
+    """
+    global _executor, _slots
+    with _executor_lock:
+        if _executor is None:
+            workers = max(settings.RESUME_CHECK_WORKERS, 1)
+            _executor = ProcessPoolExecutor(max_workers=workers)
+            _slots = threading.BoundedSemaphore(workers * settings.RESUME_CHECK_QUEUE)
+    return _executor, _slots
+
+
+def _reset_executor(broken, terminate=False):
+    # A worker died (crash / OOM on a hostile file) or is stuck on one
+    # (terminate=True): start a fresh pool. Checks still running in the
+    # old pool fail and are reported as unprocessable.
+    global _executor
+    with _executor_lock:
+        if _executor is broken:
+            _executor = None
+    if terminate:
+        # cancel() can't stop a running parse; only killing its process can
+        for process in list((broken._processes or {}).values()):
+            process.terminate()
+    broken.shutdown(wait=False, cancel_futures=True)
+
+
+def check_resume(data):
+    """
+    Validate and sanitize uploaded resume bytes (see pdf_sanitize.py).
+    The request thread only waits; parsing runs in the pool.
+    Returns SanitizedPdf, raises ValidationError with a candidate-facing
+    message. RESUME_CHECK_WORKERS=0 runs inline (tests, one-off scripts).
+    """
+    options = (settings.RESUME_MAX_PAGES, settings.RESUME_COMPRESS)
+
+    if settings.RESUME_CHECK_WORKERS <= 0:
+        try:
+            return sanitize_pdf(data, *options)
+        except PdfRejected as e:
+            raise ValidationError(str(e))
+
+    executor, slots = get_executor()
+    timeout = settings.RESUME_CHECK_TIMEOUT
+    if not slots.acquire(timeout=timeout):
+        raise ValidationError("We're busy processing resumes. Please try again in a minute.")
+    try:
+        future = executor.submit(sanitize_pdf, data, *options)
+        result = future.result(timeout=timeout)
+    except PdfRejected as e:
+        raise ValidationError(str(e))
+    except TimeoutError:
+        logger.warning(f"Resume check timed out after {timeout}s ({len(data)} bytes)")
+        _reset_executor(executor, terminate=True)
+        raise ValidationError("Resume could not be processed. Please upload a simpler PDF.")
+    except BrokenProcessPool:
+        logger.exception("Resume check pool died")
+        _reset_executor(executor)
+        raise ValidationError("Resume could not be processed. Please upload a simpler PDF.")
+    finally:
+        slots.release()
+
+    if result.removed:
+        logger.info(f"Stripped from resume upload: {', '.join(sorted(set(result.removed)))}")
+    return result
@@ -0,0 +1,115 @@
+# applications/resume_index.py
+
+import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import Count, Q
+
+from applications.models import Application, ResumeText, ResumeKeyword
+from applications.matching import score_applications
+from applications.pdf_text import extract_pdf_text, tokenize
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """
+    One lazily created process pool per web worker.
+    PDF parsing is CPU bound, so it must not run on request threads.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=max(settings.RESUME_EXTRACT_WORKERS, 1)
+            )
+    return _executor
+
+
+# =====================================================
+# Indexing
+# =====================================================
+def index_resume(application_pk, text):
+    """
+    Store extracted text and (re)build the keyword rows for one application.
+    """
+    terms = tokenize(text)
+
+    with transaction.atomic():
+        ResumeText.objects.update_or_create(
+            application_id=application_pk,
+            defaults={"text": text},
+        )
+        ResumeKeyword.objects.filter(application_id=application_pk).delete()
+        ResumeKeyword.objects.bulk_create(
+            [ResumeKeyword(application_id=application_pk, term=t) for t in terms]
+        )
+
+    # Incremental match scoring for the new applicant
+    score_applications(Application.objects.filter(pk=application_pk))
+
+    return len(terms)
+
+
+def _on_extracted(application_pk, future):
+    # Runs on the pool's result thread in the web process -> own DB connection.
+    try:
+        index_resume(application_pk, future.result())
+    except Exception:
+        logger.exception(f"Resume indexing failed for application {application_pk}")
+    finally:
+        connections.close_all()
+
+
+def schedule_resume_indexing(application_pk, data):
+    """
+    Called after a new application is saved (incremental indexing).
+    Returns immediately; extraction + indexing happen in the background.
+    RESUME_EXTRACT_WORKERS=0 runs inline (tests, one-off scripts).
+    """
+    if settings.RESUME_EXTRACT_WORKERS <= 0:
+        return index_resume(application_pk, extract_pdf_text(data))
+
+    future = get_executor().submit(extract_pdf_text, data)
+    future.add_done_callback(partial(_on_extracted, application_pk))
+    return future
+
+
+# =====================================================
+# Search
+# =====================================================
+def search_applications(qs, query):
+    """
+    Filter an application queryset by candidate name OR resume keywords.
+    Every query term must appear in the resume (AND semantics).
+    `qs` is already scoped to one recruiter, so the keyword lookup is too.
+    """
+    query = query.strip()
+    if not query:
+        return qs
+
+    name_match = Q(full_name__icontains=query)
+    terms = tokenize(query)
+
+    if not terms:
+        return qs.filter(name_match)
+
+    matching = (
+        ResumeKeyword.objects.filter(
+            term__in=terms,
+            application__in=qs.values("pk"),
+        )
+        .values("application")
+        .annotate(hits=Count("id"))
+        .filter(hits=len(terms))
+        .values("application")
+    )
+
+    return qs.filter(name_match | Q(pk__in=matching))
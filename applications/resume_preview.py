@@ -0,0 +1,103 @@
+# applications/resume_preview.py
+#
+# Resumes sit in a private bucket. Pages never embed a permanent URL:
+# they get signed URLs valid for RESUME_SIGNED_URL_TTL seconds, cached
+# per stored file for 80% of that, so a cached URL always has time left
+# and a list page costs at most one signing call for all its rows.
+#
+# Thumbnails (first page, PNG) are rendered once per ResumeBlob in the
+# resume extraction process pool and stored next to the PDF.
+
+import logging
+from functools import partial
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connections
+
+from applications.models import ResumeBlob
+from applications.pdf_render import render_thumbnail
+from applications.resume_index import get_executor
+from applications.resume_store import storage_backend, thumbnail_path
+
+logger = logging.getLogger(__name__)
+
+SIGNED_URL_KEY = "resume:signed:{}"
+
+
+# =====================================================
+# Signed URLs
+# =====================================================
+def signed_urls(paths):
+    """{path: signed URL}; cache first, one backend call for the rest."""
+    paths = {path for path in paths if path}
+    if not paths:
+        return {}
+
+    keys = {SIGNED_URL_KEY.format(path): path for path in paths}
+    urls = {keys[key]: url for key, url in cache.get_many(keys).items()}
+
+    missing = [path for path in paths if path not in urls]
+    if missing:
+        ttl = settings.RESUME_SIGNED_URL_TTL
+        fresh = storage_backend().signed_resume_urls(missing, ttl)
+        cache.set_many(
+            {SIGNED_URL_KEY.format(path): url for path, url in fresh.items()},
+            int(ttl * 0.8),
+        )
+        urls.update(fresh)
+    return urls
+
+
+def attach_thumbnail_urls(applications):
+    """
+    Set `thumbnail_url` (signed, or None) on each application.
+    Expects resume_blob to be select_related.
+    """
+    applications = list(applications)
+    urls = signed_urls(
+        app.resume_blob.thumbnail_path for app in applications if app.resume_blob_id
+    )
+    for app in applications:
+        blob = app.resume_blob if app.resume_blob_id else None
+        app.thumbnail_url = urls.get(blob.thumbnail_path) if blob else None
+    return applications
+
+
+# =====================================================
+# Thumbnails
+# =====================================================
+def save_thumbnail(blob_pk, sha256, png):
+    if not png:
+        return None
+    path = thumbnail_path(sha256)
+    storage_backend().upload_resume(
+        SimpleUploadedFile(f"{sha256}.png", png, content_type="image/png"), path
+    )
+    ResumeBlob.objects.filter(pk=blob_pk).update(thumbnail_path=path)
+    return path
+
+
+def _on_rendered(blob_pk, sha256, future):
+    # Runs on the pool's result thread in the web process -> own DB connection.
+    try:
+        save_thumbnail(blob_pk, sha256, future.result())
+    except Exception:
+        logger.exception(f"Thumbnail failed for resume blob {blob_pk}")
+    finally:
+        connections.close_all()
+
+
+def schedule_thumbnail(blob, data):
+    """
+    Render the first page of a newly stored resume in the background.
+    RESUME_EXTRACT_WORKERS=0 runs inline (tests, one-off scripts).
+    """
+    width = settings.RESUME_THUMBNAIL_WIDTH
+    if settings.RESUME_EXTRACT_WORKERS <= 0:
+        return save_thumbnail(blob.pk, blob.sha256, render_thumbnail(data, width))
+
+    future = get_executor().submit(render_thumbnail, data, width)
+    future.add_done_callback(partial(_on_rendered, blob.pk, blob.sha256))
+    return future
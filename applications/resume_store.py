@@ -0,0 +1,191 @@
+# applications/resume_store.py
+#
+# Content-addressed resume storage: a file is stored once under the
+# SHA-256 of its bytes and shared by every application that uploads the
+# same resume (same candidate, many jobs). ResumeBlob.ref_count tracks
+# the applications using it; blobs at 0 refs are deleted by
+# collect_resume_blobs() after RESUME_BLOB_GC_GRACE seconds.
+#
+# Refcount changes are single UPDATE ... SET ref_count = ref_count +/- 1
+# statements in the caller's transaction, so a rolled-back apply leaves
+# the count untouched.
+
+import hashlib
+import logging
+from datetime import timedelta
+from importlib import import_module
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Case, Count, F, OuterRef, Subquery, Value, When
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from applications.models import Application, ResumeBlob
+from core.scheduler import run_periodically
+
+logger = logging.getLogger(__name__)
+
+
+def file_digest(file):
+    """Streaming SHA-256 and size of an uploaded file (chunked reads)."""
+    digest = hashlib.sha256()
+    size = 0
+    file.seek(0)
+    for chunk in file.chunks():
+        digest.update(chunk)
+        size += len(chunk)
+    file.seek(0)
+    return digest.hexdigest(), size
+
+
+def storage_backend():
+    """Module with upload/delete/download_resume + signed_resume_urls."""
+    return import_module(settings.RESUME_STORAGE_BACKEND)
+
+
+def blob_path(sha256):
+    return f"sha256/{sha256[:2]}/{sha256}.pdf"
+
+
+def thumbnail_path(sha256):
+    return f"sha256/{sha256[:2]}/{sha256}.png"
+
+
+def _claim(sha256):
+    return ResumeBlob.objects.filter(sha256=sha256).update(
+        ref_count=F("ref_count") + 1, unreferenced_at=None
+    )
+
+
+def stage_resume(file):
+    """
+    Upload `file` unless these bytes are stored already. Call before the
+    transaction that runs store_resume(): the blob row is committed here
+    at 0 refs, so if that transaction rolls back the file is left to
+    collect_resume_blobs() instead of being orphaned in storage.
+    """
+    sha256, size = file_digest(file)
+
+    # Restart the GC grace period of an unreferenced blob we're about to claim
+    if ResumeBlob.objects.filter(sha256=sha256, ref_count=0).update(unreferenced_at=timezone.now()):
+        return
+    if ResumeBlob.objects.filter(sha256=sha256).exists():
+        return
+
+    path = blob_path(sha256)
+    storage_backend().upload_resume(file, path)
+    try:
+        ResumeBlob.objects.create(
+            sha256=sha256, size=size, path=path, ref_count=0, unreferenced_at=timezone.now()
+        )
+    except IntegrityError:
+        pass  # same bytes staged concurrently
+
+
+def store_resume(file):
+    """
+    Return the ResumeBlob for `file` with one more reference taken,
+    uploading only when these bytes have never been stored (when
+    stage_resume() wasn't called first).
+    Call inside the transaction that links the blob to the application.
+    """
+    sha256, size = file_digest(file)
+
+    if _claim(sha256):
+        return ResumeBlob.objects.get(sha256=sha256)
+
+    path = blob_path(sha256)
+    storage_backend().upload_resume(file, path)
+    try:
+        with transaction.atomic():
+            return ResumeBlob.objects.create(sha256=sha256, size=size, path=path, ref_count=1)
+    except IntegrityError:
+        # Same bytes uploaded concurrently: the other request created the row
+        _claim(sha256)
+        return ResumeBlob.objects.get(sha256=sha256)
+
+
+def release_blobs(blob_ids):
+    """Drop one reference per id (repeats allowed); stamp blobs that hit 0."""
+    counts = {}
+    for blob_id in blob_ids:
+        if blob_id is not None:
+            counts[blob_id] = counts.get(blob_id, 0) + 1
+
+    now = timezone.now()
+    for blob_id, n in counts.items():
+        ResumeBlob.objects.filter(pk=blob_id, ref_count__gte=n).update(
+            ref_count=F("ref_count") - n,
+            unreferenced_at=Case(
+                When(ref_count=n, then=Value(now)),
+                default=F("unreferenced_at"),
+            ),
+        )
+
+
+# =====================================================
+# Garbage collection
+# =====================================================
+def recount_blobs():
+    """Rebuild every ref_count from Application rows. Returns blobs fixed."""
+    actual = Coalesce(
+        Subquery(
+            Application.objects.filter(resume_blob=OuterRef("pk"))
+            .order_by()
+            .values("resume_blob")
+            .annotate(n=Count("pk"))
+            .values("n")
+        ),
+        0,
+    )
+    fixed = 0
+    for blob in ResumeBlob.objects.annotate(actual=actual).exclude(ref_count=F("actual")):
+        ResumeBlob.objects.filter(pk=blob.pk).update(
+            ref_count=blob.actual,
+            unreferenced_at=None if blob.actual else timezone.now(),
+        )
+        fixed += 1
+    return fixed
+
+
+def collect_resume_blobs(grace=None):
+    """
+    Delete blobs unreferenced for longer than `grace` seconds: row first
+    (locked, re-checked at 0 refs), then the stored file, then commit. An
+    apply that claims the blob meanwhile waits on the row lock and, finding
+    it gone, uploads the file again. Returns the number of blobs deleted.
+    """
+    grace = settings.RESUME_BLOB_GC_GRACE if grace is None else grace
+    cutoff = timezone.now() - timedelta(seconds=grace)
+    candidates = list(
+        ResumeBlob.objects.filter(ref_count=0, unreferenced_at__lt=cutoff)
+        .values_list("pk", flat=True)
+    )
+
+    deleted = 0
+    for pk in candidates:
+        with transaction.atomic():
+            blob = (
+                ResumeBlob.objects.select_for_update()
+                .filter(pk=pk, ref_count=0, unreferenced_at__lt=cutoff)
+                .first()
+            )
+            if blob is None or Application.objects.filter(resume_blob=blob).exists():
+                continue
+            try:
+                backend = storage_backend()
+                backend.delete_resume(blob.path)
+                if blob.thumbnail_path:
+                    backend.delete_resume(blob.thumbnail_path)
+            except Exception:
+                logger.exception(f"Could not delete resume file {blob.path}")
+                continue
+            blob.delete()
+            deleted += 1
+    return deleted
+
+
+def start_blob_gc_scheduler():
+    """Daemon thread per web worker when RESUME_BLOB_GC_INTERVAL > 0."""
+    return run_periodically("resume-blob-gc", settings.RESUME_BLOB_GC_INTERVAL, collect_resume_blobs)
@@ -0,0 +1,23 @@
+# applications/signals.py
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from applications.models import Application, ApplicationStatusEvent
+from applications.realtime import publish_status_events
+from applications.resume_store import release_blobs
+
+
+@receiver(post_save, sender=ApplicationStatusEvent)
+def push_status_event(sender, instance, created, **kwargs):
+    # New application or single status change -> live pages (SSE)
+    if created:
+        transaction.on_commit(lambda: publish_status_events([instance]))
+
+
+@receiver(post_delete, sender=Application)
+def release_resume_blob(sender, instance, **kwargs):
+    # Stored file is shared; collect_resume_blobs() removes it at 0 refs
+    if instance.resume_blob_id is not None:
+        release_blobs([instance.resume_blob_id])
@@ -0,0 +1,152 @@
+# applications/status.py
+#
+# Every status change goes through here so Application.status and the
+# append-only ApplicationStatusEvent log never disagree: the UPDATE and
+# the event INSERT share one transaction. So does the candidate's
+# "status changed" digest entry (notifications/digest.py) when the
+# caller passes `site_url`, the base of the tracking link in the email;
+# scripts and backfills pass none and notify nobody.
+
+from django.db import transaction
+from django.urls import reverse
+from django.utils import timezone
+
+from analytics.series import bump_series_version
+from applications.models import STATUS_CHOICES, Application, ApplicationStatusEvent
+from applications.realtime import publish_status_events
+from applications.tracking import invalidate_tracking
+from jobs.models import Job
+from notifications.digest import notify_many
+
+VALID_STATUSES = {value for value, _ in STATUS_CHOICES}
+STATUS_LABELS = dict(STATUS_CHOICES)
+
+
+def _notify_candidates(site_url, rows, new_status):
+    """rows: (email, full name, job title, tracking token) per changed application."""
+    notify_many("candidate", [
+        (
+            email,
+            "status_changed",
+            {
+                "full_name": full_name,
+                "job_title": job_title,
+                "status": STATUS_LABELS[new_status],
+                "track_url": site_url.rstrip("/") + reverse("track_application", args=[token]),
+            },
+        )
+        for email, full_name, job_title, token in rows
+    ])
+
+
+def change_status(application, new_status, changed_by=None, site_url=None):
+    """
+    Move one application to `new_status`. Returns the old status, or
+    None when nothing changed. Raises ValueError for unknown statuses.
+    """
+    if new_status not in VALID_STATUSES:
+        raise ValueError(f"Invalid status: {new_status}")
+
+    with transaction.atomic():
+        # Row lock: two recruiters clicking at once still log a clean chain
+        old_status, token = (
+            Application.objects.select_for_update()
+            .values_list("status", "tracking_token")
+            .get(pk=application.pk)
+        )
+        if old_status == new_status:
+            application.status = new_status
+            return None
+
+        Application.objects.filter(pk=application.pk).update(status=new_status)
+        ApplicationStatusEvent.objects.create(
+            application_id=application.pk,
+            job_id=application.job_id,
+            from_status=old_status,
+            to_status=new_status,
+            changed_by=changed_by,
+        )
+        if site_url:
+            _notify_candidates(
+                site_url,
+                [(application.email, application.full_name, application.job.title, token)],
+                new_status,
+            )
+        # After commit, so a concurrent poll cannot re-cache the old status
+        transaction.on_commit(lambda: invalidate_tracking([token]))
+
+    application.status = new_status
+    return old_status
+
+
+def bulk_change_status(queryset, new_status, changed_by=None, site_url=None):
+    """
+    Move every application in `queryset` to `new_status`:
+    one UPDATE + one bulk INSERT of events (and of notifications).
+    Returns the number changed.
+    """
+    if new_status not in VALID_STATUSES:
+        raise ValueError(f"Invalid status: {new_status}")
+
+    with transaction.atomic():
+        rows = list(
+            queryset.select_for_update()
+            .exclude(status=new_status)
+            .values_list("id", "job_id", "status", "tracking_token", "email", "full_name")
+        )
+        if not rows:
+            return 0
+
+        Application.objects.filter(id__in=[row[0] for row in rows]).update(
+            status=new_status
+        )
+        now = timezone.now()
+        events = ApplicationStatusEvent.objects.bulk_create(
+            [
+                ApplicationStatusEvent(
+                    application_id=app_id,
+                    job_id=job_id,
+                    from_status=old_status,
+                    to_status=new_status,
+                    changed_by=changed_by,
+                    created_at=now,
+                )
+                for app_id, job_id, old_status, *_ in rows
+            ],
+            batch_size=1000,
+        )
+        if site_url:
+            titles = dict(Job.objects.filter(id__in={row[1] for row in rows}).values_list("id", "title"))
+            _notify_candidates(
+                site_url,
+                [(email, name, titles[job_id], token) for _, job_id, _, token, email, name in rows],
+                new_status,
+            )
+        transaction.on_commit(lambda: invalidate_tracking([row[3] for row in rows]))
+        # bulk_create sends no post_save -> push to live pages here
+        transaction.on_commit(lambda: publish_status_events(events))
+
+    # bulk_create sends no post_save -> invalidate chart responses here
+    bump_series_version()
+    return len(rows)
+
+
+def timeline(application):
+    """
+    Status history in one query, oldest first, each entry with the time
+    spent in that stage (until the next event, or until now).
+    """
+    events = list(
+        application.status_events.select_related("changed_by").order_by("created_at", "id")
+    )
+    now = timezone.now()
+    return [
+        {
+            "event": event,
+            "status": event.get_to_status_display(),
+            "entered_at": event.created_at,
+            "left_at": events[i + 1].created_at if i + 1 < len(events) else now,
+            "is_current": i + 1 == len(events),
+        }
+        for i, event in enumerate(events)
+    ]
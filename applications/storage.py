@@ -1,9 +1,50 @@
-import uuid
-from django.conf import settings
-from django.core.files.storage import default_storage
+# applications/storage.py
+#
+# Local stand-in for the private Supabase bucket (development, tests,
+# benchmarks); same functions as applications/supabase_client.py.
+# Files live in STORAGES["resumes"], outside MEDIA_ROOT, and a "signed
+# URL" is an expiring signed token served by views.recruiter.resume_file.
 
+import time
 
-def upload_resume(file, job_slug):
-    filename = f"resumes/{job_slug}/{uuid.uuid4()}_{file.name}"
-    path = default_storage.save(filename, file)
-    return default_storage.url(path)
+from django.core import signing
+from django.core.files.storage import storages
+from django.urls import reverse
+
+SIGNING_SALT = "applications.storage.resume_file"
+
+
+def upload_resume(file, path):
+    # Content-addressed path: an existing file already has these bytes
+    storage = storages["resumes"]
+    if not storage.exists(path):
+        storage.save(path, file)
+
+
+def delete_resume(path):
+    storages["resumes"].delete(path)
+
+
+def download_resume(path):
+    with storages["resumes"].open(path) as f:
+        return f.read()
+
+
+def signed_resume_urls(paths, expires_in):
+    expires = int(time.time()) + expires_in
+    return {
+        path: reverse("resume_file", args=[signing.dumps([path, expires], salt=SIGNING_SALT)])
+        for path in paths
+    }
+
+
+def open_signed(token):
+    """(file, seconds left) for a valid unexpired token, else None."""
+    try:
+        path, expires = signing.loads(token, salt=SIGNING_SALT)
+    except signing.BadSignature:
+        return None
+    remaining = expires - int(time.time())
+    if remaining <= 0 or not storages["resumes"].exists(path):
+        return None
+    return storages["resumes"].open(path), remaining
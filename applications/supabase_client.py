@@ -1,6 +1,6 @@
 from supabase import create_client
+from io import BufferedReader, FileIO
 import os
-import uuid
 
 
 BUCKET = os.getenv("SUPABASE_BUCKET", "resumes")
@@ -16,25 +16,49 @@ def get_supabase_client():
     return create_client(url, key)
 
 
-def upload_resume(file, job_slug):
-    supabase = get_supabase_client()
+# Resume files live in a PRIVATE bucket: read access only through
+# short-lived signed URLs (applications/resume_preview.py).
 
-    ext = file.name.split(".")[-1].lower()
-    filename = f"{job_slug}/{uuid.uuid4()}.{ext}"
+def upload_resume(file, path):
+    """
+    Store `file` under `path`. Paths are content hashes
+    (applications/resume_store.py), so overwriting an existing object
+    rewrites the same bytes.
+    """
+    supabase = get_supabase_client()
 
     file.seek(0)
-    file_bytes = file.read()
+    # A file opened from disk (resume archive parts) is streamed by the
+    # client in chunks; anything else (uploads) is read into memory
+    body = getattr(file, "file", file)
+    if not isinstance(body, (BufferedReader, FileIO)):
+        body = file.read()
 
     try:
         supabase.storage.from_(BUCKET).upload(
-            path=filename,
-            file=file_bytes,
+            path=path,
+            file=body,
             file_options={
-                "content-type": "application/pdf",
-                "x-upsert": "false",
+                "content-type": getattr(file, "content_type", None) or "application/pdf",
+                "x-upsert": "true",
             },
         )
     except Exception as e:
         raise Exception(f"Supabase upload failed: {e}")
 
-    return supabase.storage.from_(BUCKET).get_public_url(filename)
\ No newline at end of file
+
+def delete_resume(path):
+    supabase = get_supabase_client()
+    supabase.storage.from_(BUCKET).remove([path])
+
+
+def download_resume(path):
+    supabase = get_supabase_client()
+    return supabase.storage.from_(BUCKET).download(path)
+
+
+def signed_resume_urls(paths, expires_in):
+    """{path: signed URL} for `paths`, one API call for all of them."""
+    supabase = get_supabase_client()
+    items = supabase.storage.from_(BUCKET).create_signed_urls(list(paths), expires_in)
+    return {item["path"]: item["signedURL"] for item in items if item.get("signedURL")}
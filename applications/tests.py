@@ -1,3 +1,674 @@
-from django.test import TestCase
+import io
+import shutil
+import tempfile
+import threading
+import time
+import zipfile
+from collections import Counter
+from datetime import timedelta
+from pathlib import Path
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.db import IntegrityError, connection
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.core.files import File
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import Client, SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+from pypdf import PdfReader, PdfWriter
+from pypdf.actions import JavaScript
+from rest_framework.authtoken.models import Token
+
+from applications import duplicates
+from applications.duplicates import BloomFilter, email_key, flag_if_repeat
+from applications.forms import ApplicationForm
+from applications.management.commands._pdf_samples import make_text_pdf, sample_resume_pdf
+from applications.matching import score_applications, score_pairs, sort_by_match
+from applications.models import (
+    Application, IdempotencyKey, ResumeArchive, ResumeBlob, ResumeKeyword, ResumeText,
+)
+from applications.pdf_sanitize import PdfRejected, sanitize_pdf
+from applications.resume_archive import archive_entries, build_archive, fetch_resume, job_resumes, resume_archives
+from applications.resume_check import _reset_executor, check_resume, get_executor
+from applications.resume_index import schedule_resume_indexing, search_applications
+from applications.resume_preview import schedule_thumbnail
+from applications.resume_store import collect_resume_blobs, store_resume
+from applications.status import bulk_change_status, change_status
+from jobs.models import Job
+from notifications.models import NotificationEvent
+from users.models import User
+
+
+def hang(*args):
+    # Stands in for sanitize_pdf stuck on a pathological file
+    time.sleep(60)
+
+
+def with_active_content(data):
+    writer = PdfWriter(clone_from=PdfReader(io.BytesIO(data)))
+    writer.add_open_action(JavaScript("app.alert('hi');"))
+    writer.add_attachment("payload.exe", b"MZ" * 100)
+    out = io.BytesIO()
+    writer.write(out)
+    return out.getvalue()
+
+
+class ResumeSanitizeTests(SimpleTestCase):
+
+    def test_strips_javascript_and_attachments_keeps_text(self):
+        original = sample_resume_pdf(1, pages=2)
+        result = sanitize_pdf(with_active_content(original), max_pages=10)
+
+        self.assertEqual(result.pages, 2)
+        self.assertIn("/JavaScript", result.removed)
+        self.assertIn("/EmbeddedFiles", result.removed)
+
+        reader = PdfReader(io.BytesIO(result.data))
+        self.assertNotIn("/Names", reader.trailer["/Root"])
+        self.assertEqual(
+            reader.pages[0].extract_text(),
+            PdfReader(io.BytesIO(original)).pages[0].extract_text(),
+        )
+
+    def test_rejects_non_pdf_truncated_and_too_long(self):
+        data = sample_resume_pdf(2, pages=3)
+        cases = [
+            (b"MZ\x90\x00 not a pdf", "not a PDF"),
+            (data[: len(data) // 2], "incomplete"),
+        ]
+        for payload, message in cases:
+            with self.assertRaisesMessage(PdfRejected, message):
+                sanitize_pdf(payload, max_pages=10)
+
+        with self.assertRaisesMessage(PdfRejected, "longer than 2 pages"):
+            sanitize_pdf(data, max_pages=2)
+
+    @override_settings(RESUME_CHECK_WORKERS=0)
+    def test_form_stores_sanitized_copy(self):
+        upload = SimpleUploadedFile(
+            "cv.pdf", with_active_content(sample_resume_pdf(3)), content_type="application/octet-stream"
+        )
+        form = ApplicationForm(
+            data={"full_name": "Asha Rao", "email": "asha@example.com", "phone": "9876543210"},
+            files={"resume": upload},
+        )
+
+        self.assertTrue(form.is_valid(), form.errors)
+        resume = form.cleaned_data["resume"]
+        self.assertEqual(resume.content_type, "application/pdf")
+        self.assertNotIn(b"/JavaScript", resume.read())
+
+
+@override_settings(RESUME_CHECK_WORKERS=1, RESUME_CHECK_TIMEOUT=2)
+class ResumeCheckPoolTests(SimpleTestCase):
+
+    def setUp(self):
+        self.addCleanup(lambda: _reset_executor(get_executor()[0], terminate=True))
+
+    def test_hung_parse_does_not_block_next_check(self):
+        with mock.patch("applications.resume_check.sanitize_pdf", hang):
+            with self.assertLogs("applications.resume_check", "WARNING"):
+                with self.assertRaisesMessage(ValidationError, "could not be processed"):
+                    check_resume(sample_resume_pdf(4))
+
+        # The only worker was stuck: without a fresh pool this times out too
+        result = check_resume(sample_resume_pdf(4))
+        self.assertEqual(result.pages, 1)
+
+
+class LocalStorageMixin:
+    """Resume files go to a throwaway STORAGES["resumes"] directory."""
+
+    def setUp(self):
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+        storages_setting = {
+            **settings.STORAGES,
+            "resumes": {"BACKEND": "django.core.files.storage.FileSystemStorage", "OPTIONS": {"location": root}},
+        }
+        overrides = override_settings(
+            STORAGES=storages_setting,
+            RESUME_STORAGE_BACKEND="applications.storage",
+            RESUME_EXTRACT_WORKERS=0,
+        )
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+        self.root = Path(root)
+        cache.clear()
+
+    def stored_files(self):
+        return sorted(p.suffix for p in self.root.rglob("*") if p.is_file())
+
+    def apply(self, job, email, data):
+        blob = store_resume(SimpleUploadedFile("cv.pdf", data))
+        return Application.objects.create(
+            job=job, full_name="Asha Rao", email=email, phone="9876543210", resume_blob=blob,
+        )
+
+
+class LocalStorageTestCase(LocalStorageMixin, TestCase):
+    pass
+
+
+class ResumeStoreTests(LocalStorageTestCase):
+
+    def test_same_file_is_stored_once_and_collected_at_zero_refs(self):
+        jobs = [
+            Job.objects.create(title=f"Job {i}", description="x", location="Pune", work_mode="onsite")
+            for i in range(3)
+        ]
+        resume = sample_resume_pdf(4)
+        applications = [self.apply(job, "asha@example.com", resume) for job in jobs]
+        self.apply(jobs[0], "other@example.com", sample_resume_pdf(5))
+
+        self.assertEqual(self.stored_files(), [".pdf", ".pdf"])
+        blob = applications[0].resume_blob
+        self.assertEqual({a.resume_blob_id for a in applications}, {blob.pk})
+        self.assertEqual(ResumeBlob.objects.get(pk=blob.pk).ref_count, 3)
+
+        applications[0].delete()
+        applications[1].delete()
+        self.assertEqual(collect_resume_blobs(grace=0), 0)
+
+        applications[2].delete()
+        blob.refresh_from_db()
+        self.assertEqual(blob.ref_count, 0)
+        self.assertIsNotNone(blob.unreferenced_at)
+
+        self.assertEqual(collect_resume_blobs(grace=0), 1)
+        self.assertEqual(self.stored_files(), [".pdf"])
+        self.assertEqual(ResumeBlob.objects.count(), 1)
+
+    @override_settings(RESUME_CHECK_WORKERS=0)
+    def test_rolled_back_apply_leaves_blob_for_gc(self):
+        job = Job.objects.create(title="Backend", description="x", location="Pune", work_mode="onsite")
+        with mock.patch("applications.views.public.enqueue_email", side_effect=RuntimeError("down")):
+            with self.assertLogs("applications.views.public", "ERROR"):
+                response = self.client.post(reverse("apply_job", args=[job.slug]), {
+                    "full_name": "Asha Rao",
+                    "email": "asha@example.com",
+                    "phone": "9876543210",
+                    "resume": SimpleUploadedFile("cv.pdf", sample_resume_pdf(7), content_type="application/pdf"),
+                })
+
+        self.assertContains(response, "Resume upload failed")
+        self.assertFalse(Application.objects.exists())
+        blob = ResumeBlob.objects.get()
+        self.assertEqual(blob.ref_count, 0)
+        self.assertEqual(self.stored_files(), [".pdf"])
+
+        self.assertEqual(collect_resume_blobs(grace=0), 1)
+        self.assertEqual(self.stored_files(), [])
+
+
+class ResumePreviewTests(LocalStorageTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.recruiter = User.objects.create_user(
+            email="rec@example.com", password="pw-12345!", role="RECRUITER", is_active=True
+        )
+        job = Job.objects.create(
+            title="Backend", description="x", location="Pune", work_mode="onsite", created_by=self.recruiter,
+        )
+        data = sample_resume_pdf(6)
+        self.app = self.apply(job, "asha@example.com", data)
+        schedule_thumbnail(self.app.resume_blob, data)
+        self.client.force_login(self.recruiter)
+
+    def test_detail_page_shows_signed_thumbnail(self):
+        response = self.client.get(reverse("recruiter_application_detail", args=[self.app.pk]))
+        thumbnail = response.context["app"].thumbnail_url
+
+        self.assertContains(response, thumbnail)
+        image = self.client.get(thumbnail)
+        self.assertEqual(image["Content-Type"], "image/png")
+        self.assertTrue(b"".join(image.streaming_content).startswith(b"\x89PNG"))
+
+    def test_preview_redirects_to_signed_pdf_url_that_expires(self):
+        response = self.client.get(reverse("preview_resume", args=[self.app.pk]))
+        self.assertEqual(self.client.get(response.url)["Content-Type"], "application/pdf")
+
+        self.client.logout()  # the signature is the credential
+        self.assertEqual(self.client.get(response.url).status_code, 200)
+        self.assertEqual(self.client.get(response.url[:-3] + "xx/").status_code, 404)
+        with mock.patch("time.time", return_value=time.time() + settings.RESUME_SIGNED_URL_TTL + 1):
+            self.assertEqual(self.client.get(response.url).status_code, 404)
+
+
+class ResumeArchiveTests(LocalStorageTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.recruiter = User.objects.create_user(
+            email="rec@example.com", password="pw-12345!", role="RECRUITER", is_active=True
+        )
+        self.job = Job.objects.create(
+            title="Backend", description="x", location="Pune", work_mode="onsite", created_by=self.recruiter,
+        )
+        self.apps = [self.apply(self.job, f"c{i}@example.com", sample_resume_pdf(i)) for i in range(5)]
+        self.client.force_login(self.recruiter)
+
+    def test_download_streams_zip_and_lists_missing_files(self):
+        (self.root / self.apps[1].resume_blob.path).unlink()
+
+        url = reverse("download_job_resumes", args=[self.job.id])
+        self.assertEqual(self.client.get(url).status_code, 405)
+
+        response = self.client.post(url)
+        self.assertEqual(response["Content-Type"], "application/zip")
+        with self.assertLogs("applications.resume_archive", "WARNING"):
+            archive = zipfile.ZipFile(io.BytesIO(b"".join(response.streaming_content)))
+
+        self.assertEqual(archive.testzip(), None)
+        self.assertEqual(len(archive.namelist()), 5)
+        missing = archive.read("_missing.txt").decode()
+        self.assertIn(self.apps[1].application_id, missing)
+        self.assertEqual(
+            archive.read(f"{self.apps[0].pk}_{self.apps[0].application_id}_asha-rao.pdf"), sample_resume_pdf(0)
+        )
+
+    @override_settings(RESUME_ARCHIVE_STREAM_LIMIT=2, RESUME_ARCHIVE_PART_SIZE=2)
+    def test_large_job_archive_resumes_after_interrupted_build(self):
+        url = reverse("download_job_resumes", args=[self.job.id])
+        response = self.client.post(url)
+        archive = ResumeArchive.objects.get()
+        self.assertRedirects(response, reverse("resume_archive_status", args=[archive.pk]))
+
+        # Asking again while it builds returns the same archive
+        self.assertRedirects(self.client.post(url), reverse("resume_archive_status", args=[archive.pk]))
+        self.assertEqual(ResumeArchive.objects.count(), 1)
+
+        calls = []
+
+        def crash_on_third(entry):
+            calls.append(entry)
+            if len(calls) == 3:
+                raise SystemExit  # worker killed mid-build
+            return fetch_resume(entry)
+
+        with self.assertRaises(SystemExit):
+            build_archive(archive.pk, fetch=crash_on_third)
+        archive.refresh_from_db()
+        self.assertEqual((archive.status, len(archive.parts)), ("building", 1))
+
+        ResumeArchive.objects.filter(pk=archive.pk).update(
+            updated_at=archive.updated_at - timedelta(seconds=settings.RESUME_ARCHIVE_STALE + 1)
+        )
+        self.assertEqual(resume_archives(), (1, 0))
+
+        archive.refresh_from_db()
+        self.assertEqual(archive.status, "ready")
+        self.assertEqual([part["count"] for part in archive.parts], [2, 2, 1])
+
+        page = self.client.get(reverse("resume_archive_status", args=[archive.pk]))
+        names = []
+        for part in page.context["parts"]:
+            content = b"".join(self.client.get(part["url"]).streaming_content)
+            names += zipfile.ZipFile(io.BytesIO(content)).namelist()
+        self.assertEqual(sorted(names), sorted(f"{a.pk}_{a.application_id}_asha-rao.pdf" for a in self.apps))
+
+    def test_entry_names_unique_when_application_ids_repeat(self):
+        Application.objects.filter(job=self.job).update(application_id="APP-1")
+
+        entries = archive_entries(job_resumes(self.job))
+        self.assertEqual(len({name for name, _, _ in entries}), 5)
+
+    def test_supabase_upload_streams_files_from_disk(self):
+        from applications import supabase_client
+
+        with mock.patch.object(supabase_client, "get_supabase_client") as client:
+            upload = client.return_value.storage.from_.return_value.upload
+            with tempfile.NamedTemporaryFile() as tmp, open(tmp.name, "rb") as data:
+                supabase_client.upload_resume(File(data), "archives/1/part-001.zip")
+                self.assertIs(upload.call_args.kwargs["file"], data)
+
+            supabase_client.upload_resume(SimpleUploadedFile("cv.pdf", b"%PDF-1.7"), "sha256/ab/ab.pdf")
+            self.assertEqual(upload.call_args.kwargs["file"], b"%PDF-1.7")
+
+
+@override_settings(REPEAT_APPLICANT_DETECTION=True, REPEAT_APPLICANT_FILTER_CAPACITY=1000)
+class RepeatApplicantTests(TestCase):
+
+    def setUp(self):
+        self.jobs = [
+            Job.objects.create(title=f"Job {i}", description="x", location="Pune", work_mode="onsite")
+            for i in range(2)
+        ]
+        patcher = mock.patch.multiple(duplicates, _filter=None, _built_at=0.0, _rebuild_keys=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def make(self, job, email, phone):
+        return Application.objects.create(job=job, full_name="Asha Rao", email=email, phone=phone)
+
+    def test_bloom_filter_has_no_false_negatives(self):
+        bloom = BloomFilter(1000)
+        keys = [email_key(f"c{i}@example.com") for i in range(1000)]
+        for key in keys:
+            bloom.add(key)
+
+        self.assertTrue(all(key in bloom for key in keys))
+        unseen = sum(email_key(f"new{i}@example.com") in bloom for i in range(10_000))
+        self.assertLess(unseen, 300)  # ~1% target false positive rate
+
+    def test_flags_same_email_or_phone_on_other_job(self):
+        first = self.make(self.jobs[0], "asha@example.com", "9876543210")
+        self.assertFalse(flag_if_repeat(first))
+
+        again = self.make(self.jobs[1], "other@example.com", "9876543210")
+        self.assertTrue(flag_if_repeat(again))
+        first.refresh_from_db()
+        self.assertTrue(first.is_repeat_applicant)
+
+        other = self.make(self.jobs[1], "new@example.com", "9000000000")
+        self.assertFalse(flag_if_repeat(other))
+
+    def test_api_apply_succeeds_when_check_fails(self):
+        with mock.patch("api.views.flag_if_repeat", side_effect=RuntimeError("boom")):
+            with self.assertLogs("api.views", "ERROR"):
+                response = self.client.post(
+                    f"/api/apply/{self.jobs[0].slug}/",
+                    {"full_name": "Asha Rao", "email": "asha@example.com", "phone": "9876543210"},
+                )
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(Application.objects.filter(email="asha@example.com").exists())
+
+    @override_settings(REPEAT_APPLICANT_FILTER_REFRESH=0)
+    def test_stale_filter_is_rebuilt_in_background(self):
+        current = duplicates.get_filter()
+        release = threading.Event()
+
+        def slow_build():
+            release.wait(5)
+            return BloomFilter(1000)
+
+        with mock.patch("applications.duplicates._build_filter", slow_build):
+            self.assertIs(duplicates.get_filter(), current)  # doesn't wait for the build
+            flag_if_repeat(self.make(self.jobs[0], "late@example.com", "9111111111"))
+            release.set()
+            for thread in threading.enumerate():
+                if thread.name == "repeat-applicant-filter":
+                    thread.join()
+
+        self.assertIsNot(duplicates._filter, current)
+        self.assertIn(email_key("late@example.com"), duplicates._filter)
+
+
+class ApplicationStatusTests(TestCase):
+
+    def setUp(self):
+        self.recruiter = User.objects.create_user(
+            email="rec@example.com", password="pw-12345!", role="RECRUITER", is_active=True
+        )
+        self.job = Job.objects.create(
+            title="Backend", description="x", location="Pune", work_mode="onsite", created_by=self.recruiter,
+        )
+        self.apps = [
+            Application.objects.create(
+                job=self.job, full_name="Asha Rao", email=f"c{i}@example.com", phone="9876543210",
+            )
+            for i in range(3)
+        ]
+
+    def chain(self, application):
+        return list(application.status_events.order_by("id").values_list("from_status", "to_status"))
+
+    def test_change_status_logs_event_and_notifies_candidate(self):
+        app = self.apps[0]
+        self.assertEqual(change_status(app, "interview", changed_by=self.recruiter, site_url="https://hf.test/"), "screening")
+        self.assertIsNone(change_status(app, "interview"))
+        with self.assertRaises(ValueError):
+            change_status(app, "promoted")
+
+        self.assertEqual(Application.objects.get(pk=app.pk).status, "interview")
+        self.assertEqual(self.chain(app), [("", "screening"), ("screening", "interview")])
+        event = NotificationEvent.objects.get()
+        self.assertEqual((event.recipient, event.kind), ("c0@example.com", "status_changed"))
+        self.assertEqual(event.context["track_url"], f"https://hf.test/applications/track/{app.tracking_token}/")
+
+    def test_bulk_change_status_skips_unchanged_and_notifies_once_each(self):
+        change_status(self.apps[0], "rejected")  # no site_url: nobody notified
+
+        changed = bulk_change_status(
+            Application.objects.filter(job=self.job), "rejected", changed_by=self.recruiter, site_url="https://hf.test",
+        )
+        self.assertEqual(changed, 2)
+        self.assertEqual(self.chain(self.apps[1]), [("", "screening"), ("screening", "rejected")])
+        self.assertEqual(len(self.chain(self.apps[0])), 2)
+        self.assertEqual(
+            sorted(NotificationEvent.objects.values_list("recipient", flat=True)),
+            ["c1@example.com", "c2@example.com"],
+        )
+        self.assertEqual(NotificationEvent.objects.first().context["status"], "Rejected")
+
+    def test_status_views_notify_candidates_once(self):
+        self.client.force_login(self.recruiter)
+        self.client.post(reverse("recruiter_status_update", args=[self.apps[0].pk]), {"status": "interview"})
+        self.assertEqual(NotificationEvent.objects.filter(recipient="c0@example.com").count(), 1)
+
+        token = Token.objects.create(user=self.recruiter)
+        response = self.client.post(
+            "/api/applications/bulk-status/",
+            {"ids": [self.apps[0].pk, self.apps[1].pk], "status": "interview"},
+            content_type="application/json",
+            HTTP_AUTHORIZATION=f"Token {token.key}",
+        )
+        self.assertEqual(response.json(), {"updated": 1})
+        self.assertEqual(NotificationEvent.objects.filter(kind="status_changed").count(), 2)
+
+    def test_status_events_are_append_only(self):
+        event = self.apps[0].status_events.get()
+        event.to_status = "hired"
+        with self.assertRaisesMessage(ValueError, "append-only"):
+            event.save()
+
+
+class TrackingTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        job = Job.objects.create(title="Backend", description="x", location="Pune", work_mode="onsite")
+        self.app = Application.objects.create(job=job, full_name="Asha Rao", email="c@example.com", phone="9876543210")
+        self.url = reverse("track_application_status", args=[self.app.tracking_token])
+
+    def test_status_poll_answers_304_from_cache_until_status_changes(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.json()["status"], "screening")
+        etag = response["ETag"]
+        self.assertIn("no-cache", response["Cache-Control"])
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            change_status(self.app, "interview")
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["status_display"], "Interview")
+        self.assertNotEqual(response["ETag"], etag)
+
+        with self.assertLogs("django.request", "WARNING"):
+            response = self.client.get(reverse("track_application_status", args=["nope"]))
+        self.assertEqual(response.status_code, 404)
+
+
+@override_settings(RESUME_EXTRACT_WORKERS=0)
+class ResumeSearchTests(TestCase):
+
+    def setUp(self):
+        self.recruiter = User.objects.create_user(
+            email="rec@example.com", password="pw-12345!", role="RECRUITER", is_active=True
+        )
+        self.job = Job.objects.create(
+            title="Backend", description="x", location="Pune", work_mode="onsite", created_by=self.recruiter,
+        )
+
+    def apply(self, name, lines):
+        app = Application.objects.create(job=self.job, full_name=name, email=f"{name[0]}@example.com", phone="9876543210")
+        schedule_resume_indexing(app.pk, make_text_pdf(lines))
+        return app
+
+    def test_keywords_extracted_from_pdf_are_searchable(self):
+        django_dev = self.apply("Asha Rao", ["Built Django services on PostgreSQL", "Node.js and C++ tooling"])
+        react_dev = self.apply("Ravi Kumar", ["React frontend with TypeScript", "Some Django admin work"])
+
+        self.assertIn("Django services", ResumeText.objects.get(application=django_dev).text)
+        self.assertEqual(
+            set(ResumeKeyword.objects.filter(application=django_dev).values_list("term", flat=True)),
+            {"built", "django", "services", "postgresql", "node.js", "c++", "tooling"},
+        )
+
+        qs = Application.objects.filter(job=self.job)
+        self.assertEqual(set(search_applications(qs, "django")), {django_dev, react_dev})
+        self.assertEqual(list(search_applications(qs, "Django PostgreSQL")), [django_dev])  # every term
+        self.assertEqual(list(search_applications(qs, "ravi")), [react_dev])  # name match
+        self.assertEqual(list(search_applications(qs, "kotlin")), [])
+
+        # Only the recruiter's own applications are searched
+        other = Job.objects.create(title="Other", description="x", location="Pune", work_mode="onsite")
+        self.assertEqual(list(search_applications(Application.objects.filter(job=other), "django")), [])
+
+        self.client.force_login(self.recruiter)
+        response = self.client.get(reverse("recruiter_applications_list"), {"search": "c++"})
+        self.assertEqual(list(response.context["apps_page"]), [django_dev])
+
+
+@override_settings(RESUME_EXTRACT_WORKERS=0)
+class MatchScoreTests(TestCase):
+
+    def setUp(self):
+        cache.clear()  # document frequencies
+        self.job = Job.objects.create(
+            title="Django Developer", description="Python, Django and PostgreSQL backend services",
+            location="Pune", work_mode="onsite",
+        )
+
+    def apply(self, email, lines=None):
+        app = Application.objects.create(job=self.job, full_name="Asha Rao", email=email, phone="9876543210")
+        if lines:
+            schedule_resume_indexing(app.pk, make_text_pdf(lines))
+        return Application.objects.get(pk=app.pk)
+
+    def test_closer_resume_scores_higher_and_sorts_first(self):
+        unscored = self.apply("none@example.com")
+        weak = self.apply("weak@example.com", ["React frontend with TypeScript", "Figma and Excel reporting"])
+        strong = self.apply("strong@example.com", ["Django developer: Python backend services", "PostgreSQL and Redis"])
+
+        self.assertIsNone(unscored.match_score)
+        self.assertEqual(weak.match_score, 0.0)  # no shared terms
+        self.assertGreater(strong.match_score, 0.3)
+        self.assertLessEqual(strong.match_score, 1.0)
+
+        # Same text as the job: cosine similarity of 1
+        self.assertAlmostEqual(float(score_pairs(
+            [Counter({"django": 2, "python": 1})], [Counter({"django": 2, "python": 1})], [0], {}, 0,
+        )[0]), 1.0, places=5)
+
+        self.assertEqual(
+            list(sort_by_match(Application.objects.filter(job=self.job))), [strong, weak, unscored],
+        )
+        self.assertEqual(score_applications(Application.objects.all()), 2)
+
+
+@override_settings(RESUME_CHECK_WORKERS=0)
+class ApplyIdempotencyTests(LocalStorageMixin, TransactionTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.job = Job.objects.create(title="Backend Engineer", description="x", location="Pune", work_mode="onsite")
+        self.resume = sample_resume_pdf(6)
+
+    def post_form(self, key):
+        return Client().post(reverse("apply_job", args=[self.job.slug]), {
+            "full_name": "Asha Rao",
+            "email": "asha@example.com",
+            "phone": "9876543210",
+            "resume": SimpleUploadedFile("cv.pdf", self.resume, content_type="application/pdf"),
+            "idempotency_key": key,
+        })
+
+    def test_concurrent_duplicate_submits_upload_once(self):
+        from applications import storage
+
+        uploads = []
+        upload = storage.upload_resume
+
+        def slow_upload(file, path):
+            uploads.append(Path(path).suffix)
+            time.sleep(0.3)  # repeats arrive while the first is mid-upload
+            upload(file, path)
+
+        barrier = threading.Barrier(5)
+        responses = []
+
+        def double_click():
+            try:
+                barrier.wait()
+                responses.append(self.post_form("form-token-1"))
+            finally:
+                connection.close()
+
+        with mock.patch.object(storage, "upload_resume", side_effect=slow_upload):
+            threads = [threading.Thread(target=double_click) for _ in range(5)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(sorted(uploads), [".pdf", ".png"])  # resume + thumbnail, once
+        self.assertEqual(Application.objects.count(), 1)
+        self.assertEqual([r.status_code for r in responses], [302] * 5)
+        self.assertEqual({r.url for r in responses}, {reverse("application_success")})
+
+        # Same form re-submitted later: replayed, nothing uploaded
+        with mock.patch.object(storage, "upload_resume", side_effect=slow_upload):
+            self.assertRedirects(self.post_form("form-token-1"), reverse("application_success"))
+            # New token (form re-opened): the unique constraint still applies
+            response = self.post_form("form-token-2")
+        self.assertContains(response, "You have already applied for this job.")
+        self.assertEqual(len(uploads), 2)
+
+    def test_failure_after_insert_is_not_reported_as_duplicate(self):
+        from applications.views import public
+
+        with mock.patch.object(public, "enqueue_email", side_effect=IntegrityError("outbox key")), \
+                self.assertLogs("applications.views.public", "ERROR"):
+            response = self.post_form("form-token-1")
+        self.assertNotContains(response, "You have already applied for this job.")
+        self.assertContains(response, "Please try again.")
+        self.assertFalse(Application.objects.exists())
+
+        # Rolled back and the key released: the same form can be sent again
+        self.assertRedirects(self.post_form("form-token-1"), reverse("application_success"))
+        self.assertEqual(Application.objects.count(), 1)
+
+    def test_api_replays_first_response_and_releases_failures(self):
+        url = f"/api/apply/{self.job.slug}/"
+        data = {"full_name": "Asha Rao", "email": "asha@example.com", "phone": "9876543210"}
+        client = Client()
+
+        with self.assertLogs("django.request", "WARNING"):
+            rejected = client.post(url, {**data, "email": "not-an-email"}, HTTP_IDEMPOTENCY_KEY="k1")
+        self.assertEqual(rejected.status_code, 400)
+        self.assertFalse(IdempotencyKey.objects.exists())
+
+        first = client.post(url, data, HTTP_IDEMPOTENCY_KEY="k1")
+        cache.clear()  # replay from the row, as another worker would
+        again = client.post(url, data, HTTP_IDEMPOTENCY_KEY="k1")
+
+        self.assertEqual(first.status_code, 200)
+        self.assertNotIn("Idempotent-Replayed", first)
+        self.assertEqual(again.status_code, 200)
+        self.assertEqual(again["Idempotent-Replayed"], "true")
+        self.assertEqual(again.json(), first.json())
+        self.assertEqual(Application.objects.count(), 1)
+
+        with self.assertLogs("django.request", "WARNING"):
+            duplicate = client.post(url, data)  # no key: plain duplicate
+        self.assertEqual(duplicate.status_code, 400)
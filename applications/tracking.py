@@ -0,0 +1,68 @@
+# applications/tracking.py
+#
+# Public application tracking, looked up by the unguessable
+# tracking_token (unique index), never by the sequential application_id.
+# Candidates poll these pages, so the page data is cached per token and
+# dropped by applications/status.py after every status change commits.
+# The ETag lets the JSON endpoint answer polls with a bodyless 304.
+
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+
+from applications.models import STATUS_CHOICES, Application
+
+TRACK_CACHE_KEY = "applications:track:{}"
+STATUS_LABELS = dict(STATUS_CHOICES)
+
+
+def _load_state(token):
+    application = (
+        Application.objects.select_related("job")
+        .only("id", "application_id", "status", "applied_at", "job__title")
+        .get(tracking_token=token)
+    )
+    events = list(
+        application.status_events.order_by("created_at", "id")
+        .values_list("id", "from_status", "to_status", "created_at")
+    )
+    last_event_id = events[-1][0] if events else 0
+
+    return {
+        "id": application.pk,
+        "application_id": application.application_id,
+        "job_title": application.job.title,
+        "status": application.status,
+        "status_display": STATUS_LABELS.get(application.status, application.status),
+        "applied_at": application.applied_at,
+        "updated_at": events[-1][3] if events else application.applied_at,
+        "timeline": [
+            {
+                "status": STATUS_LABELS.get(to_status, to_status) if from_status else "Applied",
+                "entered_at": created_at,
+                "is_current": i + 1 == len(events),
+            }
+            for i, (_, from_status, to_status, created_at) in enumerate(events)
+        ],
+        "etag": hashlib.md5(
+            f"{application.pk}:{application.status}:{last_event_id}".encode()
+        ).hexdigest(),
+    }
+
+
+def tracking_state(token):
+    """Cached page data for a tracking token, or None if it is unknown."""
+    key = TRACK_CACHE_KEY.format(token)
+    state = cache.get(key)
+    if state is None:
+        try:
+            state = _load_state(token)
+        except Application.DoesNotExist:
+            return None
+        cache.set(key, state, settings.TRACK_CACHE_TIMEOUT)
+    return state
+
+
+def invalidate_tracking(tokens):
+    cache.delete_many([TRACK_CACHE_KEY.format(token) for token in tokens])
@@ -5,20 +5,29 @@ from applications.views.recruiter import (
     RecruiterApplicationListView,
     RecruiterApplicationDetailView,
     preview_resume,
-    RecruiterStatusUpdateView
+    resume_file,
+    RecruiterStatusUpdateView,
+    recruiter_application_events,
+)
+from applications.views.public import (
+    apply_job, application_success, track_application, track_application_status,
+    track_application_events,
 )
-from applications.views.public import apply_job, application_success, track_application
 
 urlpatterns = [
 
     # Candidate Apply
     path("apply/<slug:slug>/", apply_job, name="apply_job"),
     path("success/", application_success, name="application_success"),
-    path("track/<str:application_id>/", track_application, name="track_application"),
+    path("track/<str:token>/", track_application, name="track_application"),
+    path("track/<str:token>/status/", track_application_status, name="track_application_status"),
+    path("track/<str:token>/events/", track_application_events, name="track_application_events"),
 
     # RECRUITER Applications
     path("recruiter/list/", RecruiterApplicationListView.as_view(), name="recruiter_applications_list"),
+    path("recruiter/events/", recruiter_application_events, name="recruiter_application_events"),
     path("recruiter/<int:pk>/status/", RecruiterStatusUpdateView.as_view(), name="recruiter_status_update"),
     path("recruiter/<int:pk>/", RecruiterApplicationDetailView.as_view(), name="recruiter_application_detail"),
     path("recruiter/<int:pk>/resume/preview/", preview_resume, name="preview_resume"),
+    path("files/<str:token>/", resume_file, name="resume_file"),
 ]
\ No newline at end of file
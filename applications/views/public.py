@@ -1,102 +1,170 @@
+from asgiref.sync import sync_to_async
 from django.shortcuts import render, redirect, get_object_or_404
+from django.http import Http404, JsonResponse
+from django.urls import reverse
+from django.db import IntegrityError, transaction
+from django.contrib import messages
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition, require_GET
+import uuid
 from applications.forms import ApplicationForm
 from jobs.models import Job
-from applications.models import Application
-from applications.supabase_client import upload_resume
+from applications.idempotency import KeyInUse, claim, clean_key, complete, release
+from applications.resume_store import stage_resume, store_resume
+from applications.resume_index import schedule_resume_indexing
+from applications.resume_preview import schedule_thumbnail
+from applications.duplicates import flag_if_repeat
+from applications.tracking import tracking_state
+from applications.realtime import application_channel
+from core.realtime import sse_response, stream_view
 import logging
-from core.utils.email import send_brevo_email
+from notifications.digest import notify
+from notifications.outbox import enqueue_email
 
 logger = logging.getLogger(__name__)
 
 
+def _apply_form(request, form, job):
+    # Fresh token per render: a double-click submits the same one twice
+    return render(
+        request,
+        "applications/apply.html",
+        {"form": form, "job": job, "hide_sidebar": True, "idempotency_key": uuid.uuid4().hex}
+    )
+
+
 def apply_job(request, slug):
     job = get_object_or_404(Job, slug=slug)
 
-    if request.method == "POST":
-        form = ApplicationForm(request.POST, request.FILES)
+    # Deadline passed / archived / deleted -> no new applications
+    if not job.is_open:
+        messages.error(request, "This job is no longer accepting applications.")
+        return redirect("public_job_detail", slug=job.slug)
 
-        if form.is_valid():
-            email = form.cleaned_data["email"]
+    if request.method != "POST":
+        return _apply_form(request, ApplicationForm(), job)
 
-            # Duplicate check
-            if Application.objects.filter(job=job, email=email).exists():
-                form.add_error("email", "You have already applied for this job.")
-                return render(
-                    request,
-                    "applications/apply.html",
-                    {"form": form, "job": job, "hide_sidebar": True}
-                )
+    # Repeat of a submission already made: answer as the first one did,
+    # before the resume is checked or uploaded again
+    key = clean_key(request.POST.get("idempotency_key"))
+    if key is None:
+        return _submit_application(request, job, None)
 
-            application = form.save(commit=False)
-            application.job = job
+    scope = f"apply:{job.pk}"
+    try:
+        replay = claim(scope, key)
+    except KeyInUse:
+        messages.info(request, "Your application is still being submitted. Check your email before applying again.")
+        return redirect("public_job_detail", slug=job.slug)
+    if replay is not None:
+        return redirect(replay["redirect"])
 
-            resume_file = request.FILES.get("resume")
+    try:
+        return _submit_application(request, job, (scope, key))
+    finally:
+        # No-op once the response is stored
+        release(scope, key)
 
-            if not resume_file:
-                form.add_error("resume", "Resume is required.")
-                return render(
-                    request,
-                    "applications/apply.html",
-                    {"form": form, "job": job, "hide_sidebar": True}
-                )
 
+def _submit_application(request, job, idempotency):
+    form = ApplicationForm(request.POST, request.FILES)
+
+    if not form.is_valid():
+        return _apply_form(request, form, job)
+
+    application = form.save(commit=False)
+    application.job = job
+
+    # Sanitized copy from ApplicationForm.clean_resume
+    resume_file = form.cleaned_data.get("resume")
+
+    if not resume_file:
+        form.add_error("resume", "Resume is required.")
+        return _apply_form(request, form, job)
+
+    try:
+        # Stored once per distinct file (by SHA-256): a repeat upload
+        # is no transfer. Uploaded before the transaction, which only
+        # takes a reference: if it rolls back, the blob stays at 0 refs
+        # and the GC deletes the file.
+        stage_resume(resume_file)
+
+        with transaction.atomic():
+            # No exists() pre-check: the (job, email) unique constraint
+            # rejects duplicates on insert. Only this insert means
+            # "already applied"; the savepoint keeps other failures apart.
             try:
-                # Upload to Supabase
-                resume_file.seek(0)
-                public_url = upload_resume(resume_file, job.slug)
-
-                # Save public URL in model
-                application.resume_url = public_url
-
-                application.save()
-                try:
-                    track_url = request.build_absolute_uri(
-                    f"/applications/track/{application.application_id}/"
-                    )
-
-                    send_brevo_email(
-                    to_email=application.email,
-                    subject="Application Received – HireFlow",
-                    html_content=f"""
-                    <p>Hi {application.full_name},</p>
-
-                    <p>Your application for 
-                    <strong>{job.title}</strong> has been received.</p>
-
-                    <p><strong>Application ID:</strong> {application.application_id}</p>
-
-                    <p>
-                    You can track your application status here:
-                    <br>
-                    <a href="{track_url}">
-                        Track Application
-                    </a>
-                    </p>
-
-                    <p>Thank you,<br>HireFlow Team</p>
-                    """,
-                    )
-                except Exception as email_error:
-                    logger.exception(email_error)
-            except Exception as e:
-                logger.exception(e)
-                form.add_error("resume", "Resume upload failed. Please try again.")
-                return render(
-                    request,
-                    "applications/apply.html",
-                    {"form": form, "job": job, "hide_sidebar": True}
+                with transaction.atomic():
+                    application.save()
+            except IntegrityError:
+                form.add_error("email", "You have already applied for this job.")
+                return _apply_form(request, form, job)
+
+            blob = store_resume(resume_file)
+            application.resume_blob = blob
+            application.save(update_fields=["resume_blob"])
+
+            # Outbox row in the same transaction: sent after
+            # commit by the relay, never from this request
+            track_url = request.build_absolute_uri(
+                f"/applications/track/{application.tracking_token}/"
+            )
+            enqueue_email(
+                key=f"application-received:{application.pk}",
+                to_email=application.email,
+                template="application_received",
+                context={
+                    "full_name": application.full_name,
+                    "job_title": job.title,
+                    "application_id": application.application_id,
+                    "track_url": track_url,
+                },
+            )
+
+            # Recruiter hears about new applicants in the daily digest
+            if job.created_by_id:
+                notify(
+                    "recruiter_daily",
+                    job.created_by.email,
+                    "new_application",
+                    {
+                        "job_id": job.id,
+                        "job_title": job.title,
+                        "applications_url": request.build_absolute_uri(
+                            reverse("recruiter_job_applications", args=[job.id])
+                        ),
+                        "full_name": application.full_name,
+                    },
                 )
 
-            return redirect("application_success")
+            # Commits with the application: repeats of this submission
+            # are answered from it
+            if idempotency:
+                complete(*idempotency, {"redirect": reverse("application_success")})
 
-    else:
-        form = ApplicationForm()
+    except Exception as e:
+        logger.exception(e)
+        form.add_error("resume", "Resume upload failed. Please try again.")
+        return _apply_form(request, form, job)
 
-    return render(
-        request,
-        "applications/apply.html",
-        {"form": form, "job": job, "hide_sidebar": True}
-    )
+    # Cross-job repeat applicant flag (Bloom filter, usually no query)
+    try:
+        flag_if_repeat(application)
+    except Exception:
+        logger.exception("Repeat applicant check failed")
+
+    # Background text extraction for resume keyword search,
+    # first-page thumbnail for files not stored before
+    try:
+        resume_file.seek(0)
+        resume_bytes = resume_file.read()
+        schedule_resume_indexing(application.pk, resume_bytes)
+        if not blob.thumbnail_path:
+            schedule_thumbnail(blob, resume_bytes)
+    except Exception:
+        logger.exception("Resume indexing could not be scheduled")
+
+    return redirect("application_success")
 
 
 def application_success(request):
@@ -106,21 +174,54 @@ def application_success(request):
         {"hide_sidebar": True}
     )
 
-from django.http import Http404
 
-def track_application(request, application_id):
-    try:
-        application = Application.objects.select_related("job").get(
-            application_id=application_id
-        )
-    except Application.DoesNotExist:
+def track_application(request, token):
+    state = tracking_state(token)
+    if state is None:
         raise Http404("Application not found")
 
     return render(
         request,
         "applications/track.html",
         {
-            "application": application,
+            "application": state,
+            "timeline": state["timeline"],
+            "token": token,
             "hide_sidebar": True,
         },
-    )
\ No newline at end of file
+    )
+
+
+def _tracking_etag(request, token):
+    state = tracking_state(token)
+    return state["etag"] if state else None
+
+
+@require_GET
+@cache_control(private=True, no_cache=True)
+@condition(etag_func=_tracking_etag)
+def track_application_status(request, token):
+    """
+    Polled by the track page: If-None-Match with the last ETag gets a
+    304 straight from the cached state, with no DB query.
+    """
+    state = tracking_state(token)
+    if state is None:
+        raise Http404("Application not found")
+
+    return JsonResponse({
+        "application_id": state["application_id"],
+        "job_title": state["job_title"],
+        "status": state["status"],
+        "status_display": state["status_display"],
+        "updated_at": state["updated_at"],
+    })
+
+
+@stream_view
+async def track_application_events(request, token):
+    """SSE stream of this application's status changes (ASGI only)."""
+    state = await sync_to_async(tracking_state)(token)
+    if state is None:
+        raise Http404("Application not found")
+    return sse_response(request, [application_channel(state["id"])])
@@ -3,10 +3,17 @@ from django.views.generic import ListView, DetailView, UpdateView,View
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.auth.decorators import login_required
 from django.core.exceptions import PermissionDenied
-from django.db.models import Q
 from applications.models import Application
+from applications.resume_index import search_applications
+from applications.resume_preview import attach_thumbnail_urls, signed_urls
+from applications.storage import open_signed
+from applications.status import VALID_STATUSES, change_status, timeline
+from applications.realtime import recruiter_channel
+from core.realtime import sse_response, stream_view
 import logging
-from django.http import JsonResponse
+import mimetypes
+from django.http import FileResponse, Http404, JsonResponse
+from django.utils.cache import patch_cache_control
 
 logger = logging.getLogger(__name__)
 
@@ -38,12 +45,12 @@ class RecruiterApplicationListView(LoginRequiredMixin, ListView):
         return super().dispatch(request, *args, **kwargs)
 
     def get_queryset(self): 
-        qs = app_queryset_for(self.request.user).order_by("-applied_at")
+        qs = app_queryset_for(self.request.user).select_related("job", "resume_blob").order_by("-applied_at")
 
-        # Search by candidate name ONLY
+        # Search by candidate name or resume keywords
         search = self.request.GET.get("search", "").strip()
         if search:
-            qs = qs.filter(full_name__icontains=search)
+            qs = search_applications(qs, search)
 
         # Status filter
         status_filter = self.request.GET.get("status", "")
@@ -67,6 +74,9 @@ class RecruiterApplicationListView(LoginRequiredMixin, ListView):
 
         context["search"] = self.request.GET.get("search", "")
         context["status_filter"] = self.request.GET.get("status", "")
+
+        # Inline first-page thumbnails (signed URLs, one batch per page)
+        attach_thumbnail_urls(context["apps_page"])
         
 
     
@@ -87,16 +97,19 @@ class RecruiterApplicationDetailView(LoginRequiredMixin, DetailView):
         return super().dispatch(request, *args, **kwargs)
 
     def get_queryset(self):   
-        return app_queryset_for(self.request.user)   
+        return app_queryset_for(self.request.user).select_related("job", "resume_blob")
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["timeline"] = timeline(self.object)
+        attach_thumbnail_urls([self.object])
+        return context
 
     
 # ====================================
 # RECRUITER – STATUS UPDATE PAGE 
 # ====================================
 
-from core.utils.email import send_brevo_email
-from django.conf import settings
-
 class RecruiterStatusUpdateView(LoginRequiredMixin, View):
     def post(self, request, pk):
         if request.user.role != "RECRUITER":
@@ -108,59 +121,22 @@ class RecruiterStatusUpdateView(LoginRequiredMixin, View):
             job__created_by=request.user,
         )
 
-        old_status = application.status
         new_status = request.POST.get("status")
 
-        ALLOWED_STATUSES = {
-            "screening",
-            "review",
-            "interview",
-            "hired",
-            "rejected",
-        }
-
-        if new_status not in ALLOWED_STATUSES:
+        if new_status not in VALID_STATUSES:
             return JsonResponse({"error": "Invalid status"}, status=400)
 
-        # Only update if status changed
-        if old_status != new_status:
-            application.status = new_status
-            application.save(update_fields=["status"])
-
-            try:
-                track_url = request.build_absolute_uri(
-                    f"/applications/track/{application.application_id}/"
-                )
-
-                send_brevo_email(
-                    to_email=application.email,
-                    subject="Application Status Updated – HireFlow",
-                    html_content=f"""
-                        <p>Hi {application.full_name},</p>
-
-                        <p>Your application for 
-                        <strong>{application.job.title}</strong> 
-                        has been updated.</p>
-
-                        <p><strong>New Status:</strong> {new_status.title()}</p>
-
-                        <p>
-                        You can track your application here:
-                        <br>
-                        <a href="{track_url}">Track Application</a>
-                        </p>
-
-                        <p>Regards,<br>HireFlow Team</p>
-                    """,
-                )
-            except Exception:
-                logger.exception("Status email failed")
+        # Status change, its event and the candidate's digest entry commit
+        # together; one email per candidate per NOTIFICATION_DIGEST_WINDOW
+        change_status(
+            application, new_status, changed_by=request.user, site_url=request.build_absolute_uri("/")
+        )
 
         from django.contrib import messages
 
         messages.success(
         request,
-        f"Application status updated successfully. Email sent to {application.email}."
+        f"Application status updated successfully. {application.email} will be notified by email."
 )
 
     #    from django.shortcuts import redirect
@@ -174,16 +150,48 @@ class RecruiterStatusUpdateView(LoginRequiredMixin, View):
 @login_required
 def preview_resume(request, pk):
     application = get_object_or_404(
-        Application,
+        Application.objects.select_related("resume_blob"),
         pk=pk,
         job__created_by=request.user,
         job__is_deleted=False,
     )
-    # return redirect(application.resume.url)
-    return redirect(application.resume_url)  # this is a application model and resume_url is field 
+    # Private storage: short-lived signed URL, minted only on click
+    if application.resume_blob_id:
+        path = application.resume_blob.path
+        url = signed_urls([path]).get(path)
+        if url:
+            return redirect(url)
+    elif application.resume_url:  # uploaded before private storage
+        return redirect(application.resume_url)
+    raise Http404("Resume not available")
+
+
+def resume_file(request, token):
+    """
+    Local storage stand-in (applications/storage.py) for the bucket's
+    signed URLs: the signed token is the credential, no login.
+    """
+    opened = open_signed(token)
+    if opened is None:
+        raise Http404("Link expired")
+    file, remaining = opened
+    response = FileResponse(file, content_type=mimetypes.guess_type(file.name)[0])
+    patch_cache_control(response, private=True, max_age=remaining)
+    return response
 
 
 # resume_url = models.URLField()
 # That means:
 # Instead of storing uploaded file locally,
-# You are storing:
\ No newline at end of file
+# You are storing:
+
+# ===============================================================
+# RECRUITER – LIVE UPDATES (SSE, ASGI only)
+# ===============================================================
+@login_required
+@stream_view
+async def recruiter_application_events(request):
+    user = await request.auser()
+    if user.role != "RECRUITER":
+        raise PermissionDenied()
+    return sse_response(request, [recruiter_channel(user.pk)])
@@ -14,3 +14,26 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
 
 application = get_asgi_application()
+
+# SSE endpoints (@stream_view) skip the middleware stack; see core/realtime.py
+from core.realtime import StreamRouter  # noqa: E402
+
+application = StreamRouter(application)
+
+# Web workers only (not manage.py): periodic maintenance threads,
+# each off unless its *_INTERVAL setting is > 0.
+from analytics.rollups import start_rollup_scheduler  # noqa: E402
+from applications.idempotency import start_idempotency_purge  # noqa: E402
+from applications.resume_archive import start_archive_scheduler  # noqa: E402
+from applications.resume_store import start_blob_gc_scheduler  # noqa: E402
+from jobs.expiry import start_expiry_scheduler  # noqa: E402
+from notifications.digest import start_digest_scheduler  # noqa: E402
+from notifications.outbox import start_outbox_relay  # noqa: E402
+
+start_expiry_scheduler()
+start_rollup_scheduler()
+start_blob_gc_scheduler()
+start_archive_scheduler()
+start_outbox_relay()
+start_digest_scheduler()
+start_idempotency_purge()
@@ -0,0 +1,109 @@
+# core/db_router.py
+#
+# Read-replica routing. Everything goes to the primary ("default")
+# except reads made while serving a GET/HEAD request to a view in
+# REPLICA_READ_VIEWS (public job board, dashboards),
+# which go to DATABASES["replica"]:
+#
+#   - the first write in such a request sends its remaining reads to the
+#     primary (read-after-write within the request)
+#   - a request that wrote sets a REPLICA_PIN_SECONDS cookie; requests
+#     carrying it read from the primary, so a client sees its own writes
+#     through replication lag (read-after-write across requests)
+#   - sessions, auth tokens and users are always read from the primary
+#
+# Background threads, management commands and async views have no
+# request state and use the primary.
+
+from contextvars import ContextVar
+
+from django.conf import settings
+
+PRIMARY = "default"
+REPLICA = "replica"
+PIN_COOKIE = "db_primary"
+
+# Authentication state must never lag behind a login / token creation
+PRIMARY_ONLY_APPS = {"sessions", "authtoken", "users"}
+
+
+class ReadState:
+    """Routing state of one request."""
+
+    __slots__ = ("replica", "wrote")
+
+    def __init__(self):
+        self.replica = False  # reads may go to the replica
+        self.wrote = False
+
+
+_state = ContextVar("db_read_state", default=None)
+
+
+def replica_enabled():
+    return settings.REPLICA_READS and REPLICA in settings.DATABASES
+
+
+class ReplicaRouter:
+
+    def db_for_read(self, model, **hints):
+        state = _state.get()
+        if state is None or not state.replica or state.wrote:
+            return PRIMARY
+        if model._meta.app_label in PRIMARY_ONLY_APPS:
+            return PRIMARY
+        return REPLICA
+
+    def db_for_write(self, model, **hints):
+        # Explicit: an instance read from the replica is saved to the primary
+        state = _state.get()
+        if state is not None:
+            state.wrote = True
+        return PRIMARY
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return {obj1._state.db, obj2._state.db} <= {PRIMARY, REPLICA}
+
+
+class ReplicaReadsMiddleware:
+    """Sets up the ReadState ReplicaRouter consults for each request."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        state = ReadState()
+        token = _state.set(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            _state.reset(token)
+
+        if state.wrote and replica_enabled():
+            response.set_cookie(
+                PIN_COOKIE, "1", max_age=settings.REPLICA_PIN_SECONDS, httponly=True, samesite="Lax"
+            )
+        elif state.replica and response.streaming:
+            # Streamed bodies read while produced, after this returns
+            response.streaming_content = _with_state(response.streaming_content, state)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if (
+            request.method in ("GET", "HEAD")
+            and PIN_COOKIE not in request.COOKIES
+            and request.resolver_match.view_name in settings.REPLICA_READ_VIEWS
+            and replica_enabled()
+        ):
+            _state.get().replica = True
+
+
+def _with_state(content, state):
+    # set/restore, not reset(): the server may close the iterator from
+    # another context
+    previous = _state.get()
+    _state.set(state)
+    try:
+        yield from content
+    finally:
+        _state.set(previous)
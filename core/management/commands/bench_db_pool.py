@@ -0,0 +1,144 @@
+import statistics
+import threading
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.backends.postgresql.base import DatabaseWrapper
+from django.db.models import Count
+
+from jobs.filters import public_jobs
+from jobs.models import Job
+
+BENCH_TITLE = "Bench pool job"
+
+
+def _percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+class Command(BaseCommand):
+    help = "PostgreSQL connection setup cost and request latency: new connection vs persistent vs pool."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--threads", type=int, default=32, help="concurrent requests")
+        parser.add_argument("--requests", type=int, default=100, help="per thread")
+        parser.add_argument("--pool-size", type=int, default=settings.DB_POOL_MAX_SIZE)
+        parser.add_argument("--connects", type=int, default=200)
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql":
+            raise CommandError("Needs PostgreSQL: set DB_HOST / DB_NAME / DB_USER / DB_PASSWORD (DB_PORT, DB_SSLMODE).")
+
+        base = {**connection.settings_dict, "OPTIONS": dict(connection.settings_dict["OPTIONS"])}
+        base["OPTIONS"].pop("pool", None)
+        modes = [
+            # CONN_MAX_AGE = 0, and ASGI workers (new thread per request)
+            ("new connection", {**base, "CONN_MAX_AGE": 0}, False),
+            # CONN_MAX_AGE > 0 on sync workers: one connection per thread
+            ("persistent", {**base, "CONN_MAX_AGE": 60}, True),
+            ("pool", {
+                **base,
+                "CONN_MAX_AGE": 0,
+                "OPTIONS": {
+                    **base["OPTIONS"],
+                    "pool": {**settings.DATABASES["default"]["OPTIONS"].get("pool", {}),
+                             "min_size": 2, "max_size": options["pool_size"]},
+                },
+            }, False),
+        ]
+
+        Job.objects.bulk_create(
+            Job(title=f"{BENCH_TITLE} {i}", slug=f"bench-pool-job-{i}", description="x",
+                location="Pune", work_mode="onsite")
+            for i in range(500)
+        )
+        try:
+            self._setup_cost(base, options["connects"])
+            self.stdout.write(self.style.MIGRATE_HEADING(
+                f"{options['threads']} concurrent requests x {options['requests']}, "
+                f"3 queries each (pool max_size={options['pool_size']})"
+            ))
+            self.stdout.write(f"  {'':16} {'req/s':>7} {'p50 ms':>8} {'p99 ms':>8} {'connections':>12}")
+            for label, settings_dict, keep in modes:
+                self._load(label, settings_dict, keep, options)
+        finally:
+            Job.objects.filter(title__startswith=BENCH_TITLE).delete()
+
+    def _setup_cost(self, settings_dict, connects):
+        wrapper = DatabaseWrapper(settings_dict, "bench_connect")
+        samples = []
+        for _ in range(connects):
+            start = time.perf_counter()
+            wrapper.ensure_connection()
+            samples.append(time.perf_counter() - start)
+            wrapper.close()
+
+        self.stdout.write(self.style.MIGRATE_HEADING(
+            f"Connection setup (sslmode={settings_dict['OPTIONS'].get('sslmode')}, incl. auth + session setup)"
+        ))
+        self.stdout.write(
+            f"  median {statistics.median(samples) * 1000:.2f} ms, "
+            f"p99 {_percentile(samples, 99) * 1000:.2f} ms over {connects} connects"
+        )
+
+    def _request(self, wrapper):
+        """Public job list: page, count, facets."""
+        jobs = public_jobs().filter(title__startswith=BENCH_TITLE)
+        queries = [
+            jobs.order_by("-created_at").values("id", "title", "slug")[:20],
+            jobs.values("id")[:1000],
+            jobs.values("work_mode").annotate(n=Count("id")).order_by(),
+        ]
+        with wrapper.cursor() as cursor:
+            for qs in queries:
+                sql, params = qs.query.get_compiler(connection=wrapper).as_sql()
+                cursor.execute(sql, params)
+                cursor.fetchall()
+
+    def _load(self, label, settings_dict, keep, options):
+        alias = f"bench_{label.replace(' ', '_')}"
+        latencies = []
+        lock = threading.Lock()
+        barrier = threading.Barrier(options["threads"])
+        opened = [0]
+
+        def worker():
+            wrapper = DatabaseWrapper(settings_dict, alias)
+            samples = []
+            barrier.wait()
+            for _ in range(options["requests"]):
+                start = time.perf_counter()
+                if wrapper.connection is None:
+                    wrapper.ensure_connection()
+                    with lock:
+                        opened[0] += 1
+                self._request(wrapper)
+                if not keep:
+                    wrapper.close()  # request_finished with CONN_MAX_AGE = 0 / pool
+                samples.append(time.perf_counter() - start)
+            wrapper.close()
+            with lock:
+                latencies.extend(samples)
+
+        threads = [threading.Thread(target=worker) for _ in range(options["threads"])]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+        connections_used = opened[0]
+        pool = DatabaseWrapper._connection_pools.get(alias)
+        if pool is not None:
+            connections_used = pool.get_stats()["connections_num"]
+            DatabaseWrapper(settings_dict, alias).close_pool()
+
+        self.stdout.write(
+            f"  {label:16} {len(latencies) / elapsed:>7.0f} "
+            f"{statistics.median(latencies) * 1000:>8.2f} {_percentile(latencies, 99) * 1000:>8.2f} "
+            f"{connections_used:>12,}"
+        )
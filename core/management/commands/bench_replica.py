@@ -0,0 +1,196 @@
+import os
+import random
+import shutil
+import tempfile
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.test import Client, override_settings
+from rest_framework.authtoken.models import Token
+
+from applications.models import Application
+from core.db_router import PIN_COOKIE
+from jobs.models import Job
+from users.models import User
+
+STATUSES = ["review", "interview", "rejected", "hired"]
+
+
+class _QueryTimer:
+    """execute_wrapper counting queries and driver time on one alias."""
+
+    def __init__(self):
+        self.seconds = 0.0
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.seconds += time.perf_counter() - start
+            self.count += 1
+
+
+class Command(BaseCommand):
+    help = "Read replica: share of queries taken off the primary for a mixed request load."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=3000)
+        parser.add_argument("--recruiters", type=int, default=20)
+        parser.add_argument("--jobs-per-recruiter", type=int, default=10)
+        parser.add_argument("--apps-per-job", type=int, default=25)
+
+    def handle(self, *args, **options):
+        # Both aliases on a throwaway copy of the dev database: a replica
+        # with no lag, and nothing written to the real file
+        source = settings.DATABASES["default"]["NAME"]
+        tmp = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmp, "bench.sqlite3")
+            shutil.copyfile(source, path)
+            for alias in ("default", "replica"):
+                connections[alias].close()
+                connections[alias].settings_dict["NAME"] = path
+
+            with override_settings(ALLOWED_HOSTS=["testserver"]):
+                self._bench(options)
+        finally:
+            for alias in ("default", "replica"):
+                connections[alias].close()
+            shutil.rmtree(tmp)
+
+    def _seed(self, options, rng):
+        admin = User.objects.create_user(
+            email="bench-admin@example.com", password="x", role="ADMIN", is_active=True
+        )
+        recruiters = []
+        for r in range(options["recruiters"]):
+            recruiter = User.objects.create_user(
+                email=f"bench-recruiter{r}@example.com", password="x", role="RECRUITER", is_active=True
+            )
+            recruiters.append(recruiter)
+            for j in range(options["jobs_per_recruiter"]):
+                job = Job.objects.create(
+                    title=f"Bench Job {r}-{j}",
+                    description="Benchmark job",
+                    location=rng.choice(["Pune", "Mumbai", "Bengaluru"]),
+                    work_mode="onsite",
+                    created_by=recruiter,
+                )
+                Application.objects.bulk_create(
+                    Application(
+                        job=job,
+                        application_id=f"BENCH-{r}-{j}-{a}",
+                        full_name="Bench Candidate",
+                        email=f"c{a}@example.com",
+                        phone="9999999999",
+                    )
+                    for a in range(options["apps_per_job"])
+                )
+        return admin, recruiters
+
+    def _plan(self, rng, admin, recruiters):
+        """(weight, name, callable(client_pool) -> response) request mix."""
+        slugs = list(Job.objects.filter(title__startswith="Bench Job").values_list("slug", flat=True))
+        apps = list(
+            Application.objects.filter(job__title__startswith="Bench Job")
+            .values_list("id", "job__created_by_id")
+        )
+        tokens = {user.pk: Token.objects.get_or_create(user=user)[0].key for user in [admin, *recruiters]}
+
+        recruiter_clients = {}
+        for recruiter in recruiters:
+            client = Client()
+            client.force_login(recruiter)
+            recruiter_clients[recruiter.pk] = client
+        admin_client = Client()
+        admin_client.force_login(admin)
+
+        def apply(candidate):
+            # Candidate's own client: pinned to the primary after applying
+            return candidate.post(f"/api/apply/{rng.choice(slugs)}/", {
+                "full_name": "Bench Applicant",
+                "email": f"bench-{rng.getrandbits(48):x}@example.com",
+                "phone": "9876543210",
+            })
+
+        def update_status(candidate):
+            app_id, owner = rng.choice(apps)
+            return Client().patch(
+                f"/api/applications/{app_id}/status/",
+                {"status": rng.choice(STATUSES)},
+                content_type="application/json",
+                HTTP_AUTHORIZATION=f"Token {tokens[owner]}",
+            )
+
+        return [
+            (20, "job list", lambda c: c.get("/jobs/")),
+            (20, "job detail", lambda c: c.get(f"/jobs/{rng.choice(slugs)}/")),
+            (10, "API job list", lambda c: c.get("/api/jobs/?location=Pune")),
+            (5, "API facets", lambda c: c.get("/api/jobs/facets/")),
+            (5, "API job detail", lambda c: c.get(f"/api/jobs/{rng.choice(slugs)}/")),
+            (10, "recruiter dashboard", lambda c: recruiter_clients[rng.choice(recruiters).pk].get("/dashboard/recruiter/")),
+            (3, "admin dashboard", lambda c: admin_client.get("/dashboard/admin/")),
+            (2, "admin analytics", lambda c: admin_client.get("/dashboard/admin/analytics/")),
+            (15, "apply (API)", apply),
+            (10, "status update (API)", update_status),
+        ]
+
+    def _run(self, plan, requests, rng):
+        timers = {alias: _QueryTimer() for alias in ("default", "replica")}
+        weights = [weight for weight, _, _ in plan]
+        candidates = [Client() for _ in range(200)]
+        errors = Counter()
+        pinned = {}
+
+        cache.clear()
+        with connections["default"].execute_wrapper(timers["default"]), \
+                connections["replica"].execute_wrapper(timers["replica"]):
+            start = time.perf_counter()
+            for _ in range(requests):
+                _, name, request = rng.choices(plan, weights)[0]
+                candidate = rng.choice(candidates)
+                # The test client never expires cookies; a browser would
+                if time.monotonic() - pinned.get(candidate, 0) > settings.REPLICA_PIN_SECONDS:
+                    candidate.cookies.pop(PIN_COOKIE, None)
+
+                response = request(candidate)
+                if response.status_code >= 400:
+                    errors[name] += 1
+                if PIN_COOKIE in response.cookies:
+                    pinned[candidate] = time.monotonic()
+            elapsed = time.perf_counter() - start
+        return timers, elapsed, errors
+
+    def _bench(self, options):
+        rng = random.Random(49)
+        admin, recruiters = self._seed(options, rng)
+        plan = self._plan(rng, admin, recruiters)
+
+        rows = []
+        for label, enabled in (("primary only", False), ("with replica", True)):
+            with override_settings(REPLICA_READS=enabled):
+                timers, elapsed, errors = self._run(plan, options["requests"], random.Random(490))
+            rows.append((label, timers, elapsed))
+            if errors:
+                self.stdout.write(self.style.WARNING(f"{label}: failed requests {dict(errors)}"))
+
+        self.stdout.write(self.style.MIGRATE_HEADING(
+            f"{options['requests']} requests (75% job board + dashboards, 25% writes)"
+        ))
+        self.stdout.write(f"  {'':14} {'primary q':>10} {'replica q':>10} {'primary DB s':>13} {'req/s':>8}")
+        for label, timers, elapsed in rows:
+            self.stdout.write(
+                f"  {label:14} {timers['default'].count:>10,} {timers['replica'].count:>10,} "
+                f"{timers['default'].seconds:>13.2f} {options['requests'] / elapsed:>8.0f}"
+            )
+
+        before, after = rows[0][1]["default"], rows[1][1]["default"]
+        self.stdout.write(self.style.MIGRATE_HEADING("Primary load"))
+        self.stdout.write(f"  queries: -{(1 - after.count / before.count) * 100:.0f}%")
+        self.stdout.write(f"  DB time: -{(1 - after.seconds / before.seconds) * 100:.0f}%")
@@ -0,0 +1,128 @@
+import asyncio
+import os
+import resource
+import socket
+import subprocess
+import sys
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from applications.models import Application
+from core.realtime import InProcessBroker
+from jobs.models import Job
+
+
+def _proc_status(pid, field):
+    # Linux only: VmRSS (kB), Threads
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith(f"{field}:"):
+                return int(line.split()[1])
+    return 0
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class Command(BaseCommand):
+    help = "Hold N idle SSE connections on one uvicorn process; report memory per connection."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--connections", type=int, default=10_000)
+        parser.add_argument("--concurrency", type=int, default=200, help="connects in flight")
+
+    def handle(self, *args, **options):
+        count = options["connections"]
+        soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        if hard != resource.RLIM_INFINITY and hard < count + 100:
+            raise CommandError(f"RLIMIT_NOFILE hard limit {hard} is too low for {count} connections")
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))  # inherited by the server too
+
+        self._bench_fanout(count)
+
+        # The server is a separate process -> this row must be committed
+        job = Job.objects.create(
+            title="Bench SSE", description="x", location="Pune", work_mode="onsite",
+        )
+        application = Application.objects.create(
+            job=job, full_name="Bench", email="bench-sse@example.com", phone="9000000000",
+        )
+        port = _free_port()
+        server = subprocess.Popen(
+            [
+                sys.executable, "-m", "uvicorn", "core.asgi:application",
+                "--host", "127.0.0.1", "--port", str(port),
+                "--log-level", "warning", "--no-access-log", "--backlog", "4096",
+            ],
+            cwd=settings.BASE_DIR,
+        )
+        try:
+            asyncio.run(self._hold(server.pid, port, application.tracking_token, count, options["concurrency"]))
+        finally:
+            server.terminate()
+            server.wait()
+            job.delete()
+
+    def _bench_fanout(self, count):
+        """Broker alone: one publish delivered to `count` subscribers."""
+        async def run():
+            broker = InProcessBroker()
+            subscriptions = [broker.subscribe(["bench"], settings.REALTIME_QUEUE_SIZE) for _ in range(count)]
+            start = time.perf_counter()
+            broker.publish("bench", "event: status\ndata: {}\n\n")
+            await asyncio.gather(*(s.get() for s in subscriptions))
+            return (time.perf_counter() - start) * 1000
+
+        self.stdout.write(f"broker fan-out to {count} streams: {asyncio.run(run()):.1f}ms")
+
+    async def _hold(self, pid, port, token, count, concurrency):
+        request = (
+            f"GET /applications/track/{token}/events/ HTTP/1.1\r\n"
+            f"Host: 127.0.0.1\r\nAccept: text/event-stream\r\n\r\n"
+        ).encode()
+
+        async def open_stream():
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(request)
+            await writer.drain()
+            head = await reader.readuntil(b"retry:")
+            if b" 200 " not in head.split(b"\r\n", 1)[0]:
+                raise CommandError(head.split(b"\r\n", 1)[0].decode())
+            return reader, writer
+
+        for _ in range(100):  # wait for the server, then warm it up
+            try:
+                warm = await open_stream()
+                break
+            except OSError:
+                await asyncio.sleep(0.1)
+        else:
+            raise CommandError("server did not start")
+        warm[1].close()
+        await asyncio.sleep(1)
+        baseline = _proc_status(pid, "VmRSS")
+
+        gate = asyncio.Semaphore(concurrency)
+
+        async def limited():
+            async with gate:
+                return await open_stream()
+
+        start = time.perf_counter()
+        streams = await asyncio.gather(*(limited() for _ in range(count)))
+        opened = time.perf_counter() - start
+        await asyncio.sleep(2)
+        held = _proc_status(pid, "VmRSS")
+        threads = _proc_status(pid, "Threads")
+
+        self.stdout.write(f"opened {len(streams)} streams in {opened:.1f}s")
+        self.stdout.write(f"server RSS: {baseline / 1024:.1f} MB idle -> {held / 1024:.1f} MB")
+        self.stdout.write(f"per connection: {(held - baseline) / len(streams):.1f} KB, server threads: {threads}")
+
+        for _, writer in streams:
+            writer.close()
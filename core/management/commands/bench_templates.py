@@ -0,0 +1,100 @@
+import time
+
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test import Client, override_settings
+from django.urls import reverse
+
+from jobs.models import Job
+from applications.models import Application
+from users.models import User
+
+
+class _QueryTimer:
+    """connection.execute_wrapper that sums time spent inside the DB driver."""
+
+    def __init__(self):
+        self.seconds = 0.0
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.seconds += time.perf_counter() - start
+            self.count += 1
+
+
+class Command(BaseCommand):
+    help = "Benchmark recruiter dashboard / job list: render time vs query time."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=200)
+        parser.add_argument("--jobs", type=int, default=10)
+        parser.add_argument("--apps-per-job", type=int, default=20)
+
+    def handle(self, *args, **options):
+        iterations = options["iterations"]
+
+        # Fixtures live inside a transaction that is always rolled back.
+        with transaction.atomic():
+            recruiter = self._seed(options["jobs"], options["apps_per_job"])
+
+            client = Client()
+            client.force_login(recruiter)
+
+            with override_settings(ALLOWED_HOSTS=["testserver"]):
+                for name in ("recruiter_dashboard", "recruiter_job_list"):
+                    self._bench(client, name, iterations)
+
+            transaction.set_rollback(True)
+
+    def _seed(self, jobs, apps_per_job):
+        recruiter = User.objects.create_user(
+            email="bench-recruiter@example.com",
+            password="bench-password",
+            role="RECRUITER",
+            is_active=True,
+        )
+        for j in range(jobs):
+            job = Job.objects.create(
+                title=f"Bench Job {j}",
+                description="Benchmark job",
+                location="Pune",
+                work_mode="onsite",
+                created_by=recruiter,
+            )
+            Application.objects.bulk_create(
+                Application(
+                    job=job,
+                    application_id=f"BENCH-{j}-{a}",
+                    full_name="Bench Candidate",
+                    email=f"c{a}@example.com",
+                    phone="9999999999",
+                )
+                for a in range(apps_per_job)
+            )
+        return recruiter
+
+    def _bench(self, client, url_name, iterations):
+        url = reverse(url_name)
+        cache.clear()
+        client.get(url)  # warm template loader + fragment cache
+
+        timer = _QueryTimer()
+        start = time.perf_counter()
+        with connection.execute_wrapper(timer):
+            for _ in range(iterations):
+                client.get(url)
+        total = time.perf_counter() - start
+
+        per_req = total / iterations * 1000
+        query = timer.seconds / iterations * 1000
+        self.stdout.write(self.style.MIGRATE_HEADING(url_name))
+        self.stdout.write(f"  total          : {per_req:.3f} ms/request")
+        self.stdout.write(
+            f"  queries        : {query:.3f} ms ({timer.count / iterations:.0f} queries)"
+        )
+        self.stdout.write(f"  render + python: {per_req - query:.3f} ms")
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from core.assets import build_all
+
+
+class Command(BaseCommand):
+    help = "Build minified CSS/JS bundles into static/dist/ (run before collectstatic)."
+
+    def handle(self, *args, **options):
+        sizes = build_all()
+
+        for name, size in sizes.items():
+            self.stdout.write(f"dist/{name:<20} {size:>8} bytes")
+
+        self.stdout.write(self.style.SUCCESS(f"Built {len(sizes)} bundles."))
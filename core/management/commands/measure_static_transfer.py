@@ -0,0 +1,99 @@
+import gzip
+import re
+import tempfile
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.test import Client, override_settings
+from django.urls import reverse
+
+from core.assets import DIST_DIR, build_all
+
+try:
+    import brotli
+except ImportError:  # Brotli is only needed to serve .br files
+    brotli = None
+
+
+ASSET_RE = re.compile(r'(?:href|src)="(%s[^"?]+)"' % re.escape(settings.STATIC_URL))
+ACCEPT_ENCODING = "br, gzip" if brotli else "gzip"
+
+
+def _body(response):
+    return b"".join(response.streaming_content) if response.streaming else response.content
+
+
+class Command(BaseCommand):
+    help = (
+        "Transfer bytes of the public job board for first and repeat visits, "
+        "measured against collected static files served by WhiteNoise."
+    )
+
+    def handle(self, *args, **options):
+        rows = [
+            ("legacy (separate files)", False, "django.contrib.staticfiles.storage.StaticFilesStorage"),
+            ("bundled + minified", True, "whitenoise.storage.CompressedManifestStaticFilesStorage"),
+        ]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            dist = Path(tmp) / DIST_DIR
+            build_all(dist)
+
+            for label, bundled, backend in rows:
+                # Production serving: collected files, WhiteNoise, DEBUG off
+                with override_settings(
+                    ASSET_BUNDLES_ENABLED=bundled,
+                    ALLOWED_HOSTS=["testserver"],
+                    DEBUG=False,
+                    STATIC_ROOT=Path(tmp) / f"root-{label.split()[0]}",
+                    STATICFILES_DIRS=[(DIST_DIR, dist), *settings.STATICFILES_DIRS],
+                    STORAGES={**settings.STORAGES, "staticfiles": {"BACKEND": backend}},
+                ):
+                    call_command("collectstatic", interactive=False, verbosity=0)
+                    self._visit(label, Client())
+
+    def _visit(self, label, client):
+        html = client.get(reverse("public_jobs_list")).content
+        html_gz = len(gzip.compress(html, compresslevel=9))
+        assets = ASSET_RE.findall(html.decode("utf-8"))
+
+        # First visit: every asset, in the best encoding the server has
+        first = {url: client.get(url, HTTP_ACCEPT_ENCODING=ACCEPT_ENCODING) for url in assets}
+        first_bytes = sum(len(_body(response)) for response in first.values())
+
+        # Repeat visit once max-age has passed: immutable files stay in the
+        # browser cache, the rest are revalidated with their validators
+        revalidated = 0
+        repeat_bytes = 0
+        statuses = []
+        for url, response in first.items():
+            if "immutable" in response.get("Cache-Control", ""):
+                continue
+            again = client.get(
+                url,
+                HTTP_ACCEPT_ENCODING=ACCEPT_ENCODING,
+                HTTP_IF_NONE_MATCH=response.get("ETag", ""),
+                HTTP_IF_MODIFIED_SINCE=response.get("Last-Modified", ""),
+            )
+            revalidated += 1
+            repeat_bytes += len(_body(again))
+            statuses.append(str(again.status_code))
+
+        self.stdout.write(self.style.MIGRATE_HEADING(label))
+        self.stdout.write(f"  static requests      : {len(assets)}")
+        self.stdout.write(
+            f"  first visit          : {html_gz + first_bytes} bytes "
+            f"(html {html_gz} gzip + assets {first_bytes}, {ACCEPT_ENCODING})"
+        )
+        self.stdout.write(
+            f"  repeat visit         : {html_gz + repeat_bytes} bytes, {revalidated} static requests"
+            + (f" ({', '.join(sorted(set(statuses)))})" if statuses else "")
+        )
+        if revalidated:
+            # Unhashed URLs: a deploy that rewrites a file sends it again in full
+            self.stdout.write(f"  after deploy         : up to {html_gz + first_bytes} bytes")
+        else:
+            # Content-hashed URLs: only files whose content changed are new
+            self.stdout.write(f"  after deploy         : {html_gz} bytes + changed files only")
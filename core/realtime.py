@@ -0,0 +1,244 @@
+# core/realtime.py
+#
+# Server-Sent Events over the ASGI app (core/asgi.py).
+# Publishers (request threads, on_commit hooks) call publish(); every
+# open SSE stream is a Subscription with a bounded asyncio queue on the
+# event loop that serves it. The default broker only reaches streams in
+# the same process: with several workers, point REALTIME_BROKER at an
+# implementation of the same subscribe / unsubscribe / publish / active
+# interface backed by a shared bus (e.g. Redis pub/sub).
+#
+# Backpressure: a stream that falls REALTIME_QUEUE_SIZE messages behind
+# is not buffered any further. Its backlog is dropped and it ends with a
+# "resync" event; EventSource reconnects and the page reloads its data.
+#
+# Idle cost: Django's ASGI handler gives every request its own executor
+# thread for sync middleware, and that thread lives as long as the
+# response - one thread per open stream. Views marked @stream_view are
+# therefore dispatched by StreamRouter straight from core/asgi.py,
+# without the middleware stack, so an idle stream is one queue and one
+# suspended generator on the event loop.
+
+import asyncio
+import io
+import json
+import threading
+from functools import partial
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import aget_user
+from django.core.exceptions import PermissionDenied
+from django.core.handlers.asgi import ASGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import close_old_connections
+from django.http import (
+    Http404,
+    HttpResponse,
+    HttpResponseForbidden,
+    HttpResponseNotFound,
+    StreamingHttpResponse,
+)
+from django.urls import Resolver404, resolve
+from django.utils.module_loading import import_string
+
+OVERFLOW = "event: resync\ndata: {}\n\n"
+
+
+class Subscription:
+    __slots__ = ("broker", "channels", "loop", "queue", "overflowed")
+
+    def __init__(self, broker, channels, maxsize):
+        self.broker = broker
+        self.channels = tuple(channels)
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize)
+        self.overflowed = False
+
+    def deliver(self, message):
+        """Runs on the subscriber's event loop."""
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            self.overflowed = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(OVERFLOW)
+
+    async def get(self):
+        return await self.queue.get()
+
+    def close(self):
+        self.broker.unsubscribe(self)
+
+
+def _deliver_all(subscriptions, message):
+    for subscription in subscriptions:
+        subscription.deliver(message)
+
+
+class InProcessBroker:
+    def __init__(self):
+        self._channels = {}  # channel -> {Subscription}
+        self._lock = threading.Lock()
+
+    def subscribe(self, channels, maxsize):
+        subscription = Subscription(self, channels, maxsize)
+        with self._lock:
+            for channel in subscription.channels:
+                self._channels.setdefault(channel, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            for channel in subscription.channels:
+                subscribers = self._channels.get(channel)
+                if subscribers is not None:
+                    subscribers.discard(subscription)
+                    if not subscribers:
+                        del self._channels[channel]
+
+    def publish(self, channel, message):
+        """Thread-safe; returns the number of streams reached."""
+        with self._lock:
+            subscribers = list(self._channels.get(channel, ()))
+        # One wake-up per event loop, not per stream
+        by_loop = {}
+        for subscription in subscribers:
+            by_loop.setdefault(subscription.loop, []).append(subscription)
+        for loop, group in by_loop.items():
+            try:
+                loop.call_soon_threadsafe(_deliver_all, group, message)
+            except RuntimeError:  # event loop already closed
+                for subscription in group:
+                    self.unsubscribe(subscription)
+        return len(subscribers)
+
+    def active(self):
+        """False when no stream is open here (publishers can skip their lookups)."""
+        return bool(self._channels)
+
+
+# =====================================================
+# Per-process broker
+# =====================================================
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def get_broker():
+    global _broker
+    with _broker_lock:
+        if _broker is None:
+            _broker = import_string(settings.REALTIME_BROKER)()
+        return _broker
+
+
+def publish(channel, event, data):
+    """Serialize once, fan out to every stream subscribed to `channel`."""
+    message = f"event: {event}\ndata: {json.dumps(data, cls=DjangoJSONEncoder)}\n\n"
+    return get_broker().publish(channel, message)
+
+
+# =====================================================
+# SSE response
+# =====================================================
+async def _stream(channels):
+    # Subscribe on first iteration: a response that is never streamed
+    # (client gone before headers) then leaves nothing registered.
+    subscription = get_broker().subscribe(channels, settings.REALTIME_QUEUE_SIZE)
+    try:
+        yield f"retry: {settings.REALTIME_RETRY_MS}\n\n"
+        while True:
+            try:
+                message = await asyncio.wait_for(subscription.get(), settings.REALTIME_HEARTBEAT)
+            except asyncio.TimeoutError:
+                yield ": ping\n\n"  # keeps proxies from closing idle streams
+                continue
+            yield message
+            if message is OVERFLOW:
+                return
+    finally:
+        subscription.close()
+
+
+def sse_response(request, channels):
+    """
+    text/event-stream response for `channels`. Call from an async view.
+    Under WSGI a stream would pin a worker thread forever, so it answers
+    204 instead: EventSource then stops retrying and pages fall back to
+    polling.
+    """
+    if not isinstance(request, ASGIRequest):
+        return HttpResponse(status=204)
+
+    response = StreamingHttpResponse(_stream(channels), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"  # nginx: don't buffer the stream
+    return response
+
+
+# =====================================================
+# ASGI dispatch for stream views
+# =====================================================
+def stream_view(view):
+    """
+    Mark an async view as a long-lived stream. Under ASGI it is served by
+    StreamRouter: no middleware runs, the request only gets `session` and
+    `auser()`, and Http404 / PermissionDenied become bare 404 / 403.
+    """
+    view.stream_view = True
+    return view
+
+
+class StreamRouter:
+    """Wraps the Django ASGI app; @stream_view routes bypass its middleware."""
+
+    def __init__(self, django_app):
+        self.django_app = django_app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["method"] == "GET":
+            try:
+                match = resolve(scope["path"])
+            except Resolver404:
+                match = None
+            if match is not None and getattr(match.func, "stream_view", False):
+                return await self.stream(match, scope, receive, send)
+        await self.django_app(scope, receive, send)
+
+    async def stream(self, match, scope, receive, send):
+        request = ASGIRequest(scope, io.BytesIO())
+        engine = import_string(f"{settings.SESSION_ENGINE}.SessionStore")
+        request.session = engine(request.COOKIES.get(settings.SESSION_COOKIE_NAME))
+        request.auser = partial(aget_user, request)
+        try:
+            response = await match.func(request, *match.args, **match.kwargs)
+        except Http404:
+            response = HttpResponseNotFound()
+        except PermissionDenied:
+            response = HttpResponseForbidden()
+        finally:
+            # No request_started / request_finished here: release the
+            # connection the lookups used before the stream goes idle.
+            await sync_to_async(close_old_connections)()
+
+        # Same disconnect handling as ASGIHandler.handle()
+        sender = asyncio.create_task(self.django_app.send_response(response, send))
+        listener = asyncio.create_task(self._disconnected(receive))
+        done, pending = await asyncio.wait({sender, listener}, return_when=asyncio.FIRST_COMPLETED)
+        for task in pending:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        if sender in done:
+            sender.result()
+
+    @staticmethod
+    async def _disconnected(receive):
+        while (await receive())["type"] != "http.disconnect":
+            pass
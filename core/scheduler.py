@@ -0,0 +1,48 @@
+# core/scheduler.py
+#
+# Minimal in-process periodic runner for web workers (no cron on the
+# free Render plan). Each task runs in its own daemon thread, at most
+# once per process. Tasks must be idempotent: every worker runs them.
+
+import logging
+import threading
+
+from django.db import close_old_connections
+
+logger = logging.getLogger(__name__)
+
+_started = set()
+_lock = threading.Lock()
+
+
+def _run_forever(name, interval, func, stop):
+    while not stop.wait(interval):
+        try:
+            func()
+        except Exception:
+            logger.exception(f"Periodic task {name} failed")
+        finally:
+            close_old_connections()
+
+
+def run_periodically(name, interval, func):
+    """
+    Call func() every `interval` seconds (first run after one interval).
+    Returns the stop Event, or None when disabled / already running.
+    """
+    if interval <= 0:
+        return None
+
+    with _lock:
+        if name in _started:
+            return None
+        _started.add(name)
+
+    stop = threading.Event()
+    threading.Thread(
+        target=_run_forever,
+        args=(name, interval, func, stop),
+        name=name,
+        daemon=True,
+    ).start()
+    return stop
@@ -46,9 +46,12 @@ INSTALLED_APPS = [
     "rest_framework",
     "rest_framework.authtoken",
 
+    "core",
     "users",
     "jobs",
     "applications",
+    "analytics",
+    "notifications",
     "api",
 ]
 
@@ -59,6 +62,7 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
+    "core.db_router.ReplicaReadsMiddleware",
 
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -83,7 +87,6 @@ TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
         "DIRS": [TEMPLATES_DIR],
-        "APP_DIRS": True,
         "OPTIONS": {
             "context_processors": [
                 "django.template.context_processors.debug",
@@ -91,6 +94,18 @@ TEMPLATES = [
                 "django.contrib.auth.context_processors.auth",
                 "django.contrib.messages.context_processors.messages",
             ],
+            # Explicit cached loader (replaces APP_DIRS=True): every template
+            # is parsed once per process. In development the autoreloader
+            # clears it when a template file changes.
+            "loaders": [
+                (
+                    "django.template.loaders.cached.Loader",
+                    [
+                        "django.template.loaders.filesystem.Loader",
+                        "django.template.loaders.app_directories.Loader",
+                    ],
+                ),
+            ],
         },
     },
 ]
@@ -100,8 +115,37 @@ WSGI_APPLICATION = "core.wsgi.application"
 # -------------------------------------------------------------------
 # DATABASE
 # -------------------------------------------------------------------
-
-if ENVIRONMENT == "production":
+# PostgreSQL in production, or locally when DB_HOST is set.
+#
+# Connections come from a psycopg pool per worker process and database
+# (DB_POOL=true): a request borrows an open connection instead of paying
+# TCP + TLS + auth for a new one, and returns it when done. Pooling needs
+# CONN_MAX_AGE = 0. With DB_POOL=false, connections persist CONN_MAX_AGE
+# seconds instead. Either way CONN_HEALTH_CHECKS tests a connection
+# before it is reused (the pool's check on lending).
+#
+# Sizing: every worker holds up to MAX_SIZE connections to each
+# database, so WEB_CONCURRENCY (gunicorn workers, same variable
+# gunicorn reads) x MAX_SIZE must stay within DB_CONNECTION_BUDGET, the
+# share of the server's max_connections this service may use (leave
+# room for migrations, cron and psql). MAX_SIZE defaults to that
+# quotient, capped at 20; MIN_SIZE connections are kept open while
+# idle. A request waits up to POOL_TIMEOUT seconds for a connection
+# when all are busy, then fails.
+
+DB_POOL = os.getenv("DB_POOL", "true").lower() == "true"
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "1"))
+DB_CONNECTION_BUDGET = int(os.getenv("DB_CONNECTION_BUDGET", "80"))
+DB_POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE", "2"))
+DB_POOL_MAX_SIZE = int(
+    os.getenv(
+        "DB_POOL_MAX_SIZE",
+        str(max(DB_POOL_MIN_SIZE, min(20, DB_CONNECTION_BUDGET // WEB_CONCURRENCY))),
+    )
+)
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "10"))
+
+if ENVIRONMENT == "production" or os.getenv("DB_HOST"):
     DATABASES = {
         "default": {
             "ENGINE": "django.db.backends.postgresql",
@@ -109,19 +153,75 @@ if ENVIRONMENT == "production":
             "USER": os.getenv("DB_USER"),
             "PASSWORD": os.getenv("DB_PASSWORD"),
             "HOST": os.getenv("DB_HOST"),
-            "PORT": "5432",
-            "CONN_MAX_AGE": 60,
-            "OPTIONS": {"sslmode": "require"},
+            "PORT": os.getenv("DB_PORT", "5432"),
+            "CONN_MAX_AGE": 0 if DB_POOL else int(os.getenv("CONN_MAX_AGE", "60")),
+            "CONN_HEALTH_CHECKS": True,
+            "OPTIONS": {"sslmode": os.getenv("DB_SSLMODE", "require")},
         }
     }
+    if DB_POOL:
+        DATABASES["default"]["OPTIONS"]["pool"] = {
+            "min_size": DB_POOL_MIN_SIZE,
+            "max_size": DB_POOL_MAX_SIZE,
+            "timeout": DB_POOL_TIMEOUT,
+            "max_idle": 5 * 60,
+            "max_lifetime": 30 * 60,
+        }
+    if os.getenv("DB_REPLICA_HOST"):
+        DATABASES["replica"] = {
+            **DATABASES["default"],
+            "OPTIONS": {**DATABASES["default"]["OPTIONS"]},  # own pool
+            "HOST": os.getenv("DB_REPLICA_HOST"),
+            "TEST": {"MIRROR": "default"},
+        }
 else:
     DATABASES = {
         "default": {
             "ENGINE": "django.db.backends.sqlite3",
             "NAME": BASE_DIR / "db.sqlite3",
-        }
+        },
+        # Same file unless DB_REPLICA_NAME is set (a replica with no lag);
+        # tests that use it get their own in-memory database
+        "replica": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": os.getenv("DB_REPLICA_NAME", BASE_DIR / "db.sqlite3"),
+        },
     }
 
+# Read replica (core/db_router.py): GET/HEAD requests to REPLICA_READ_VIEWS
+# (URL names, or dotted paths of unnamed API views) read from "replica".
+# A request's reads go to the primary once it has written, and its
+# client's for PIN_SECONDS after (cookie), to cover replication lag.
+# REPLICA_READ_VIEWS is comma-separated in the environment. The resume
+# ZIP export is not listed: it is a POST that records the archive it
+# serves, so it reads the primary.
+
+DATABASE_ROUTERS = ["core.db_router.ReplicaRouter"]
+REPLICA_READS = os.getenv(
+    "REPLICA_READS", "true" if ENVIRONMENT == "production" else "false"
+).lower() == "true"
+REPLICA_PIN_SECONDS = int(os.getenv("REPLICA_PIN_SECONDS", "5"))
+REPLICA_READ_VIEWS = set(
+    os.getenv("REPLICA_READ_VIEWS", "").split(",") if os.getenv("REPLICA_READ_VIEWS") else [
+        # Public job board
+        "public_jobs_list",
+        "public_job_detail",
+        "api.views.PublicJobListAPI",
+        "api.views.PublicJobFacetsAPI",
+        "api.views.PublicJobSuggestAPI",
+        "api.views.PublicJobDetailAPI",
+        # Dashboards
+        "admin_dashboard",
+        "admin_analytics",
+        "admin_chart_data",
+        "recruiter_dashboard",
+        "api.views.AnalyticsFunnelAPI",
+        "api.views.AnalyticsTimeToHireAPI",
+        "api.views.AnalyticsLeaderboardAPI",
+        "api.views.AnalyticsSeriesAPI",
+    ]
+)
+
 # -------------------------------------------------------------------
 # CACHE
 # -------------------------------------------------------------------
@@ -131,6 +231,16 @@ CACHES = {
     }
 }
 
+# Public job board facet counts. Job save/delete invalidates them in the
+# worker that made the change; the timeout bounds staleness elsewhere
+# (LocMemCache is per process).
+FACET_CACHE_TIMEOUT = 60
+
+# Candidate tracking page data (applications/tracking.py), dropped on
+# status change in the worker that made it; other workers serve it for
+# at most this long.
+TRACK_CACHE_TIMEOUT = 60
+
 
 # -------------------------------------------------------------------
 # AUTH
@@ -160,7 +270,39 @@ USE_TZ = True
 STATIC_URL = "/static/"
 STATIC_ROOT = BASE_DIR / "staticfiles"
 STATICFILES_DIRS = [BASE_DIR / "static"]
-STATICFILES_STORAGE = "whitenoise.storage.CompressedStaticFilesStorage"
+
+# Django 5.1+ only reads STORAGES (STATICFILES_STORAGE is ignored).
+# Manifest storage fingerprints every file (theme.abc123def456.css) and
+# WhiteNoise writes .gz + .br (Brotli package) next to each one.
+# Hashed files are served with "Cache-Control: max-age=315360000, immutable".
+STORAGES = {
+    "default": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+    },
+    "staticfiles": {
+        "BACKEND": (
+            "whitenoise.storage.CompressedManifestStaticFilesStorage"
+            if ENVIRONMENT == "production"
+            else "django.contrib.staticfiles.storage.StaticFilesStorage"
+        ),
+    },
+    # Local stand-in for the private resume bucket (applications/storage.py).
+    # Outside MEDIA_ROOT: only reachable through signed URLs.
+    "resumes": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+        "OPTIONS": {"location": BASE_DIR / "private_media"},
+    },
+}
+
+# Minified bundles built by `python manage.py build_assets` into static/dist/.
+# Sources are merged in order; {% asset_bundle %} serves the bundle in
+# production and the individual sources in development.
+ASSET_BUNDLES = {
+    "base.css": ["theme.css", "css/pages/sidebar.css"],
+    "base.js": ["js/base.js"],
+    "public_jobs.css": ["css/pages/public_jobs.css"],
+}
+ASSET_BUNDLES_ENABLED = ENVIRONMENT == "production"
 
 
 # -------------------------------------------------------------------
@@ -170,6 +312,196 @@ STATICFILES_STORAGE = "whitenoise.storage.CompressedStaticFilesStorage"
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
 
+# -------------------------------------------------------------------
+# RESUME TEXT EXTRACTION
+# -------------------------------------------------------------------
+# Size of the per-worker process pool that parses uploaded PDFs.
+# 0 = extract inline in the calling thread (tests / scripts).
+
+RESUME_EXTRACT_WORKERS = int(os.getenv("RESUME_EXTRACT_WORKERS", "2"))
+
+# How long resume term document frequencies (TF-IDF idf) stay cached
+MATCH_IDF_CACHE_TIMEOUT = 60 * 60
+
+# -------------------------------------------------------------------
+# RESUME UPLOAD VALIDATION
+# -------------------------------------------------------------------
+# Uploads are parsed, stripped of active content and rewritten in a
+# per-worker process pool (applications/resume_check.py) before storage.
+# 0 workers = check inline (tests / scripts). QUEUE = checks allowed in
+# flight per pool process; beyond that the upload is refused as busy.
+
+RESUME_CHECK_WORKERS = int(os.getenv("RESUME_CHECK_WORKERS", "2"))
+RESUME_CHECK_QUEUE = int(os.getenv("RESUME_CHECK_QUEUE", "4"))
+RESUME_CHECK_TIMEOUT = int(os.getenv("RESUME_CHECK_TIMEOUT", "10"))
+RESUME_MAX_PAGES = 10
+RESUME_COMPRESS = os.getenv("RESUME_COMPRESS", "true").lower() == "true"
+
+# Stored resume files are shared by content hash (applications/resume_store.py).
+# A file no application references is deleted GRACE seconds later, by a
+# thread in each web worker every INTERVAL seconds (0 = off; run
+# `manage.py collect_resume_blobs` from cron instead).
+
+RESUME_BLOB_GC_INTERVAL = int(
+    os.getenv("RESUME_BLOB_GC_INTERVAL", "86400" if ENVIRONMENT == "production" else "0")
+)
+RESUME_BLOB_GC_GRACE = 24 * 60 * 60
+
+# -------------------------------------------------------------------
+# APPLY DEDUPLICATION
+# -------------------------------------------------------------------
+# Repeated apply submissions with the same key (Idempotency-Key header,
+# apply form token) get the first response back (applications/
+# idempotency.py). A repeat waits up to WAIT seconds for the first to
+# finish; a claim unanswered for LOCK_TIMEOUT seconds is taken over.
+# Keys are kept KEY_TTL seconds, purged by a thread in each web worker
+# every PURGE_INTERVAL seconds (0 = off).
+
+IDEMPOTENCY_WAIT = 10
+IDEMPOTENCY_LOCK_TIMEOUT = 60
+IDEMPOTENCY_KEY_TTL = 24 * 60 * 60
+IDEMPOTENCY_PURGE_INTERVAL = int(
+    os.getenv("IDEMPOTENCY_PURGE_INTERVAL", "3600" if ENVIRONMENT == "production" else "0")
+)
+
+# -------------------------------------------------------------------
+# RESUME STORAGE + PREVIEW
+# -------------------------------------------------------------------
+# Module holding the resume files: the private Supabase bucket, or the
+# local stand-in in STORAGES["resumes"] when Supabase isn't configured.
+# Previews use signed URLs valid for TTL seconds, cached per stored
+# file for 80% of that (applications/resume_preview.py). Thumbnails are
+# first-page PNGs, WIDTH pixels wide.
+
+RESUME_STORAGE_BACKEND = os.getenv(
+    "RESUME_STORAGE_BACKEND",
+    "applications.supabase_client" if os.getenv("SUPABASE_URL") else "applications.storage",
+)
+RESUME_SIGNED_URL_TTL = 10 * 60
+RESUME_THUMBNAIL_WIDTH = 240
+
+# -------------------------------------------------------------------
+# BULK RESUME DOWNLOAD
+# -------------------------------------------------------------------
+# "Download all resumes" streams a ZIP built on the fly, fetching with
+# FETCH_WORKERS threads (applications/resume_archive.py). Jobs with more
+# than STREAM_LIMIT resumes get an archive built in the background in
+# parts of PART_SIZE; a build with no heartbeat for STALE seconds is
+# resumed, and archives are deleted after TTL, by a thread in each web
+# worker every INTERVAL seconds (0 = off; run
+# `manage.py build_resume_archives` from cron instead).
+
+RESUME_ARCHIVE_FETCH_WORKERS = int(os.getenv("RESUME_ARCHIVE_FETCH_WORKERS", "8"))
+RESUME_ARCHIVE_STREAM_LIMIT = int(os.getenv("RESUME_ARCHIVE_STREAM_LIMIT", "1000"))
+RESUME_ARCHIVE_PART_SIZE = 500
+RESUME_ARCHIVE_STALE = 10 * 60
+RESUME_ARCHIVE_TTL = 2 * 24 * 60 * 60
+RESUME_ARCHIVE_INTERVAL = int(
+    os.getenv("RESUME_ARCHIVE_INTERVAL", "300" if ENVIRONMENT == "production" else "0")
+)
+
+# -------------------------------------------------------------------
+# OUTBOX (emails and other side effects)
+# -------------------------------------------------------------------
+# Emails are written to the outbox in the same transaction as the change
+# that causes them and sent by a relay thread in each web worker, woken
+# on commit and every INTERVAL seconds (0 = off, the default outside
+# production; run `manage.py relay_outbox --loop` as a separate worker
+# instead). Rows are claimed BATCH_SIZE at a time (leased for LEASE
+# seconds) and emails go out SEND_BATCH per API call, WORKERS calls in
+# parallel.
+# Failures retry after RETRY_BASE * 2^n seconds, up to MAX_ATTEMPTS.
+# Sent rows are kept KEEP_SENT seconds (idempotency window).
+
+OUTBOX_RELAY_INTERVAL = int(
+    os.getenv("OUTBOX_RELAY_INTERVAL", "5" if ENVIRONMENT == "production" else "0")
+)
+OUTBOX_RELAY_WORKERS = int(os.getenv("OUTBOX_RELAY_WORKERS", "4"))
+OUTBOX_BATCH_SIZE = 200
+OUTBOX_SEND_BATCH = 50
+OUTBOX_LEASE = 5 * 60
+OUTBOX_MAX_ATTEMPTS = 8
+OUTBOX_RETRY_BASE = 30
+OUTBOX_KEEP_SENT = 7 * 24 * 60 * 60
+
+# Bursty notifications are summarised per recipient
+# (notifications/digest.py): a candidate's status updates go out in one
+# email WINDOW seconds after the first one, recruiters get new applicants
+# once a day at RECRUITER_DIGEST_HOUR local time. Due digests are queued
+# by a thread in each web worker every INTERVAL seconds (0 = off, the
+# default outside production; run `manage.py flush_digests` from cron
+# instead).
+
+NOTIFICATION_DIGEST_WINDOW = int(os.getenv("NOTIFICATION_DIGEST_WINDOW", str(15 * 60)))
+NOTIFICATION_DIGEST_INTERVAL = int(
+    os.getenv("NOTIFICATION_DIGEST_INTERVAL", "60" if ENVIRONMENT == "production" else "0")
+)
+RECRUITER_DIGEST_HOUR = int(os.getenv("RECRUITER_DIGEST_HOUR", "9"))
+
+# -------------------------------------------------------------------
+# REPEAT APPLICANT DETECTION
+# -------------------------------------------------------------------
+# Per-worker Bloom filter of applicant emails/phones, rebuilt from the DB
+# every REFRESH seconds (applications/duplicates.py).
+
+REPEAT_APPLICANT_DETECTION = os.getenv("REPEAT_APPLICANT_DETECTION", "true").lower() == "true"
+REPEAT_APPLICANT_FILTER_REFRESH = int(os.getenv("REPEAT_APPLICANT_FILTER_REFRESH", "300"))
+REPEAT_APPLICANT_FILTER_CAPACITY = 100_000
+
+# -------------------------------------------------------------------
+# JOB SEARCH SUGGESTIONS
+# -------------------------------------------------------------------
+# Per-worker prefix trie of job titles / locations (jobs/suggest.py).
+# Job signals update it in place; full rebuild every REFRESH seconds
+# picks up changes made in other worker processes.
+
+JOB_SUGGEST_REFRESH = int(os.getenv("JOB_SUGGEST_REFRESH", "600"))
+
+# -------------------------------------------------------------------
+# JOB DEADLINE EXPIRY
+# -------------------------------------------------------------------
+# Seconds between archive_expired_jobs runs inside each web worker
+# (jobs/expiry.py). 0 = off; run `manage.py archive_expired_jobs` from
+# cron instead. Public queries hide past-deadline jobs either way.
+
+JOB_EXPIRY_INTERVAL = int(
+    os.getenv("JOB_EXPIRY_INTERVAL", "3600" if ENVIRONMENT == "production" else "0")
+)
+
+# -------------------------------------------------------------------
+# HIRING ANALYTICS ROLLUPS
+# -------------------------------------------------------------------
+# Seconds between incremental rollup builds inside each web worker
+# (analytics/rollups.py). 0 = off; run `manage.py build_rollups` hourly
+# from cron instead. Events younger than the lag are left for the next
+# run, so few transactions commit behind the watermark; ids that do are
+# picked up by later runs for up to GAP_TTL seconds.
+
+ANALYTICS_ROLLUP_INTERVAL = int(
+    os.getenv("ANALYTICS_ROLLUP_INTERVAL", "3600" if ENVIRONMENT == "production" else "0")
+)
+ANALYTICS_ROLLUP_LAG = 5 * 60
+ANALYTICS_ROLLUP_GAP_TTL = 24 * 60 * 60
+
+# Dashboard chart series (analytics/series.py): days kept in each series
+# store, and seconds a rendered chart response stays cached. New
+# applications, status changes and jobs invalidate responses in the
+# worker that made the change; the timeout bounds staleness elsewhere.
+ANALYTICS_SERIES_DAYS = int(os.getenv("ANALYTICS_SERIES_DAYS", "730"))
+ANALYTICS_SERIES_TIMEOUT = 300
+
+# -------------------------------------------------------------------
+# REAL-TIME PUSH (SSE)
+# -------------------------------------------------------------------
+# core/realtime.py. Streams need the ASGI app (core/asgi.py); under WSGI
+# the SSE endpoints answer 204 and pages keep polling. The in-process
+# broker only reaches streams held by the same worker process.
+
+REALTIME_BROKER = os.getenv("REALTIME_BROKER", "core.realtime.InProcessBroker")
+REALTIME_QUEUE_SIZE = 100   # undelivered messages per stream before "resync"
+REALTIME_HEARTBEAT = 25     # seconds between keep-alive comments
+REALTIME_RETRY_MS = 5000    # EventSource reconnect delay
+
 # -------------------------------------------------------------------
 # EMAIL (BREVO)
 # -------------------------------------------------------------------
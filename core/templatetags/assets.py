@@ -0,0 +1,32 @@
+from django import template
+from django.conf import settings
+from django.templatetags.static import static
+from django.utils.html import format_html_join
+
+from core.assets import bundle_path
+
+register = template.Library()
+
+
+def _tag_for(name, urls):
+    if name.endswith(".css"):
+        return format_html_join(
+            "\n", '<link rel="stylesheet" href="{}">', ((url,) for url in urls)
+        )
+    return format_html_join("\n", '<script src="{}"></script>', ((url,) for url in urls))
+
+
+@register.simple_tag
+def asset_bundle(name):
+    """
+    {% asset_bundle "base.css" %}
+
+    Production -> one fingerprinted, minified bundle (dist/base.css).
+    Development -> the original source files, so edits show up without a build.
+    """
+    if settings.ASSET_BUNDLES_ENABLED:
+        urls = [static(bundle_path(name))]
+    else:
+        urls = [static(path) for path in settings.ASSET_BUNDLES[name]]
+
+    return _tag_for(name, urls)
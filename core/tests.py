@@ -0,0 +1,238 @@
+import asyncio
+import os
+import runpy
+from unittest import mock, skipUnless
+
+from asgiref.sync import sync_to_async
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.cache.utils import make_template_fragment_key
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from django.utils.text import slugify
+
+from applications.models import Application
+from applications.realtime import publish_status_events, recruiter_channel
+from applications.status import change_status
+from core import realtime
+from core import settings as core_settings
+from core.assets import concat_css, minify_css
+from core.db_router import PIN_COOKIE, ReadState, _state
+from core.realtime import OVERFLOW, InProcessBroker, publish
+from jobs.models import Job
+from users.models import User
+
+
+@skipUnless("replica" in settings.DATABASES, "no replica database configured")
+@override_settings(REPLICA_READS=True)
+class ReplicaRoutingTests(TestCase):
+    """
+    "replica" is a separate test database here, not a mirror: a row on
+    only one side shows which database a request read from.
+    """
+
+    databases = {"default", "replica"} & set(settings.DATABASES)
+
+    def make_job(self, title, using):
+        # bulk_create: Job.save() would resolve the location on the primary
+        [job] = Job.objects.using(using).bulk_create([
+            Job(title=title, slug=slugify(title), description="Test job", location="Pune", work_mode="onsite")
+        ])
+        return job
+
+    def setUp(self):
+        cache.clear()
+        self.primary_job = self.make_job("Only on primary", "default")
+        self.make_job("Replicated earlier", "replica")
+
+    def test_public_reads_go_to_replica(self):
+        response = self.client.get(reverse("public_jobs_list"))
+        self.assertContains(response, "Replicated earlier")
+        self.assertNotContains(response, "Only on primary")
+
+        titles = [job["title"] for job in self.client.get("/api/jobs/").json()]
+        self.assertEqual(titles, ["Replicated earlier"])
+
+    @override_settings(REPLICA_READS=False)
+    def test_disabled_reads_primary(self):
+        response = self.client.get(reverse("public_jobs_list"))
+        self.assertContains(response, "Only on primary")
+        self.assertNotContains(response, "Replicated earlier")
+
+    def test_client_that_wrote_reads_primary_for_pin_window(self):
+        response = self.client.post(
+            f"/api/apply/{self.primary_job.slug}/",
+            {"full_name": "Asha Rao", "email": "asha@example.com", "phone": "9876543210"},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.cookies[PIN_COOKIE]["max-age"], 5)
+
+        # Own write not replicated yet: read from the primary
+        response = self.client.get(reverse("public_job_detail", args=[self.primary_job.slug]))
+        self.assertContains(response, "Only on primary")
+
+        self.client.cookies.pop(PIN_COOKIE)
+        response = self.client.get(reverse("public_jobs_list"))
+        self.assertNotContains(response, "Only on primary")
+
+    def test_reads_after_a_write_and_auth_tables_use_primary(self):
+        state = ReadState()
+        state.replica = True
+        token = _state.set(state)
+        try:
+            self.assertEqual(Job.objects.all().db, "replica")
+            self.assertEqual(User.objects.all().db, "default")
+
+            job = Job.objects.get(title="Replicated earlier")
+            job.title = "Renamed"
+            job.save()  # read from the replica, saved to the primary
+            self.assertEqual(job._state.db, "default")
+            self.assertEqual(Job.objects.all().db, "default")
+        finally:
+            _state.reset(token)
+
+        self.assertEqual(Job.objects.using("replica").get(pk=job.pk).title, "Replicated earlier")
+
+
+class AssetMinifyTests(SimpleTestCase):
+
+    def test_minify_keeps_selector_meaning(self):
+        css = """
+        /* links */
+        nav a :hover ,
+        .card > p { color : red ;  margin: 0 auto; }
+        @media (max-width: 600px) { a:focus { outline: none; } }
+        """
+        self.assertEqual(
+            minify_css(css),
+            "nav a :hover,.card>p{color:red;margin:0 auto}@media (max-width:600px){a:focus{outline:none}}",
+        )
+
+    def test_concat_hoists_imports_once(self):
+        font = "@import url('https://fonts.example/inter.css');"
+        merged = concat_css([f"{font}\nbody{{margin:0}}", f"{font}\np{{margin:0}}"])
+        self.assertEqual(merged.count("@import"), 1)
+        self.assertTrue(merged.startswith(font))
+
+
+class TemplateCachingTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+
+    def test_templates_are_compiled_once_per_process(self):
+        from django.template import engines
+        from django.template.loaders.cached import Loader
+
+        engine = engines["django"].engine
+        self.assertIsInstance(engine.template_loaders[0], Loader)
+        self.assertIs(engine.get_template("base.html"), engine.get_template("base.html"))
+
+    def test_sidebar_fragment_is_cached_per_role(self):
+        recruiter = User.objects.create_user(
+            email="rec@example.com", password="pw-12345!", role="RECRUITER", is_active=True
+        )
+        admin = User.objects.create_user(
+            email="admin@example.com", password="pw-12345!", role="ADMIN", is_active=True
+        )
+
+        self.client.force_login(recruiter)
+        response = self.client.get(reverse("recruiter_dashboard"))
+        self.assertContains(response, f'href="{reverse("recruiter_dashboard")}"')
+        fragment = cache.get(make_template_fragment_key("sidebar_nav", [True, "RECRUITER"]))
+        self.assertIn(reverse("recruiter_dashboard"), fragment)
+
+        # Another role gets its own copy, not the recruiter's
+        self.client.force_login(admin)
+        response = self.client.get(reverse("admin_dashboard"))
+        self.assertContains(response, f'href="{reverse("admin_dashboard")}"')
+        self.assertNotContains(response, f'href="{reverse("recruiter_dashboard")}"')
+
+
+class RealtimeTests(TestCase):
+
+    def setUp(self):
+        patcher = mock.patch.object(realtime, "_broker", InProcessBroker())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.recruiter = User.objects.create_user(
+            email="rec@example.com", password="pw-12345!", role="RECRUITER", is_active=True
+        )
+        job = Job.objects.create(
+            title="Backend", description="x", location="Pune", work_mode="onsite", created_by=self.recruiter,
+        )
+        self.app = Application.objects.create(job=job, full_name="Asha Rao", email="c@example.com", phone="9876543210")
+        change_status(self.app, "interview")
+        self.url = reverse("track_application_events", args=[self.app.tracking_token])
+
+    def test_wsgi_requests_get_no_stream(self):
+        self.assertEqual(self.client.get(self.url).status_code, 204)
+
+    async def test_status_event_reaches_track_stream(self):
+        response = await self.async_client.get(self.url)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        stream = aiter(response.streaming_content)
+        self.assertEqual(await anext(stream), f"retry: {settings.REALTIME_RETRY_MS}\n\n".encode())
+
+        events = await sync_to_async(list)(self.app.status_events.order_by("id"))
+        await sync_to_async(publish_status_events)(events)
+        message = (await asyncio.wait_for(anext(stream), 5)).decode()
+        self.assertTrue(message.startswith("event: status\n"))
+        self.assertIn('"status": "interview"', message)
+
+        # Client disconnects: the pending read is cancelled and the stream unsubscribes
+        pending = asyncio.ensure_future(anext(stream))
+        await asyncio.sleep(0)
+        pending.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await pending
+        self.assertFalse(realtime.get_broker().active())
+
+    async def test_one_publish_fans_out_and_slow_streams_resync(self):
+        broker = realtime.get_broker()
+        channel = recruiter_channel(self.recruiter.pk)
+        fast = broker.subscribe([channel], 10)
+        slow = broker.subscribe([channel, "other"], 2)
+
+        self.assertEqual(publish(channel, "application", {"application": 1}), 2)
+        await asyncio.sleep(0)  # one call_soon_threadsafe for the whole loop
+        self.assertEqual(await fast.get(), 'event: application\ndata: {"application": 1}\n\n')
+
+        for i in range(3):
+            publish(channel, "status", {"application": i})
+        await asyncio.sleep(0)
+        self.assertEqual(fast.queue.qsize(), 3)
+        # Backlog dropped, stream told to reload
+        self.assertEqual(slow.queue.qsize(), 1)
+        self.assertIs(await slow.get(), OVERFLOW)
+
+        fast.close()
+        slow.close()
+        self.assertFalse(broker.active())
+
+
+class DatabasePoolSettingsTests(SimpleTestCase):
+
+    def load_settings(self, **env):
+        env = {"ENVIRONMENT": "production", "DB_HOST": "db.internal", **env}
+        with mock.patch.dict(os.environ, env):
+            return runpy.run_path(core_settings.__file__)
+
+    def test_max_size_splits_connection_budget_across_workers(self):
+        config = self.load_settings(WEB_CONCURRENCY="3", DB_CONNECTION_BUDGET="60")
+        self.assertEqual(config["DB_POOL_MAX_SIZE"], 20)
+        self.assertEqual(config["DATABASES"]["default"]["CONN_MAX_AGE"], 0)
+        self.assertEqual(config["DATABASES"]["default"]["OPTIONS"]["pool"]["max_size"], 20)
+
+        self.assertEqual(self.load_settings(WEB_CONCURRENCY="8", DB_CONNECTION_BUDGET="60")["DB_POOL_MAX_SIZE"], 7)
+        # Never below MIN_SIZE, however small the budget
+        self.assertEqual(self.load_settings(WEB_CONCURRENCY="40", DB_CONNECTION_BUDGET="40")["DB_POOL_MAX_SIZE"], 2)
+        self.assertEqual(self.load_settings(DB_POOL_MAX_SIZE="5")["DB_POOL_MAX_SIZE"], 5)
+
+    def test_pool_off_keeps_persistent_connections(self):
+        config = self.load_settings(DB_POOL="false", DB_REPLICA_HOST="replica.internal")
+        self.assertNotIn("pool", config["DATABASES"]["default"]["OPTIONS"])
+        self.assertEqual(config["DATABASES"]["default"]["CONN_MAX_AGE"], 60)
+        self.assertEqual(config["DATABASES"]["replica"]["HOST"], "replica.internal")
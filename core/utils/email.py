@@ -10,7 +10,13 @@ logger = logging.getLogger(__name__)
 BREVO_URL = "https://api.brevo.com/v3/smtp/email"
 
 
-def send_brevo_email(to_email: str, subject: str, html_content: str) -> bool:
+def send_brevo_email(
+    to_email: str,
+    subject: str,
+    html_content: str,
+    text_content: str | None = None,
+    headers: dict | None = None,
+) -> bool:
     """
     Sends transactional email using Brevo API
     Used for:
@@ -18,6 +24,10 @@ def send_brevo_email(to_email: str, subject: str, html_content: str) -> bool:
     Password reset
     HR invite 
     update status 
+
+    Called by the outbox relay (notifications/outbox.py), not by views.
+    `text_content` is the plain-text alternative; `headers` are added to
+    the email (idempotency key).
     """
 
     payload = {
@@ -31,7 +41,46 @@ def send_brevo_email(to_email: str, subject: str, html_content: str) -> bool:
         "subject": subject,
         "htmlContent": html_content,
     }
+    if text_content:
+        payload["textContent"] = text_content
+    if headers:
+        payload["headers"] = headers
+
+    return _post(payload)
+
+
+def send_brevo_batch(messages: list[dict]) -> bool:
+    """
+    Several different emails in ONE API call (Brevo messageVersions,
+    at most 1000 versions). Each message is a dict with to_email,
+    subject, html_content and optional text_content. All or nothing:
+    False means none of them was accepted.
+    """
+    versions = []
+    for message in messages:
+        version = {
+            "to": [{"email": message["to_email"]}],
+            "subject": message["subject"],
+            "htmlContent": message["html_content"],
+        }
+        if message.get("text_content"):
+            version["textContent"] = message["text_content"]
+        versions.append(version)
+
+    payload = {
+        "sender": {
+            "email": settings.BREVO_SENDER_EMAIL,
+            "name": settings.BREVO_SENDER_NAME,
+        },
+        # Top-level subject/htmlContent are required; each version overrides them
+        "subject": messages[0]["subject"],
+        "htmlContent": messages[0]["html_content"],
+        "messageVersions": versions,
+    }
+    return _post(payload)
+
 
+def _post(payload):
     headers = {
         "accept": "application/json",
         "api-key": settings.BREVO_API_KEY, # api-key → secret key from Brevo account. Without this, Brevo will reject request.
@@ -0,0 +1,56 @@
+# jobs/expiry.py
+#
+# Deadline enforcement. Public queries already hide past-deadline jobs
+# (Job.objects.open()); archiving flips the row itself so it drops out of
+# the partial job_open_created_idx index and stops weighing on the board.
+# Run by the archive_expired_jobs command (cron) or, when
+# JOB_EXPIRY_INTERVAL > 0, by a daemon thread in each web worker.
+
+import logging
+
+from django.conf import settings
+from django.utils import timezone
+
+from core.scheduler import run_periodically
+from jobs.facets import bump_facet_version
+from jobs.models import Job
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 1000
+
+
+def archive_expired_jobs(today=None, batch_size=BATCH_SIZE):
+    """
+    Archive every unarchived job whose deadline is before `today`,
+    `batch_size` rows per UPDATE (short locks). Returns the count.
+    Idempotent: safe to run from several workers at once.
+    """
+    today = today or timezone.localdate()
+    archived = 0
+
+    while True:
+        ids = list(
+            Job.objects.filter(is_archived=False, deadline__lt=today)
+            .order_by("deadline")
+            .values_list("id", flat=True)[:batch_size]
+        )
+        if not ids:
+            break
+
+        archived += Job.objects.filter(id__in=ids, is_archived=False).update(
+            is_archived=True,
+            archived_at=timezone.now(),
+        )
+
+    if archived:
+        # update() skips post_save -> invalidate cached facets / bounds here
+        bump_facet_version()
+        logger.info(f"Archived {archived} expired jobs")
+
+    return archived
+
+
+def start_expiry_scheduler():
+    """Daemon thread per web worker when JOB_EXPIRY_INTERVAL > 0."""
+    return run_periodically("job-expiry", settings.JOB_EXPIRY_INTERVAL, archive_expired_jobs)
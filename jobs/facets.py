@@ -0,0 +1,162 @@
+# jobs/facets.py
+#
+# Facet counts for the public job board.
+# ONE grouped query returns counts per (work mode, job type, location,
+# salary bucket) for the non-facet filters (search + salary range). Each
+# facet is then summed in Python while ignoring its OWN filter, so a
+# candidate who picked "Remote" still sees how many Hybrid jobs exist.
+
+import hashlib
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Case, CharField, Count, Max, Min, Value, When
+
+from jobs.filters import apply_search_filters, public_jobs, resolve_location_ids
+from jobs.models import Job
+
+FACET_VERSION_KEY = "jobs:facets:version"
+FACET_PARAMS = (
+    "search", "location", "radius_km", "work_mode", "job_type", "min_salary", "max_salary",
+)
+TOP_LOCATIONS = 10
+
+# (key, label, lower bound INR inclusive, upper bound INR exclusive)
+SALARY_BUCKETS = [
+    ("lt_3l", "Below 3 LPA", None, 300_000),
+    ("3_6l", "3–6 LPA", 300_000, 600_000),
+    ("6_10l", "6–10 LPA", 600_000, 1_000_000),
+    ("10_20l", "10–20 LPA", 1_000_000, 2_000_000),
+    ("20l_plus", "20+ LPA", 2_000_000, None),
+]
+UNDISCLOSED = ("undisclosed", "Not disclosed")
+
+
+def salary_bucket_expression(field="annual_min_salary"):
+    whens = [When(**{f"{field}__isnull": True}, then=Value(UNDISCLOSED[0]))]
+    whens += [
+        When(**{f"{field}__lt": upper}, then=Value(key))
+        for key, _, _, upper in SALARY_BUCKETS
+        if upper is not None
+    ]
+    return Case(*whens, default=Value(SALARY_BUCKETS[-1][0]), output_field=CharField())
+
+
+def bump_facet_version():
+    """Invalidate every cached facet result and salary bounds (called on Job save/delete)."""
+    try:
+        cache.incr(FACET_VERSION_KEY)
+    except ValueError:
+        cache.set(FACET_VERSION_KEY, 1, None)
+
+
+def _cache_key(params):
+    version = cache.get_or_set(FACET_VERSION_KEY, 1, None)
+    raw = "&".join(f"{name}={params.get(name) or ''}" for name in FACET_PARAMS)
+    return f"jobs:facets:{version}:{hashlib.md5(raw.encode()).hexdigest()}"
+
+
+def _grouped_rows(params):
+    return (
+        apply_search_filters(public_jobs(), params)
+        .annotate(salary_bucket=salary_bucket_expression())
+        .values(
+            "work_mode", "employment_type", "location",
+            "canonical_location", "canonical_location__city", "salary_bucket",
+        )
+        .annotate(n=Count("id"))
+        .order_by()
+    )
+
+
+def compute_facets(params):
+    key = _cache_key(params)
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+
+    location = (params.get("location") or "").strip().lower()
+    location_ids = resolve_location_ids(params) if location else None
+    if location_ids is not None:
+        location_ids = set(location_ids)
+    work_mode = params.get("work_mode") or ""
+    job_type = params.get("job_type") or ""
+
+    def location_matches(row):
+        if not location:
+            return True
+        if location_ids is None:
+            return location in row["location"].lower()
+        return row["canonical_location"] in location_ids
+
+    def matches(row, skip):
+        if skip != "location" and not location_matches(row):
+            return False
+        if skip != "work_mode" and work_mode and row["work_mode"] != work_mode:
+            return False
+        if skip != "job_type" and job_type and row["employment_type"] != job_type:
+            return False
+        return True
+
+    work_modes = Counter()
+    job_types = Counter()
+    locations = Counter()
+    salaries = Counter()
+    total = 0
+
+    for row in _grouped_rows(params):
+        n = row["n"]
+        if matches(row, "work_mode"):
+            work_modes[row["work_mode"]] += n
+        if matches(row, "job_type"):
+            job_types[row["employment_type"]] += n
+        if matches(row, "location"):
+            # Group spelling variants under the canonical city name
+            locations[row["canonical_location__city"] or row["location"]] += n
+        if matches(row, None):
+            salaries[row["salary_bucket"]] += n
+            total += n
+
+    facets = {
+        "total": total,
+        "work_mode": [
+            {"value": value, "label": label, "count": work_modes[value]}
+            for value, label in Job.WORK_MODES
+        ],
+        "job_type": [
+            {"value": value, "label": label, "count": job_types[value]}
+            for value, label in Job.EMPLOYMENT_TYPES
+        ],
+        "location": [
+            {"value": value, "label": value, "count": count}
+            for value, count in locations.most_common(TOP_LOCATIONS)
+        ],
+        "salary": [
+            {"value": value, "label": label, "count": salaries[value]}
+            for value, label, _, _ in SALARY_BUCKETS
+        ] + [
+            {"value": UNDISCLOSED[0], "label": UNDISCLOSED[1], "count": salaries[UNDISCLOSED[0]]}
+        ],
+    }
+
+    cache.set(key, facets, settings.FACET_CACHE_TIMEOUT)
+    return facets
+
+
+def salary_bounds():
+    """
+    (lowest, highest) annualized salary on the public board, for the
+    salary slider. Cached until the next Job save/delete.
+    """
+    version = cache.get_or_set(FACET_VERSION_KEY, 1, None)
+    key = f"jobs:salary_bounds:{version}"
+    bounds = cache.get(key)
+    if bounds is None:
+        row = public_jobs().aggregate(
+            low=Min("annual_min_salary"),
+            high=Max("annual_max_salary"),
+        )
+        bounds = (row["low"] or 0, row["high"] or 1000000)
+        cache.set(key, bounds, settings.FACET_CACHE_TIMEOUT)
+    return bounds
@@ -0,0 +1,110 @@
+# jobs/filters.py
+#
+# Public job board filters, shared by PublicJobListView, PublicJobListAPI
+# and the facet counts (jobs/facets.py).
+
+from django.db.models import F, Q
+
+from jobs.geo import lookup_place
+from jobs.models import Job, Location
+
+
+def public_jobs():
+    # Open postings only: not deleted, not archived, deadline not passed
+    return Job.objects.open()
+
+
+def apply_search_filters(qs, params):
+    """
+    Filters that are NOT facets: free-text search and the salary range.
+    NULL (undisclosed) salaries never match a salary range.
+    """
+    search = params.get("search")
+    min_salary = params.get("min_salary")
+    max_salary = params.get("max_salary")
+
+    # ----------------------------
+    # Search
+    # ----------------------------
+    if search:
+        qs = qs.filter(
+            Q(title__icontains=search) |
+            Q(description__icontains=search)
+        )
+
+    # ----------------------------
+    # Salary range (OVERLAP, annualized INR)
+    # ----------------------------
+    # A job matches when its range intersects [min_salary, max_salary],
+    # so "8–12 LPA" shows up for a "10–15 LPA" search. Monthly salaries
+    # are compared as x12 via the annual_* columns.
+    if min_salary:
+        qs = qs.filter(annual_max_salary__gte=min_salary)
+
+    if max_salary:
+        qs = qs.filter(annual_min_salary__lte=max_salary)
+
+    return qs
+
+
+def apply_sorting(qs, sort):
+    """
+    salary_low / salary_high sort on the annualized columns with
+    undisclosed salaries last (backed by the job_annual_*_idx indexes).
+    """
+    if sort == "salary_low":
+        return qs.order_by(F("annual_min_salary").asc(nulls_last=True), "-created_at")
+    if sort == "salary_high":
+        return qs.order_by(F("annual_max_salary").desc(nulls_last=True), "-created_at")
+    return qs.order_by("-created_at")
+
+
+def resolve_location_ids(params):
+    """
+    Canonical Location ids the `location` param stands for:
+    - the exact city ("Bangalore" -> Bengaluru), or
+    - every city within `radius_km` of it ("near Pune").
+    None when the text is not in the gazetteer (substring match fallback).
+    """
+    place = lookup_place(params.get("location"))
+    if not place:
+        return None
+
+    try:
+        radius_km = float(params.get("radius_km") or 0)
+    except ValueError:
+        radius_km = 0
+
+    if radius_km > 0:
+        return Location.ids_within(place["latitude"], place["longitude"], radius_km)
+
+    return list(
+        Location.objects.filter(
+            city=place["city"], state=place["state"], country=place["country"]
+        ).values_list("id", flat=True)
+    )
+
+
+def apply_facet_filters(qs, params):
+    """
+    Filters that also have facet counts: location, work mode, job type.
+    """
+    location = params.get("location")
+    work_mode = params.get("work_mode")
+    job_type = params.get("job_type")
+
+    if location:
+        location_ids = resolve_location_ids(params)
+        if location_ids is None:
+            qs = qs.filter(location__icontains=location)
+        else:
+            # Indexed FK equality instead of LIKE '%...%'
+            qs = qs.filter(canonical_location_id__in=location_ids)
+
+    if work_mode:
+        qs = qs.filter(work_mode=work_mode)
+
+    if job_type:
+        qs = qs.filter(employment_type=job_type)
+
+    return qs
@@ -27,6 +27,9 @@ class JobForm(forms.ModelForm):
             "slug",
             "is_deleted",
             "created_at",
+            "canonical_location",
+            "is_archived",
+            "archived_at",
         ]
         widgets = {
             "deadline": forms.DateInput(attrs={"type": "date"}),
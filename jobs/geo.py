@@ -0,0 +1,84 @@
+# jobs/geo.py
+#
+# Offline gazetteer (jobs/data/gazetteer.csv) + distance math.
+# No model imports here: also used by the location data migration.
+
+import csv
+import math
+import re
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+GAZETTEER_PATH = Path(__file__).resolve().parent / "data" / "gazetteer.csv"
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = 111.32
+
+_SPLIT_RE = re.compile(r"[,/()|;]| - ")
+
+
+@lru_cache(maxsize=1)
+def load_gazetteer():
+    """
+    {lowercase name or alias: place dict}
+    place = {"city", "state", "country", "latitude", "longitude"}
+    """
+    index = {}
+    with open(GAZETTEER_PATH, newline="", encoding="utf-8") as fh:
+        for row in csv.DictReader(fh):
+            place = {
+                "city": row["city"],
+                "state": row["state"],
+                "country": row["country"],
+                "latitude": float(row["latitude"]),
+                "longitude": float(row["longitude"]),
+            }
+            names = [row["city"]] + [a for a in row["aliases"].split("|") if a]
+            for name in names:
+                index.setdefault(name.strip().lower(), place)
+    return index
+
+
+def lookup_place(text):
+    """
+    Map a free-text location ("Bangalore", "Pune, Maharashtra",
+    "Hybrid - Gurgaon") to a gazetteer place, or None ("Remote", unknown).
+    """
+    if not text:
+        return None
+
+    gazetteer = load_gazetteer()
+    text = text.strip().lower()
+
+    if text in gazetteer:
+        return gazetteer[text]
+
+    for part in _SPLIT_RE.split(text):
+        part = part.strip()
+        if part in gazetteer:
+            return gazetteer[part]
+    return None
+
+
+def bounding_box(lat, lon, radius_km):
+    """(south, north, west, east) degrees enclosing the radius circle."""
+    dlat = radius_km / KM_PER_DEGREE
+    dlon = radius_km / (KM_PER_DEGREE * max(math.cos(math.radians(lat)), 0.01))
+    return (
+        max(lat - dlat, -90.0),
+        min(lat + dlat, 90.0),
+        max(lon - dlon, -180.0),
+        min(lon + dlon, 180.0),
+    )
+
+
+def haversine_km(lat, lon, lats, lons):
+    """Great-circle distance from one point to arrays of points (vectorized)."""
+    lat1 = math.radians(lat)
+    lat2 = np.radians(lats)
+    dlat = lat2 - lat1
+    dlon = np.radians(lons) - math.radians(lon)
+
+    a = np.sin(dlat / 2) ** 2 + math.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
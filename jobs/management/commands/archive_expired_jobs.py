@@ -0,0 +1,24 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand
+
+from jobs.expiry import BATCH_SIZE, archive_expired_jobs
+
+
+class Command(BaseCommand):
+    help = "Archive jobs whose application deadline has passed."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+        parser.add_argument(
+            "--today",
+            type=date.fromisoformat,
+            help="Pretend today is this date (YYYY-MM-DD).",
+        )
+
+    def handle(self, *args, **options):
+        archived = archive_expired_jobs(
+            today=options["today"],
+            batch_size=options["batch_size"],
+        )
+        self.stdout.write(self.style.SUCCESS(f"Archived {archived} expired jobs."))
@@ -0,0 +1,60 @@
+import random
+import statistics
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from jobs.expiry import archive_expired_jobs
+from jobs.filters import public_jobs
+from jobs.management.commands.bench_facets import seed_jobs
+from jobs.models import Job
+
+
+def time_public_query(repeat):
+    """First page + count, i.e. what PublicJobListView runs per request."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        qs = public_jobs().order_by("-created_at")
+        list(qs[:10])
+        qs.count()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+class Command(BaseCommand):
+    help = "Benchmark the public job query before/after archiving expired postings."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--jobs", type=int, default=100_000)
+        parser.add_argument("--expired", type=float, default=0.9)
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def handle(self, *args, **options):
+        today = timezone.localdate()
+
+        with transaction.atomic():
+            self.stdout.write(f"Seeding {options['jobs']} jobs...")
+            seed_jobs(options["jobs"], random.Random(7))
+
+            ids = list(Job.objects.order_by("id").values_list("id", flat=True))
+            cut = int(len(ids) * options["expired"])
+            Job.objects.filter(id__lte=ids[cut - 1]).update(deadline=today - timedelta(days=30))
+            Job.objects.filter(id__gt=ids[cut - 1]).update(deadline=today + timedelta(days=30))
+
+            before = time_public_query(options["repeat"])
+            self.stdout.write(f"before archiving: p50 {before:8.2f} ms")
+
+            start = time.perf_counter()
+            archived = archive_expired_jobs()
+            self.stdout.write(
+                f"archived {archived} jobs in {time.perf_counter() - start:.2f} s"
+            )
+
+            after = time_public_query(options["repeat"])
+            self.stdout.write(f"after archiving:  p50 {after:8.2f} ms")
+
+            transaction.set_rollback(True)
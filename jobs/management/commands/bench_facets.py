@@ -0,0 +1,82 @@
+import random
+import statistics
+import time
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from jobs.facets import compute_facets
+from jobs.models import Job, Location
+
+CITIES = [
+    "Pune", "Mumbai", "Bengaluru", "Hyderabad", "Chennai", "Delhi", "Noida",
+    "Gurugram", "Kolkata", "Ahmedabad", "Jaipur", "Indore", "Kochi", "Nagpur",
+]
+
+QUERIES = [
+    {},
+    {"work_mode": "remote"},
+    {"location": "pune", "job_type": "full_time"},
+    {"search": "engineer", "min_salary": "500000"},
+]
+
+
+def seed_jobs(count, rng, batch=5000):
+    """Bulk insert synthetic public jobs (used by several job benchmarks)."""
+    modes = [m for m, _ in Job.WORK_MODES]
+    types = [t for t, _ in Job.EMPLOYMENT_TYPES]
+    # bulk_create skips Job.save(), so resolve each city once up front
+    canonical = {city: Location.resolve(city) for city in CITIES}
+    for start in range(0, count, batch):
+        jobs = []
+        for i in range(start, min(start + batch, count)):
+            low = rng.choice([None, rng.randrange(2, 40) * 100_000])
+            city = rng.choice(CITIES)
+            jobs.append(Job(
+                title=rng.choice(["Backend", "Frontend", "Data", "QA", "DevOps"]) + " Engineer",
+                slug=f"bench-job-{i}",
+                description="Benchmark job",
+                location=city,
+                canonical_location=canonical[city],
+                work_mode=rng.choice(modes),
+                employment_type=rng.choice(types),
+                min_salary=Decimal(low) if low else None,
+                max_salary=Decimal(low * 2) if low else None,
+                annual_min_salary=Decimal(low) if low else None,
+                annual_max_salary=Decimal(low * 2) if low else None,
+            ))
+        Job.objects.bulk_create(jobs)
+
+
+class Command(BaseCommand):
+    help = "Benchmark facet count latency (uncached and cached)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--jobs", type=int, default=100_000)
+        parser.add_argument("--repeat", type=int, default=10)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            self.stdout.write(f"Seeding {options['jobs']} jobs...")
+            seed_jobs(options["jobs"], random.Random(5))
+
+            for params in QUERIES:
+                cold = []
+                for _ in range(options["repeat"]):
+                    cache.clear()
+                    start = time.perf_counter()
+                    compute_facets(params)
+                    cold.append((time.perf_counter() - start) * 1000)
+
+                start = time.perf_counter()
+                compute_facets(params)
+                warm = (time.perf_counter() - start) * 1000
+
+                self.stdout.write(
+                    f"{str(params):<50} uncached p50 {statistics.median(cold):8.2f} ms"
+                    f"   cached {warm:.3f} ms"
+                )
+
+            transaction.set_rollback(True)
@@ -0,0 +1,43 @@
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from jobs.filters import apply_facet_filters, public_jobs
+from jobs.management.commands.bench_facets import seed_jobs
+
+QUERIES = [
+    ("substring", {"location": "pun"}),
+    ("exact city", {"location": "Pune"}),
+    ("alias", {"location": "Bangalore"}),
+    ("radius 150km", {"location": "Pune", "radius_km": "150"}),
+]
+
+
+class Command(BaseCommand):
+    help = "Benchmark location filtering: free-text LIKE vs canonical Location FK vs radius."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--jobs", type=int, default=100_000)
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            self.stdout.write(f"Seeding {options['jobs']} jobs...")
+            seed_jobs(options["jobs"], random.Random(11))
+
+            for label, params in QUERIES:
+                timings = []
+                for _ in range(options["repeat"]):
+                    start = time.perf_counter()
+                    count = apply_facet_filters(public_jobs(), params).count()
+                    timings.append((time.perf_counter() - start) * 1000)
+
+                self.stdout.write(
+                    f"{label:<14} {str(params):<45} {count:>7} jobs"
+                    f"   p50 {statistics.median(timings):8.2f} ms"
+                )
+
+            transaction.set_rollback(True)
@@ -0,0 +1,81 @@
+import random
+import statistics
+import time
+import tracemalloc
+
+from django.core.management.base import BaseCommand
+
+from jobs.management.commands.bench_facets import CITIES
+from jobs.suggest import JobSuggester
+
+SENIORITY = ["", "Junior", "Senior", "Lead", "Principal", "Staff", "Associate", "Intern"]
+STACKS = [
+    "Python", "Java", "Go", "React", "Node.js", "Django", "Data", "ML", "Cloud",
+    "DevOps", "Android", "iOS", "Salesforce", "SAP", "QA", "Security", "Embedded",
+    "Flutter", "Rust", "Kotlin", "PHP", ".NET", "Scala", "Spark", "Azure", "AWS",
+]
+ROLES = [
+    "Engineer", "Developer", "Architect", "Analyst", "Consultant", "Tester",
+    "Administrator", "Scientist", "Manager", "Specialist", "Trainee",
+]
+TEAMS = ["", "Payments", "Platform", "Growth", "Search", "Infra", "Mobile", "Risk"]
+
+PREFIXES = ["p", "py", "pyth", "sen", "senior py", "dat", "eng", "dev", "pu", "beng", "zzz"]
+
+
+def synthetic_titles(count, rng):
+    for _ in range(count):
+        words = [
+            rng.choice(SENIORITY), rng.choice(STACKS), rng.choice(ROLES),
+            rng.choice(TEAMS), f"#{rng.randrange(5000)}" if rng.random() < 0.3 else "",
+        ]
+        yield " ".join(w for w in words if w)
+
+
+class Command(BaseCommand):
+    help = "Benchmark the job suggestion trie: build time, memory and lookup latency."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--titles", type=int, default=100_000)
+        parser.add_argument("--lookups", type=int, default=20_000)
+
+    def handle(self, *args, **options):
+        rng = random.Random(3)
+        rows = [(title, rng.choice(CITIES)) for title in synthetic_titles(options["titles"], rng)]
+
+        start = time.perf_counter()
+        suggester = JobSuggester.from_rows(rows)
+        build = time.perf_counter() - start
+
+        # Second build under tracemalloc (slows it down) for the footprint
+        tracemalloc.start()
+        traced = JobSuggester.from_rows(rows)
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del traced
+
+        self.stdout.write(
+            f"{options['titles']} titles ({len(suggester.titles.counts)} distinct), "
+            f"{suggester.titles.node_count()} trie nodes"
+        )
+        self.stdout.write(f"build {build:.2f} s, memory {memory / 1024 / 1024:.1f} MB")
+
+        timings = []
+        for i in range(options["lookups"]):
+            prefix = PREFIXES[i % len(PREFIXES)]
+            start = time.perf_counter()
+            suggester.suggest(prefix)
+            timings.append((time.perf_counter() - start) * 1_000_000)
+
+        timings.sort()
+        self.stdout.write(
+            f"lookup p50 {statistics.median(timings):.1f} us   "
+            f"p99 {timings[int(len(timings) * 0.99)]:.1f} us"
+        )
+
+        start = time.perf_counter()
+        for title, city in rows[:1000]:
+            suggester.remove_job(title, city)
+            suggester.add_job(title, city)
+        update = (time.perf_counter() - start) / 2000 * 1_000_000
+        self.stdout.write(f"incremental update {update:.1f} us per job change")
@@ -0,0 +1,41 @@
+from django.db import migrations
+
+from jobs.geo import lookup_place
+
+
+def normalize_locations(apps, schema_editor):
+    """
+    Resolve existing free-text Job.location values against the bundled
+    gazetteer. One lookup per distinct string, one UPDATE per place.
+    """
+    Job = apps.get_model("jobs", "Job")
+    Location = apps.get_model("jobs", "Location")
+
+    texts = Job.objects.values_list("location", flat=True).distinct()
+
+    for text in texts:
+        place = lookup_place(text)
+        if not place:
+            continue
+
+        location, _ = Location.objects.get_or_create(
+            city=place["city"],
+            state=place["state"],
+            country=place["country"],
+            defaults={
+                "latitude": place["latitude"],
+                "longitude": place["longitude"],
+            },
+        )
+        Job.objects.filter(location=text).update(canonical_location=location)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0003_location'),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_locations, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,62 @@
+from decimal import Decimal
+
+from django.db import migrations
+
+
+def backfill_annual_salary(apps, schema_editor):
+    """
+    Same rules as Job.annualized_salary (historical models have no methods):
+    monthly x 12, yearly as-is, one-sided ranges become a single point.
+    """
+    Job = apps.get_model("jobs", "Job")
+
+    jobs = Job.objects.only("id", "salary_type", "min_salary", "max_salary")
+    batch = []
+    for job in jobs.iterator(chunk_size=2000):
+        low = job.min_salary if job.min_salary is not None else job.max_salary
+        high = job.max_salary if job.max_salary is not None else job.min_salary
+
+        if job.salary_type == "not_disclosed" or low is None:
+            job.annual_min_salary = job.annual_max_salary = None
+        else:
+            factor = Decimal(12) if job.salary_type == "monthly" else Decimal(1)
+            job.annual_min_salary = low * factor
+            job.annual_max_salary = high * factor
+        batch.append(job)
+
+        if len(batch) >= 2000:
+            Job.objects.bulk_update(batch, ["annual_min_salary", "annual_max_salary"])
+            batch = []
+
+    Job.objects.bulk_update(batch, ["annual_min_salary", "annual_max_salary"])
+
+
+SALARY_HIGH_INDEX = "job_annual_max_salary_desc_idx"
+
+
+def create_salary_high_index(apps, schema_editor):
+    # ORDER BY annual_max_salary DESC NULLS LAST (salary_high sort).
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        f'CREATE INDEX IF NOT EXISTS "{SALARY_HIGH_INDEX}" ON "jobs_job" '
+        '("is_deleted", "annual_max_salary" DESC NULLS LAST)'
+    )
+
+
+def drop_salary_high_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(f'DROP INDEX IF EXISTS "{SALARY_HIGH_INDEX}"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0005_job_annual_salary'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_annual_salary, migrations.RunPython.noop),
+        migrations.RunPython(create_salary_high_index, drop_salary_high_index),
+    ]
@@ -6,6 +6,87 @@ from django.utils.text import slugify # converts job title into URL-friendly tex
 from django.core.exceptions import ValidationError
 from django.utils import timezone
 from decimal import Decimal
+import numpy as np
+
+from jobs.geo import lookup_place, bounding_box, haversine_km
+
+MONTHS_PER_YEAR = 12
+
+
+# --------------------------
+# Location dimension
+# --------------------------
+class Location(models.Model):
+    """
+    Canonical city from the bundled gazetteer (jobs/data/gazetteer.csv).
+    Job.location stays the free text the recruiter typed;
+    Job.canonical_location points here when the text could be resolved.
+    """
+    city = models.CharField(max_length=100)
+    state = models.CharField(max_length=100)
+    country = models.CharField(max_length=100)
+    latitude = models.FloatField()
+    longitude = models.FloatField()
+
+    class Meta:
+        unique_together = ("city", "state", "country")
+        indexes = [
+            # bounding-box prefilter for radius search
+            models.Index(fields=["latitude", "longitude"], name="location_lat_lon_idx"),
+        ]
+
+    @classmethod
+    def resolve(cls, text):
+        place = lookup_place(text)
+        if not place:
+            return None
+
+        location, _ = cls.objects.get_or_create(
+            city=place["city"],
+            state=place["state"],
+            country=place["country"],
+            defaults={
+                "latitude": place["latitude"],
+                "longitude": place["longitude"],
+            },
+        )
+        return location
+
+    @classmethod
+    def ids_within(cls, lat, lon, radius_km):
+        """
+        Ids of locations within radius_km: indexed bounding box first,
+        exact haversine distance (NumPy) on the few remaining rows.
+        """
+        south, north, west, east = bounding_box(lat, lon, radius_km)
+        rows = list(
+            cls.objects.filter(
+                latitude__range=(south, north),
+                longitude__range=(west, east),
+            ).values_list("id", "latitude", "longitude")
+        )
+        if not rows:
+            return []
+
+        ids, lats, lons = (np.asarray(col) for col in zip(*rows))
+        return ids[haversine_km(lat, lon, lats, lons) <= radius_km].tolist()
+
+    def __str__(self):
+        return f"{self.city}, {self.state}"
+
+
+class JobQuerySet(models.QuerySet):
+
+    def open(self, today=None):
+        """
+        Jobs candidates can see and apply to: not deleted, not archived,
+        deadline not passed. The deadline check covers the gap until the
+        expiry scheduler archives the row (jobs/expiry.py).
+        """
+        today = today or timezone.localdate()
+        return self.filter(is_deleted=False, is_archived=False).filter(
+            models.Q(deadline__isnull=True) | models.Q(deadline__gte=today)
+        )
 
 
 class Job(models.Model):
@@ -48,7 +129,23 @@ class Job(models.Model):
         max_digits=12, decimal_places=2, null=True, blank=True
     )
 
+    # Normalized INR per year (monthly x 12), set on save.
+    # Used for salary filtering, sorting and bounds across salary types.
+    annual_min_salary = models.DecimalField(
+        max_digits=14, decimal_places=2, null=True, blank=True, editable=False
+    )
+    annual_max_salary = models.DecimalField(
+        max_digits=14, decimal_places=2, null=True, blank=True, editable=False
+    )
+
     location = models.CharField(max_length=255)
+    canonical_location = models.ForeignKey(
+        Location,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="jobs"
+    ) # Resolved from `location` on save. NULL for "Remote" / unknown places
     work_mode = models.CharField(max_length=20, choices=WORK_MODES)
     employment_type = models.CharField(
         max_length=20, choices=EMPLOYMENT_TYPES, default="full_time"
@@ -76,9 +173,42 @@ class Job(models.Model):
 
 
     created_at = models.DateTimeField(auto_now_add=True) # when job was created
+    is_archived = models.BooleanField(default=False) # deadline passed, closed by the expiry scheduler
+    archived_at = models.DateTimeField(null=True, blank=True)
     is_deleted = models.BooleanField(default=False) # is_deleted → soft delete  Job is hidden   Not removed from DB
     #The job doesn't show on the website But the data still exists (for records, reports, backups) Can be restored later if needed
 
+    class Meta:
+        indexes = [
+            # salary range filters + sorts on the public board.
+            # PostgreSQL btree ASC already puts NULLs last (salary_low);
+            # the DESC NULLS LAST variant for salary_high is created in
+            # migration 0006 (SQLite rejects NULLS LAST in an index).
+            models.Index(fields=["is_deleted", "annual_min_salary"], name="job_annual_min_salary_idx"),
+            models.Index(fields=["is_deleted", "annual_max_salary"], name="job_annual_max_salary_idx"),
+            # Public board listing: only open rows are indexed, so archived
+            # postings stop costing anything on the hot query
+            models.Index(
+                fields=["-created_at"],
+                condition=models.Q(is_deleted=False, is_archived=False),
+                name="job_open_created_idx",
+            ),
+            # Expiry scheduler scan
+            models.Index(
+                fields=["deadline"],
+                condition=models.Q(is_archived=False),
+                name="job_unarchived_deadline_idx",
+            ),
+        ]
+
+    objects = JobQuerySet.as_manager()
+
+    @property
+    def is_open(self):
+        if self.is_deleted or self.is_archived:
+            return False
+        return self.deadline is None or self.deadline >= timezone.localdate()
+
     def save(self, *args, **kwargs): # This runs every time you save a job.override it to add our own logic.    
         if not self.slug: # Automatically creates a unique URL slug 
             base_slug = slugify(self.title)
@@ -88,8 +218,35 @@ class Job(models.Model):
                 slug = f"{base_slug}-{counter}"
                 counter += 1
             self.slug = slug
+
+        # Normalize free-text location -> Location dimension (indexed filters)
+        self.canonical_location = Location.resolve(self.location)
+
+        self.annual_min_salary, self.annual_max_salary = self.annualized_salary()
+
+        # Deadline extended on an archived job -> reopen it
+        if self.is_archived and (self.deadline is None or self.deadline >= timezone.localdate()):
+            self.is_archived = False
+            self.archived_at = None
+
         super().save(*args, **kwargs) # No manual slug handling needed
 
+    def annualized_salary(self):
+        """
+        (min, max) in INR per year, or (None, None) when not disclosed.
+        A one-sided range becomes a single point so range overlap works.
+        """
+        if self.salary_type == "not_disclosed":
+            return None, None
+
+        low = self.min_salary if self.min_salary is not None else self.max_salary
+        high = self.max_salary if self.max_salary is not None else self.min_salary
+        if low is None:
+            return None, None
+
+        factor = Decimal(MONTHS_PER_YEAR) if self.salary_type == "monthly" else Decimal(1)
+        return Decimal(low) * factor, Decimal(high) * factor
+
     def clean(self):
         if self.min_experience and self.max_experience:
             if self.min_experience > self.max_experience:
@@ -0,0 +1,54 @@
+# jobs/signals.py
+
+from django.db.models.signals import post_save, post_delete, pre_save
+from django.dispatch import receiver
+
+from jobs import suggest
+from jobs.facets import bump_facet_version
+from jobs.models import Job
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+def job_changed(sender, **kwargs):
+    # Facet counts depend on every public job -> drop cached results
+    bump_facet_version()
+
+
+# =====================================================
+# Search suggestions (incremental trie updates)
+# =====================================================
+def _suggest_entry(job):
+    # Same rule as public_jobs() / Job.objects.open(): suggest open jobs only
+    if not job.is_open:
+        return None
+    city = job.canonical_location.city if job.canonical_location_id else None
+    return (job.title, suggest.location_label(job.location, city))
+
+
+@receiver(pre_save, sender=Job)
+def remember_suggest_entry(sender, instance, **kwargs):
+    instance._suggest_old = None
+    if not suggest.is_loaded() or not instance.pk:
+        return
+    old = (
+        Job.objects.filter(pk=instance.pk)
+        .select_related("canonical_location")
+        .only(
+            "title", "location", "is_deleted", "is_archived", "deadline",
+            "canonical_location_id", "canonical_location__city",
+        )
+        .first()
+    )
+    if old:
+        instance._suggest_old = _suggest_entry(old)
+
+
+@receiver(post_save, sender=Job)
+def update_suggestions(sender, instance, **kwargs):
+    suggest.apply_job_change(getattr(instance, "_suggest_old", None), _suggest_entry(instance))
+
+
+@receiver(post_delete, sender=Job)
+def remove_suggestions(sender, instance, **kwargs):
+    suggest.apply_job_change(_suggest_entry(instance), None)
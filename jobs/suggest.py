@@ -0,0 +1,320 @@
+# jobs/suggest.py
+#
+# Search-as-you-type suggestions for the public job board.
+# Each worker process keeps an in-memory prefix trie of public job titles
+# and locations. Every node caches its own top-k (count, text) list, so a
+# lookup is one dict walk over the typed prefix and no subtree scan.
+# Job signals apply incremental +1 / -1 updates; a periodic rebuild from
+# the DB picks up changes made by other processes.
+
+import logging
+import re
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.db import close_old_connections
+
+from jobs.filters import public_jobs
+
+logger = logging.getLogger(__name__)
+
+TOP_K = 10
+MAX_KEY_LENGTH = 24
+_WORD_RE = re.compile(r"[a-z0-9+#.]+")
+
+
+def normalize(text):
+    return " ".join(_WORD_RE.findall((text or "").lower()))
+
+
+def index_keys(text):
+    """
+    "Senior Backend Engineer" -> "senior backend engineer",
+    "backend engineer", "engineer" (so typing any word start matches).
+    Keys are cut at MAX_KEY_LENGTH: nobody types further before picking
+    a suggestion, and the long single-child tails dominate trie memory.
+    """
+    words = normalize(text).split()
+    return list(dict.fromkeys(" ".join(words[i:])[:MAX_KEY_LENGTH] for i in range(len(words))))
+
+
+class _Node:
+    __slots__ = ("children", "terms", "top")
+
+    def __init__(self):
+        self.children = {}
+        self.terms = None  # {display text} for keys ending here
+        self.top = ()      # ((count, display text), ...) best TOP_K in subtree
+
+
+def _rank(entry):
+    count, text = entry
+    return (-count, text)
+
+
+class PrefixTrie:
+    """
+    Memory notes: one shared (count, text) tuple per text, top lists are
+    tuples of references to it, and a single-child node without terms
+    reuses its child's top tuple (most deep nodes are such chains).
+    """
+
+    def __init__(self):
+        self.root = _Node()
+        self.entries = {}  # display text -> (number of jobs, display text)
+
+    @property
+    def counts(self):
+        return {text: entry[0] for text, entry in self.entries.items()}
+
+    def _top(self, node):
+        if not node.terms and len(node.children) == 1:
+            return next(iter(node.children.values())).top
+        texts = set(node.terms or ())
+        for child in node.children.values():
+            texts.update(t for _, t in child.top)
+        return tuple(sorted((self.entries[t] for t in texts), key=_rank)[:TOP_K])
+
+    @classmethod
+    def build(cls, counts):
+        """
+        Bulk load {display text: count}: insert every key first, then fill
+        the top lists in one bottom-up pass (much faster than add() x N).
+        """
+        trie = cls()
+        for text, count in counts.items():
+            text = (text or "").strip()
+            if text and count > 0:
+                previous = trie.entries.get(text, (0, text))[0]
+                trie.entries[text] = (previous + count, text)
+
+        for text in trie.entries:
+            for key in index_keys(text):
+                node = trie.root
+                for char in key:
+                    child = node.children.get(char)
+                    if child is None:
+                        child = node.children[char] = _Node()
+                    node = child
+                if node.terms is None:
+                    node.terms = set()
+                node.terms.add(text)
+
+        # Parents are appended before their children -> walk it backwards
+        order = []
+        stack = [trie.root]
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            stack.extend(node.children.values())
+        for node in reversed(order):
+            node.top = trie._top(node)
+        return trie
+
+    def add(self, text, delta=1):
+        text = (text or "").strip()
+        if not text:
+            return
+
+        count = self.entries.get(text, (0, text))[0] + delta
+        if count > 0:
+            entry = self.entries[text] = (count, text)
+        else:
+            self.entries.pop(text, None)
+
+        # (depth, node, parent, char) for every node on every key path
+        visited = {}
+        for key in index_keys(text):
+            node, depth = self.root, 0
+            visited.setdefault(id(node), (depth, node, None, None))
+            for char in key:
+                child = node.children.get(char)
+                if child is None:
+                    if delta < 0:
+                        break
+                    child = node.children[char] = _Node()
+                depth += 1
+                visited.setdefault(id(child), (depth, child, node, char))
+                node = child
+            else:
+                if node.terms is None:
+                    node.terms = set()
+                if count > 0:
+                    node.terms.add(text)
+                else:
+                    node.terms.discard(text)
+
+        if delta > 0:
+            # A count can only grow: bump it into every cached top list
+            for _, node, _, _ in visited.values():
+                entries = [e for e in node.top if e[1] != text]
+                entries.append(entry)
+                entries.sort(key=_rank)
+                node.top = tuple(entries[:TOP_K])
+            return
+
+        # Decrement: rebuild affected top lists, deepest nodes first
+        for _, node, parent, char in sorted(visited.values(), key=lambda v: -v[0]):
+            if not any(e[1] == text for e in node.top):
+                continue
+            node.top = self._top(node)
+
+            # Prune branches that no longer lead to any text
+            if parent is not None and not node.top and not node.children:
+                del parent.children[char]
+
+    def remove(self, text):
+        self.add(text, -1)
+
+    def suggest(self, prefix, limit=TOP_K):
+        node = self.root
+        for char in normalize(prefix)[:MAX_KEY_LENGTH]:
+            node = node.children.get(char)
+            if node is None:
+                return []
+        return list(node.top[:limit])
+
+    def node_count(self):
+        count = 0
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            count += 1
+            stack.extend(node.children.values())
+        return count
+
+
+class JobSuggester:
+    """Titles + locations tries, built from public jobs."""
+
+    def __init__(self):
+        self.titles = PrefixTrie()
+        self.locations = PrefixTrie()
+
+    @classmethod
+    def from_rows(cls, rows):
+        """rows: (title, location label) pairs."""
+        titles = Counter()
+        locations = Counter()
+        for title, location in rows:
+            titles[title] += 1
+            locations[location] += 1
+
+        suggester = cls()
+        suggester.titles = PrefixTrie.build(titles)
+        suggester.locations = PrefixTrie.build(locations)
+        return suggester
+
+    def add_job(self, title, location):
+        self.titles.add(title)
+        self.locations.add(location)
+
+    def remove_job(self, title, location):
+        self.titles.remove(title)
+        self.locations.remove(location)
+
+    def suggest(self, prefix, limit=8):
+        results = [
+            {"text": text, "type": kind, "count": count}
+            for kind, trie in (("title", self.titles), ("location", self.locations))
+            for count, text in trie.suggest(prefix, limit)
+        ]
+        results.sort(key=lambda r: (-r["count"], r["text"]))
+        return results[:limit]
+
+
+def location_label(location, canonical_city):
+    # Canonical city groups "Bangalore" / "Bengaluru, KA" together
+    return canonical_city or location
+
+
+# =====================================================
+# Per-worker suggester shared by all request threads
+# =====================================================
+_suggester = None
+_built_at = 0.0
+_rebuild_changes = None  # apply_job_change() calls during a rebuild (None: no rebuild)
+_lock = threading.Lock()
+
+
+def _build_suggester():
+    rows = (
+        public_jobs()
+        .values_list("title", "location", "canonical_location__city")
+        .iterator(chunk_size=5000)
+    )
+    return JobSuggester.from_rows(
+        (title, location_label(location, city)) for title, location, city in rows
+    )
+
+
+def _rebuild_in_thread():
+    global _suggester, _built_at, _rebuild_changes
+    try:
+        suggester = _build_suggester()
+    except Exception:
+        logger.exception("Job suggester rebuild failed")
+        suggester = None
+    finally:
+        close_old_connections()
+
+    with _lock:
+        if suggester is not None:
+            # Replay changes made since the rebuild read its rows. One
+            # that the read already saw is counted twice until the next
+            # rebuild, which only affects ranking.
+            for old, new in _rebuild_changes:
+                _apply(suggester, old, new)
+            _suggester = suggester
+        _built_at = time.monotonic()  # failed: retry after another interval
+        _rebuild_changes = None
+
+
+def get_suggester():
+    """
+    The worker's suggester. The first call builds it; once stale, a
+    background thread builds the next one while requests keep using
+    the current one, and swaps it in when done.
+    """
+    global _suggester, _built_at, _rebuild_changes
+    with _lock:
+        if _suggester is None:
+            _suggester = _build_suggester()
+            _built_at = time.monotonic()
+        elif _rebuild_changes is None and time.monotonic() - _built_at > settings.JOB_SUGGEST_REFRESH:
+            _rebuild_changes = []
+            threading.Thread(target=_rebuild_in_thread, name="job-suggest-rebuild", daemon=True).start()
+        return _suggester
+
+
+def is_loaded():
+    return _suggester is not None
+
+
+def suggest(prefix, limit=8):
+    suggester = get_suggester()
+    with _lock:
+        return suggester.suggest(prefix, limit)
+
+
+def _apply(suggester, old, new):
+    if old:
+        suggester.remove_job(*old)
+    if new:
+        suggester.add_job(*new)
+
+
+def apply_job_change(old, new):
+    """
+    Incremental update from Job signals.
+    old / new: (title, location label) of the public job, or None.
+    Skipped until the suggester has been built (first request builds it).
+    """
+    if not is_loaded() or old == new:
+        return
+    with _lock:
+        _apply(_suggester, old, new)
+        if _rebuild_changes is not None:
+            _rebuild_changes.append((old, new))
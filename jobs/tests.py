@@ -1,3 +1,233 @@
+import threading
+from datetime import date, datetime, timedelta
+from unittest import mock
+
+from django.core.cache import cache
 from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from jobs import suggest
+from jobs.expiry import archive_expired_jobs
+from jobs.facets import compute_facets
+from jobs.filters import apply_sorting, public_jobs
+from jobs.geo import haversine_km, lookup_place
+from jobs.models import Job
+from jobs.suggest import PrefixTrie
+
+
+def travel_to(day):
+    """Patch "now" so timezone.localdate() returns `day`."""
+    moment = timezone.make_aware(datetime.combine(day, datetime.min.time()) + timedelta(hours=12))
+    return mock.patch("django.utils.timezone.now", return_value=moment)
+
+
+class JobExpiryTests(TestCase):
+
+    def make_job(self, title, deadline):
+        return Job.objects.create(
+            title=title,
+            description="Test job",
+            location="Pune",
+            work_mode="onsite",
+            deadline=deadline,
+        )
+
+    def setUp(self):
+        with travel_to(date(2026, 1, 1)):
+            self.open_ended = self.make_job("No deadline", None)
+            self.expiring = self.make_job("Closes Jan 10", date(2026, 1, 10))
+
+    def test_job_is_open_until_deadline_day_inclusive(self):
+        with travel_to(date(2026, 1, 10)):
+            self.assertTrue(self.expiring.is_open)
+            self.assertIn(self.expiring, public_jobs())
+
+        with travel_to(date(2026, 1, 11)):
+            self.assertFalse(self.expiring.is_open)
+            self.assertTrue(self.open_ended.is_open)
+
+    def test_public_queries_hide_expired_jobs_before_archival(self):
+        with travel_to(date(2026, 1, 11)):
+            self.assertEqual(list(public_jobs()), [self.open_ended])
+
+            response = self.client.get(reverse("public_jobs_list"))
+            self.assertNotContains(response, "Closes Jan 10")
+
+            response = self.client.get("/api/jobs/")
+            self.assertEqual([job["title"] for job in response.json()], ["No deadline"])
+
+    def test_archive_expired_jobs_in_batches(self):
+        with travel_to(date(2026, 1, 1)):
+            for i in range(5):
+                self.make_job(f"Batch {i}", date(2026, 1, 5))
+
+        with travel_to(date(2026, 1, 6)):
+            self.assertEqual(archive_expired_jobs(batch_size=2), 5)
+
+        self.assertEqual(Job.objects.filter(is_archived=True).count(), 5)
+        self.assertFalse(Job.objects.get(pk=self.expiring.pk).is_archived)
+
+        with travel_to(date(2026, 1, 11)):
+            self.assertEqual(archive_expired_jobs(batch_size=2), 1)
+            self.assertEqual(archive_expired_jobs(), 0)
+
+        expiring = Job.objects.get(pk=self.expiring.pk)
+        self.assertTrue(expiring.is_archived)
+        self.assertIsNotNone(expiring.archived_at)
+
+    def test_extending_deadline_reopens_archived_job(self):
+        with travel_to(date(2026, 1, 11)):
+            archive_expired_jobs()
+            job = Job.objects.get(pk=self.expiring.pk)
+            job.deadline = date(2026, 2, 1)
+            job.save()
+
+            self.assertFalse(job.is_archived)
+            self.assertIn(job, public_jobs())
+
+    def test_apply_rejected_after_deadline(self):
+        with travel_to(date(2026, 1, 11)):
+            response = self.client.post(reverse("apply_job", args=[self.expiring.slug]))
+            self.assertRedirects(
+                response,
+                reverse("public_job_detail", args=[self.expiring.slug]),
+                fetch_redirect_response=False,
+            )
+
+            response = self.client.post(f"/api/apply/{self.expiring.slug}/", {})
+            self.assertEqual(response.status_code, 400)
+            self.assertIn("no longer accepting", response.json()["error"])
+
+        self.assertEqual(self.expiring.applications.count(), 0)
+
+
+class JobSuggestTests(TestCase):
+
+    def setUp(self):
+        patcher = mock.patch.multiple(suggest, _suggester=None, _built_at=0.0, _rebuild_changes=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def make_job(self, title, location="Pune", **fields):
+        return Job.objects.create(title=title, description="Test job", location=location, work_mode="onsite", **fields)
+
+    def test_trie_ranks_prefix_matches_by_count(self):
+        trie = PrefixTrie.build({"Backend Engineer": 3, "Backend Developer": 5, "Data Engineer": 1})
+
+        self.assertEqual(trie.suggest("back"), [(5, "Backend Developer"), (3, "Backend Engineer")])
+        self.assertEqual(trie.suggest("eng"), [(3, "Backend Engineer"), (1, "Data Engineer")])
+        self.assertEqual(trie.suggest("xyz"), [])
+
+        trie.remove("Backend Developer")
+        self.assertEqual(trie.suggest("backend d"), [(4, "Backend Developer")])
+
+    def test_signals_track_open_jobs_only(self):
+        job = self.make_job("Backend Engineer")
+        self.assertEqual([s["text"] for s in suggest.suggest("backend")], ["Backend Engineer"])
+
+        yesterday = timezone.localdate() - timedelta(days=1)
+        job.deadline = yesterday
+        job.save()
+        self.assertEqual(suggest.suggest("backend"), [])
+
+        self.make_job("Backend Lead", deadline=yesterday)
+        self.make_job("Backend Intern", is_deleted=True)
+        self.assertEqual(suggest.suggest("backend"), [])
+
+    @mock.patch("jobs.suggest.settings.JOB_SUGGEST_REFRESH", 0)
+    def test_stale_suggester_is_rebuilt_in_background(self):
+        current = suggest.get_suggester()
+        release = threading.Event()
+
+        def slow_build():
+            release.wait(5)
+            return suggest.JobSuggester.from_rows([("Data Engineer", "Pune")])
+
+        with mock.patch("jobs.suggest._build_suggester", slow_build):
+            self.assertIs(suggest.get_suggester(), current)  # doesn't wait for the build
+            self.make_job("Backend Engineer")
+            release.set()
+            for thread in threading.enumerate():
+                if thread.name == "job-suggest-rebuild":
+                    thread.join()
+
+        self.assertIsNot(suggest._suggester, current)
+        self.assertEqual(suggest._suggester.titles.counts, {"Data Engineer": 1, "Backend Engineer": 1})
+
+
+class JobBoardFilterTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+
+    def make_job(self, title, location, work_mode, **fields):
+        return Job.objects.create(title=title, description="Test job", location=location, work_mode=work_mode, **fields)
+
+    def facet(self, facets, name):
+        return {row["value"]: row["count"] for row in facets[name] if row["count"]}
+
+    def test_facets_ignore_their_own_filter(self):
+        self.make_job("Backend", "Pune", "onsite", min_salary=800_000, max_salary=1_200_000)
+        self.make_job("Frontend", "Poona", "remote", salary_type="monthly", min_salary=40_000, max_salary=60_000)
+        self.make_job("Data", "Bangalore", "hybrid", employment_type="contract", salary_type="not_disclosed")
+        self.make_job("QA", "Remote", "remote", employment_type="part_time", min_salary=2_500_000)
+
+        facets = self.client.get("/api/jobs/facets/", {"work_mode": "remote"}).json()
+        self.assertEqual(facets["total"], 2)
+        self.assertEqual(self.facet(facets, "work_mode"), {"onsite": 1, "remote": 2, "hybrid": 1})
+        self.assertEqual(self.facet(facets, "job_type"), {"full_time": 1, "part_time": 1})
+        # "Poona" is counted under its canonical city
+        self.assertEqual(self.facet(facets, "location"), {"Pune": 1, "Remote": 1})
+        self.assertEqual(self.facet(facets, "salary"), {"3_6l": 1, "20l_plus": 1})
+
+        facets = compute_facets({"location": "pune"})
+        self.assertEqual(facets["total"], 2)
+        self.assertEqual(self.facet(facets, "work_mode"), {"onsite": 1, "remote": 1})
+        self.assertEqual(self.facet(facets, "location"), {"Pune": 2, "Bengaluru": 1, "Remote": 1})
+
+        # A saved job invalidates the cached counts
+        self.make_job("Ops", "Pune", "onsite")
+        self.assertEqual(compute_facets({"location": "pune"})["total"], 3)
+
+    def test_radius_search_uses_gazetteer_and_haversine(self):
+        self.assertEqual(lookup_place("Hybrid - Gurgaon")["city"], "Gurugram")
+        self.assertIsNone(lookup_place("Remote"))
+        # Pune -> Mumbai is ~120 km as the crow flies
+        [distance] = haversine_km(18.5204, 73.8567, [19.0760], [72.8777])
+        self.assertAlmostEqual(distance, 120, delta=2)
+
+        self.make_job("Pune", "Pune, Maharashtra", "onsite")
+        self.make_job("Mumbai", "Bombay", "onsite")
+        bangalore = self.make_job("Bangalore", "Bangalore", "onsite")
+        blr = self.make_job("BLR", "BLR", "hybrid")
+        self.make_job("Anywhere", "Remote", "remote")
+        self.assertEqual(bangalore.canonical_location, blr.canonical_location)
+
+        def titles(**params):
+            return sorted(job["title"] for job in self.client.get("/api/jobs/", params).json())
+
+        self.assertEqual(titles(location="poona"), ["Pune"])
+        self.assertEqual(titles(location="poona", radius_km=50), ["Pune"])
+        self.assertEqual(titles(location="poona", radius_km=150), ["Mumbai", "Pune"])
+        self.assertEqual(titles(location="bengaluru"), ["BLR", "Bangalore"])
+        self.assertEqual(titles(location="remote"), ["Anywhere"])  # not in the gazetteer: substring match
+
+    def test_salary_sort_and_range_use_annualized_salary(self):
+        monthly = self.make_job("Monthly 50k", "Pune", "onsite", salary_type="monthly", min_salary=50_000, max_salary=50_000)
+        yearly = self.make_job("Yearly 5L", "Pune", "onsite", min_salary=500_000, max_salary=900_000)
+        hidden = self.make_job("Hidden", "Pune", "onsite", salary_type="not_disclosed", min_salary=1)
+        floor = self.make_job("From 7L", "Pune", "onsite", min_salary=700_000)
+
+        self.assertEqual((monthly.annual_min_salary, monthly.annual_max_salary), (600_000, 600_000))
+        self.assertEqual((floor.annual_min_salary, floor.annual_max_salary), (700_000, 700_000))
+        self.assertEqual(hidden.annualized_salary(), (None, None))
+
+        self.assertEqual(list(apply_sorting(Job.objects.all(), "salary_low")), [yearly, monthly, floor, hidden])
+        self.assertEqual(list(apply_sorting(Job.objects.all(), "salary_high")), [yearly, floor, monthly, hidden])
 
-# Create your tests here.
+        # Range overlap on the annual columns; undisclosed never matches
+        titles = [job["title"] for job in self.client.get(
+            "/api/jobs/", {"min_salary": 650_000, "max_salary": 800_000, "sort": "salary_low"},
+        ).json()]
+        self.assertEqual(titles, ["Yearly 5L", "From 7L"])
@@ -1,8 +1,9 @@
 # jobs/views/public.py
 
 from django.views.generic import ListView, DetailView
-from django.db.models import Q, Min, Max
 from jobs.models import Job
+from jobs.filters import public_jobs, apply_search_filters, apply_facet_filters, apply_sorting
+from jobs.facets import compute_facets, salary_bounds
 
 
 # =====================================================
@@ -16,61 +17,16 @@ class PublicJobListView(ListView):
     paginate_by = 10
 
     def get_queryset(self):
-        qs = Job.objects.filter(is_deleted=False)
+        params = self.request.GET
+        sort = params.get("sort")
 
-        search = self.request.GET.get("search")
-        location = self.request.GET.get("location")
-        work_mode = self.request.GET.get("work_mode")
-        job_type = self.request.GET.get("job_type")
-        min_salary = self.request.GET.get("min_salary")
-        max_salary = self.request.GET.get("max_salary")
-        sort = self.request.GET.get("sort")
-
-        # ----------------------------
-        # Search
-        # ----------------------------
-        if search:
-            qs = qs.filter(
-                Q(title__icontains=search) |
-                Q(description__icontains=search)
-            )
-
-        # ----------------------------
-        # Filters
-        # ----------------------------
-        if location:
-            qs = qs.filter(location__icontains=location)
-
-        if work_mode:
-            qs = qs.filter(work_mode=work_mode)
-
-        if job_type:
-            qs = qs.filter(employment_type=job_type)
-
-        # ----------------------------
-        # Salary range filtering (EXACT)
-        # ----------------------------
-        if min_salary:
-            qs = qs.filter(
-                min_salary__isnull=False,
-                min_salary__gte=min_salary
-            )
-
-        if max_salary:
-            qs = qs.filter(
-                max_salary__isnull=False,
-                max_salary__lte=max_salary
-            )
+        qs = apply_search_filters(public_jobs(), params)
+        qs = apply_facet_filters(qs, params)
 
         # ---------------------------
-        # Sorting
+        # Sorting (annualized salary, NULLs last)
         # ----------------------------
-        if sort == "salary_low":
-            qs = qs.order_by("min_salary")
-        elif sort == "salary_high":
-            qs = qs.order_by("-max_salary")
-        else:
-            qs = qs.order_by("-created_at")
+        qs = apply_sorting(qs, sort)
 
         return qs
 
@@ -79,21 +35,13 @@ class PublicJobListView(ListView):
         #  hide sidebar & logout on public page
         context["hide_sidebar"] = True
 
+        # Counts per work mode / job type / location / salary bucket
+        context["facets"] = compute_facets(self.request.GET)
 
         # ----------------------------
-        # Global salary range (EXACT)
+        # Global salary range (cached, annualized INR)
         # ----------------------------
-        salary_range = Job.objects.filter(
-            is_deleted=False
-        ).aggregate(
-            min_salary_global=Min("min_salary"),
-            max_salary_global=Max("max_salary")
-        )
-
-        context["salary_min_global"] = salary_range["min_salary_global"] or 0
-        context["salary_max_global"] = (
-            salary_range["max_salary_global"] or 1000000
-        )
+        context["salary_min_global"], context["salary_max_global"] = salary_bounds()
 
         return context
 
@@ -0,0 +1,152 @@
+# notifications/digest.py
+#
+# Notifications that may come in bursts are queued as NotificationEvent
+# rows and summarised in one email per recipient:
+#
+#   candidate        status changes; a candidate's email goes out
+#                    NOTIFICATION_DIGEST_WINDOW seconds after their first
+#                    pending update and covers every update since
+#   recruiter_daily  new applications to a recruiter's jobs, one email
+#                    a day at RECRUITER_DIGEST_HOUR (local time)
+#
+# flush_digests() reads due recipients per digest from the
+# (digest, due_at) index, then all their events in one query per batch
+# of recipients, queues one outbox email each and deletes the events, in
+# one transaction. The relay then sends many digests per API call.
+
+import logging
+from datetime import timedelta
+from itertools import groupby
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from core.scheduler import run_periodically
+from notifications.models import NotificationEvent
+from notifications.outbox import enqueue_emails
+
+logger = logging.getLogger(__name__)
+
+FLUSH_BATCH = 500  # recipients per grouped read
+
+
+def _due_at(digest, now):
+    if digest == "recruiter_daily":
+        local = timezone.localtime(now)
+        due = local.replace(hour=settings.RECRUITER_DIGEST_HOUR, minute=0, second=0, microsecond=0)
+        return due if due > local else due + timedelta(days=1)
+    return now + timedelta(seconds=settings.NOTIFICATION_DIGEST_WINDOW)
+
+
+def notify(digest, recipient, kind, context):
+    """Queue one event for `recipient`'s next `digest` email (caller's transaction)."""
+    now = timezone.now()
+    return NotificationEvent.objects.create(
+        digest=digest,
+        recipient=recipient,
+        kind=kind,
+        context=context,
+        created_at=now,
+        due_at=_due_at(digest, now),
+    )
+
+
+def notify_many(digest, notifications):
+    """notify() for each (recipient, kind, context), in one bulk INSERT."""
+    now = timezone.now()
+    due_at = _due_at(digest, now)
+    return NotificationEvent.objects.bulk_create(
+        [
+            NotificationEvent(
+                digest=digest, recipient=recipient, kind=kind, context=context,
+                created_at=now, due_at=due_at,
+            )
+            for recipient, kind, context in notifications
+        ],
+        batch_size=1000,
+    )
+
+
+# =====================================================
+# Digest emails
+# =====================================================
+def _candidate_email(events):
+    # Several changes to one application: only the latest status matters
+    latest = {}
+    for event in events:
+        latest[event.context["track_url"]] = event.context
+    updates = list(latest.values())
+
+    if len(updates) == 1:
+        return events[-1].kind, updates[0]
+    return "status_digest", {"full_name": updates[-1]["full_name"], "updates": updates}
+
+
+def _recruiter_email(events):
+    jobs = {}
+    for event in events:
+        job = jobs.setdefault(event.context["job_id"], {
+            "job_title": event.context["job_title"],
+            "applications_url": event.context["applications_url"],
+            "names": [],
+        })
+        job["names"].append(event.context["full_name"])
+
+    for job in jobs.values():
+        job["count"] = len(job["names"])
+        job["more"] = max(job["count"] - 5, 0)
+        job["names"] = job["names"][:5]
+    return "new_applicants_digest", {"total": len(events), "jobs": list(jobs.values())}
+
+
+DIGEST_EMAILS = {
+    "candidate": _candidate_email,
+    "recruiter_daily": _recruiter_email,
+}
+
+
+# =====================================================
+# Flush
+# =====================================================
+def _flush_recipients(digest, recipients):
+    with transaction.atomic():
+        events = list(
+            NotificationEvent.objects.select_for_update(skip_locked=True)
+            .filter(digest=digest, recipient__in=recipients)
+            .order_by("recipient", "created_at", "id")
+        )
+        emails = []
+        for recipient, group in groupby(events, key=lambda event: event.recipient):
+            group = list(group)
+            template, context = DIGEST_EMAILS[digest](group)
+            # Last event id: a re-run of the same flush queues nothing new
+            emails.append((f"digest:{digest}:{group[-1].pk}", recipient, template, context))
+
+        enqueue_emails(emails)
+        NotificationEvent.objects.filter(pk__in=[event.pk for event in events]).delete()
+    return len(events), len(emails)
+
+
+def flush_digests(now=None):
+    """Queue every due digest email. Returns (events folded, emails queued)."""
+    now = now or timezone.now()
+    folded = queued = 0
+
+    for digest in DIGEST_EMAILS:
+        recipients = list(
+            NotificationEvent.objects.filter(digest=digest, due_at__lte=now)
+            .order_by()
+            .values_list("recipient", flat=True)
+            .distinct()
+        )
+        for i in range(0, len(recipients), FLUSH_BATCH):
+            events, emails = _flush_recipients(digest, recipients[i:i + FLUSH_BATCH])
+            folded += events
+            queued += emails
+    return folded, queued
+
+
+def start_digest_scheduler():
+    """Daemon thread per web worker when NOTIFICATION_DIGEST_INTERVAL > 0."""
+    return run_periodically("notification-digests", settings.NOTIFICATION_DIGEST_INTERVAL, flush_digests)
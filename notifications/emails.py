@@ -0,0 +1,76 @@
+# notifications/emails.py
+#
+# Transactional emails are Django templates under templates/emails/:
+#   <name>_subject.txt   one line
+#   <name>.html          extends emails/base.html, autoescaped
+#   <name>.txt           extends emails/base.txt, plain-text alternative
+#
+# Each template is compiled once per process and kept here, so a render
+# is only the node walk. Subjects and plain text render with autoescape
+# off ("&" must stay "&" outside HTML), the HTML part with it on.
+# Render time is counted per email name: render_stats().
+
+import threading
+import time
+from typing import NamedTuple
+
+from django.template import Context, engines
+
+_compiled = {}
+_stats = {}
+_stats_lock = threading.Lock()
+
+
+class RenderedEmail(NamedTuple):
+    subject: str
+    html: str
+    text: str
+
+
+def _templates(name):
+    templates = _compiled.get(name)
+    if templates is None:
+        engine = engines["django"].engine
+        templates = _compiled[name] = (
+            engine.get_template(f"emails/{name}_subject.txt"),
+            engine.get_template(f"emails/{name}.html"),
+            engine.get_template(f"emails/{name}.txt"),
+        )
+    return templates
+
+
+def render_email(name, context):
+    """Subject, HTML and plain-text body of email `name` for `context` (a dict)."""
+    start = time.perf_counter()
+    subject, html, text = _templates(name)
+    # Compiled templates escape according to the Context they're given
+    plain = Context(context, autoescape=False)
+    rendered = RenderedEmail(
+        subject=" ".join(subject.render(plain).split()),
+        html=html.render(Context(context)),
+        text=text.render(plain).strip() + "\n",
+    )
+    elapsed = time.perf_counter() - start
+
+    with _stats_lock:
+        count, total, slowest = _stats.get(name, (0, 0.0, 0.0))
+        _stats[name] = (count + 1, total + elapsed, max(slowest, elapsed))
+    return rendered
+
+
+def render_stats():
+    """{name: {"count", "avg_ms", "max_ms"}} for this process."""
+    with _stats_lock:
+        return {
+            name: {
+                "count": count,
+                "avg_ms": total / count * 1000,
+                "max_ms": slowest * 1000,
+            }
+            for name, (count, total, slowest) in _stats.items()
+        }
+
+
+def reset_render_stats():
+    with _stats_lock:
+        _stats.clear()
@@ -0,0 +1,114 @@
+import random
+import time
+from datetime import timedelta
+from unittest import mock
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from notifications.digest import flush_digests
+from notifications.models import NotificationEvent, OutboxMessage
+from notifications.outbox import relay_outbox
+
+STATUSES = ["Screening", "Review", "Interview", "Hired", "Rejected"]
+
+
+class Command(BaseCommand):
+    help = "Digest engine: API calls saved and worker throughput for a burst of events."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--events", type=int, default=1_000_000)
+        parser.add_argument("--candidates", type=int, default=200_000)
+        parser.add_argument("--recruiters", type=int, default=2_000)
+        parser.add_argument("--recruiter-share", type=float, default=0.2,
+                            help="share of events that are new applications (recruiter digest)")
+        parser.add_argument("--relay", type=int, default=50_000,
+                            help="digest emails to push through the relay (rendering included)")
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            self._bench(options)
+            transaction.set_rollback(True)
+
+    def _events(self, options, rng):
+        past = timezone.now() - timedelta(minutes=1)
+        for i in range(options["events"]):
+            if rng.random() < options["recruiter_share"]:
+                recruiter = rng.randrange(options["recruiters"])
+                job = recruiter * 10 + rng.randrange(10)
+                yield NotificationEvent(
+                    digest="recruiter_daily",
+                    recipient=f"recruiter{recruiter}@example.com",
+                    kind="new_application",
+                    context={
+                        "job_id": job,
+                        "job_title": f"Job {job}",
+                        "applications_url": f"https://hireflow.example/recruiter/applications/{job}/applications/",
+                        "full_name": f"Candidate {i}",
+                    },
+                    due_at=past,
+                )
+            else:
+                # Skewed: a few candidates in many pipelines, most in one or two
+                candidate = int(rng.paretovariate(1.2) * 7919 + i) % options["candidates"]
+                application = rng.randrange(3)
+                yield NotificationEvent(
+                    digest="candidate",
+                    recipient=f"candidate{candidate}@example.com",
+                    kind="status_changed",
+                    context={
+                        "full_name": f"Candidate {candidate}",
+                        "job_title": f"Job {application}",
+                        "status": rng.choice(STATUSES),
+                        "track_url": f"https://hireflow.example/applications/track/{candidate}-{application}/",
+                    },
+                    due_at=past,
+                )
+
+    def _bench(self, options):
+        rng = random.Random(47)
+        start = time.perf_counter()
+        chunk = []
+        for event in self._events(options, rng):
+            chunk.append(event)
+            if len(chunk) == 50_000:
+                NotificationEvent.objects.bulk_create(chunk, batch_size=5000)
+                chunk = []
+        NotificationEvent.objects.bulk_create(chunk, batch_size=5000)
+        self.stdout.write(f"queued {options['events']:,} events in {time.perf_counter() - start:.1f}s")
+
+        start = time.perf_counter()
+        folded, emails = flush_digests()
+        flush = time.perf_counter() - start
+
+        per_call = OutboxMessage.objects.count()
+        self.stdout.write(self.style.MIGRATE_HEADING("Digest flush"))
+        self.stdout.write(
+            f"  {folded:,} events -> {emails:,} emails in {flush:.1f}s "
+            f"= {folded / flush:,.0f} events/s"
+        )
+
+        # Relay a slice of the digests (render + claim + record), API mocked
+        OutboxMessage.objects.filter(
+            pk__in=OutboxMessage.objects.order_by("pk").values("pk")[options["relay"]:]
+        ).delete()
+        send = mock.Mock(return_value=True)
+        with mock.patch("notifications.outbox.send_brevo_email", send), \
+                mock.patch("notifications.outbox.send_brevo_batch", send):
+            start = time.perf_counter()
+            sent, _ = relay_outbox()
+            relay = time.perf_counter() - start
+        calls_per_email = send.call_count / sent
+
+        self.stdout.write(self.style.MIGRATE_HEADING("Relay (email API mocked)"))
+        self.stdout.write(
+            f"  {sent:,} emails in {relay:.1f}s = {sent / relay:,.0f} emails/s, "
+            f"{send.call_count:,} API calls"
+        )
+
+        self.stdout.write(self.style.MIGRATE_HEADING("Email API calls"))
+        self.stdout.write(f"  one email per event:   {folded:>10,}")
+        self.stdout.write(f"  digests, one per call: {per_call:>10,}")
+        self.stdout.write(f"  digests, batched:      {round(per_call * calls_per_email):>10,}")
+        self.stdout.write(f"  saved: {(1 - per_call * calls_per_email / folded) * 100:.2f}%")
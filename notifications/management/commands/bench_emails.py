@@ -0,0 +1,87 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand
+from django.template import Context, Engine
+
+from notifications.emails import render_email, render_stats, reset_render_stats
+
+NAMES = ["status_changed", "application_received", "recruiter_invite", "password_reset"]
+STATUSES = ["Screening", "Review", "Interview", "Hired", "Rejected"]
+
+
+def _contexts(count, rng):
+    for i in range(count):
+        name = rng.choices(NAMES, weights=[70, 25, 3, 2])[0]
+        url = f"https://hireflow.example/applications/track/{rng.getrandbits(64):016x}/"
+        yield name, {
+            "full_name": f"Candidate {i} & Co",
+            "job_title": rng.choice(["Backend Engineer", "R&D Lead", "Data <Analyst>"]),
+            "application_id": f"HF-{i:04d}",
+            "status": rng.choice(STATUSES),
+            "track_url": url,
+            "signup_link": url,
+            "reset_link": url,
+            "valid_hours": 48,
+            "valid_minutes": 15,
+        }
+
+
+def _fstring(name, c):
+    # What the views built before: unescaped, HTML only
+    return f"""
+        <p>Hi {c['full_name']},</p>
+        <p>Your application for <strong>{c['job_title']}</strong> has been updated.</p>
+        <p><strong>New Status:</strong> {c['status']}</p>
+        <p>You can track your application here:<br><a href="{c['track_url']}">Track Application</a></p>
+        <p>Regards,<br>HireFlow Team</p>
+    """
+
+
+class Command(BaseCommand):
+    help = "Render throughput of the templated notification emails on one core."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--emails", type=int, default=100_000)
+        parser.add_argument("--uncached", type=int, default=2_000,
+                            help="emails rendered with templates parsed on every render")
+
+    def handle(self, *args, **options):
+        rng = random.Random(46)
+        emails = list(_contexts(options["emails"], rng))
+
+        render_email("status_changed", emails[0][1])  # compile outside the timing
+        reset_render_stats()
+
+        rows = []
+        start = time.process_time()
+        for name, context in emails:
+            _fstring(name, context)
+        rows.append(("f-string HTML (before)", len(emails), time.process_time() - start))
+
+        engine = Engine.get_default()
+        start = time.process_time()
+        for name, context in emails[:options["uncached"]]:
+            for suffix, autoescape in (("_subject.txt", False), (".html", True), (".txt", False)):
+                source = engine.find_template(f"emails/{name}{suffix}")[0].source
+                engine.from_string(source).render(Context(context, autoescape=autoescape))
+        rows.append(("templates parsed per render", options["uncached"], time.process_time() - start))
+
+        start = time.process_time()
+        for name, context in emails:
+            render_email(name, context)
+        rows.append(("compiled templates", len(emails), time.process_time() - start))
+
+        self.stdout.write(self.style.MIGRATE_HEADING("Render throughput (CPU time, one core)"))
+        for label, count, cpu in rows:
+            self.stdout.write(
+                f"  {label:28} {count:7} emails  {cpu / count * 1_000_000:8.1f} us/email  "
+                f"{count / cpu * 60:12,.0f} emails/min"
+            )
+
+        self.stdout.write(self.style.MIGRATE_HEADING("render_stats() (subject + HTML + text)"))
+        for name, stats in sorted(render_stats().items()):
+            self.stdout.write(
+                f"  {name:22} {stats['count']:7}  avg {stats['avg_ms'] * 1000:6.1f} us  "
+                f"max {stats['max_ms']:6.2f} ms"
+            )
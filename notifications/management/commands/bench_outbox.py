@@ -0,0 +1,132 @@
+import statistics
+import time
+from contextlib import nullcontext
+from unittest import mock
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import Client, override_settings
+from django.urls import reverse
+
+from applications.models import Application
+from jobs.models import Job
+from notifications.models import NotificationEvent, OutboxMessage
+from notifications.outbox import relay_outbox
+from users.models import User
+
+CYCLE = ["review", "interview"]
+
+
+def _percentile(samples, q):
+    return sorted(samples)[int(len(samples) * q)] * 1000
+
+
+class Command(BaseCommand):
+    help = "Status update latency with inline email vs outbox, and outbox relay throughput."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=300)
+        parser.add_argument("--messages", type=int, default=5000)
+        parser.add_argument("--brevo-ms", type=float, default=300.0, help="simulated email API call")
+        parser.add_argument("--relay-workers", default="1,4,16")
+
+    def handle(self, *args, **options):
+        with override_settings(ALLOWED_HOSTS=["testserver"]), transaction.atomic():
+            self._latency(options)
+            self._throughput(options)
+            transaction.set_rollback(True)
+
+    def _sender(self, options):
+        def send(*args, **kwargs):
+            time.sleep(options["brevo_ms"] / 1000)
+            return True
+        return send
+
+    def _latency(self, options):
+        recruiter = User.objects.create_user(
+            email="bench-outbox@example.com", password="x", role="RECRUITER", is_active=True
+        )
+        job = Job.objects.create(
+            title="Bench outbox", description="x", location="Pune", work_mode="onsite", created_by=recruiter,
+        )
+        apps = [
+            Application.objects.create(
+                job=job, full_name="Bench", email=f"o{i}@example.com", phone="9000000000",
+            )
+            for i in range(options["requests"])
+        ]
+        client = Client()
+        client.force_login(recruiter)
+        send = self._sender(options)
+
+        def inline_send(digest, recipient, kind, context):
+            # What the view did before: call the email API from the request
+            send(to_email=recipient, template=kind, context=context)
+
+        results = {}
+        with mock.patch("notifications.outbox.send_brevo_email", send):
+            for label, patch, status in (
+                ("inline email (before)", mock.patch("applications.views.recruiter.notify", inline_send),
+                 CYCLE[0]),
+                ("outbox", nullcontext(), CYCLE[1]),
+            ):
+                latencies = []
+                with patch:
+                    for app in apps:
+                        start = time.perf_counter()
+                        client.post(reverse("recruiter_status_update", args=[app.pk]), {"status": status})
+                        latencies.append(time.perf_counter() - start)
+                results[label] = latencies
+
+        self.stdout.write(self.style.MIGRATE_HEADING(
+            f"Status update request, {options['requests']} requests, email API {options['brevo_ms']:g}ms"
+        ))
+        for label, latencies in results.items():
+            self.stdout.write(
+                f"  {label:24} median {statistics.median(latencies) * 1000:7.1f}ms   "
+                f"p99 {_percentile(latencies, 0.99):7.1f}ms"
+            )
+        self.stdout.write(f"  digest events queued: {NotificationEvent.objects.count()}")
+
+    def _throughput(self, options):
+        self.stdout.write(self.style.MIGRATE_HEADING(
+            f"Relay throughput, {options['messages']} queued emails"
+        ))
+        # send_batch 1 = one API call per email, as before batching
+        workers = [int(w) for w in options["relay_workers"].split(",")]
+        runs = [(w, 1, options["brevo_ms"]) for w in workers]
+        runs += [(w, 50, options["brevo_ms"]) for w in workers]
+        runs.append((workers[-1], 50, 0.0))
+
+        for workers, send_batch, latency in runs:
+            OutboxMessage.objects.all().delete()
+            OutboxMessage.objects.bulk_create(
+                OutboxMessage(
+                    key=f"bench:{i}",
+                    payload={
+                        "to_email": f"b{i}@example.com",
+                        "template": "recruiter_invite",
+                        "context": {"signup_link": f"https://hireflow.example/signup/?token={i}", "valid_hours": 48},
+                    },
+                )
+                for i in range(options["messages"])
+            )
+            count = options["messages"]
+            if latency and send_batch == 1:
+                # Keep the slow runs short: throughput is steady after a few batches
+                count = min(count, workers * 100)
+                OutboxMessage.objects.filter(
+                    pk__in=OutboxMessage.objects.order_by("pk").values("pk")[count:]
+                ).delete()
+
+            send = mock.Mock(side_effect=self._sender({"brevo_ms": latency}))
+            with mock.patch("notifications.outbox.send_brevo_email", send), \
+                    mock.patch("notifications.outbox.send_brevo_batch", send):
+                start = time.perf_counter()
+                sent, _ = relay_outbox(workers=workers, send_batch=send_batch)
+                elapsed = time.perf_counter() - start
+            self.stdout.write(
+                f"  {workers:2} workers, {send_batch:2} per call, API {latency:5g}ms: "
+                f"{sent:5} sent in {elapsed:6.2f}s with {send.call_count:5} calls "
+                f"= {sent / elapsed:8.0f} emails/s"
+            )
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from notifications.digest import flush_digests
+
+
+class Command(BaseCommand):
+    help = "Queue due notification digests (one email per recipient) in the outbox."
+
+    def handle(self, *args, **options):
+        events, emails = flush_digests()
+        self.stdout.write(self.style.SUCCESS(f"Folded {events} events into {emails} digest emails."))
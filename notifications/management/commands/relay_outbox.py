@@ -0,0 +1,37 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from notifications.outbox import purge_outbox, relay_outbox
+
+
+class Command(BaseCommand):
+    help = "Send pending outbox messages (emails). --loop keeps polling, as a worker process."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--loop", action="store_true")
+        parser.add_argument(
+            "--interval", type=float, default=1.0,
+            help="Seconds between polls with --loop.",
+        )
+
+    def handle(self, *args, **options):
+        if not options["loop"]:
+            sent, failed = relay_outbox()
+            purged = purge_outbox()
+            self.stdout.write(self.style.SUCCESS(
+                f"Sent {sent}, failed {failed}, purged {purged} old messages."
+            ))
+            return
+
+        self.stdout.write(f"Relaying outbox every {options['interval']}s ({settings.OUTBOX_RELAY_WORKERS} workers)")
+        while True:
+            try:
+                sent, failed = relay_outbox()
+                if sent or failed:
+                    self.stdout.write(f"Sent {sent}, failed {failed}.")
+            finally:
+                close_old_connections()
+            time.sleep(options["interval"])
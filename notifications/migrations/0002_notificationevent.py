@@ -0,0 +1,29 @@
+# Generated by Django 5.2.10 on 2026-10-19 15:53
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotificationEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('digest', models.CharField(choices=[('candidate', 'Candidate application updates'), ('recruiter_daily', 'Recruiter daily new applicants')], max_length=20)),
+                ('recipient', models.EmailField(max_length=254)),
+                ('kind', models.CharField(max_length=30)),
+                ('context', models.JSONField()),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('due_at', models.DateTimeField()),
+            ],
+            options={
+                'indexes': [models.Index(fields=['digest', 'due_at'], name='notif_event_due_idx'), models.Index(fields=['digest', 'recipient', 'created_at'], name='notif_event_group_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,76 @@
+# notifications/models.py
+#
+# Transactional outbox: side effects (emails) are written as rows in the
+# same transaction as the change that causes them, and delivered after
+# commit by the relay in notifications/outbox.py.
+
+from django.db import models
+from django.utils import timezone
+
+
+class OutboxMessage(models.Model):
+    STATUS_CHOICES = [
+        ("pending", "Pending"),
+        ("sent", "Sent"),
+        ("dead", "Dead"),  # gave up after OUTBOX_MAX_ATTEMPTS
+    ]
+
+    kind = models.CharField(max_length=30, default="email")
+    # Idempotency key: one row per logical side effect, e.g. "invite:<token>"
+    key = models.CharField(max_length=200, unique=True)
+    payload = models.JSONField()
+
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default="pending")
+    # Next attempt; moved forward while a relay holds the row (lease)
+    # and by the retry backoff
+    available_at = models.DateTimeField(default=timezone.now)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # Relay scan: only undelivered rows are indexed
+            models.Index(
+                fields=["available_at"],
+                condition=models.Q(status="pending"),
+                name="outbox_pending_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} {self.key} ({self.status})"
+
+
+class NotificationEvent(models.Model):
+    """
+    Queue of events waiting to be summarised in one email per recipient
+    (notifications/digest.py). Rows are deleted when their digest is
+    queued in the outbox.
+    """
+    DIGEST_CHOICES = [
+        ("candidate", "Candidate application updates"),
+        ("recruiter_daily", "Recruiter daily new applicants"),
+    ]
+
+    digest = models.CharField(max_length=20, choices=DIGEST_CHOICES)
+    recipient = models.EmailField()
+    kind = models.CharField(max_length=30)  # e.g. status_changed, new_application
+    context = models.JSONField()
+    created_at = models.DateTimeField(default=timezone.now)
+    # End of this event's window; a recipient's digest goes out once
+    # their earliest pending event is due, taking every pending event
+    due_at = models.DateTimeField()
+
+    class Meta:
+        indexes = [
+            # Flush scan: due recipients per digest
+            models.Index(fields=["digest", "due_at"], name="notif_event_due_idx"),
+            # Grouped read: all pending events of a batch of recipients
+            models.Index(fields=["digest", "recipient", "created_at"], name="notif_event_group_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.digest} {self.kind} -> {self.recipient}"
@@ -0,0 +1,253 @@
+# notifications/outbox.py
+#
+# enqueue_email() records an email in the caller's transaction; nothing
+# is sent from the request. After commit the relay thread of this
+# process is woken and delivers it. It also wakes every
+# OUTBOX_RELAY_INTERVAL seconds for rows a wake-up didn't cover (other
+# processes, retries, rows leased by a relay that died).
+#
+# Delivery is at-least-once: a relay claims rows by pushing available_at
+# OUTBOX_LEASE seconds ahead, marks them sent only after the handler
+# succeeded, and retries failures with exponential backoff. A crash
+# between sending and marking re-sends after the lease; the row's
+# idempotency key travels with the email so duplicates are recognisable.
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from core.scheduler import run_periodically
+from core.utils.email import send_brevo_batch, send_brevo_email
+from notifications.emails import render_email
+from notifications.models import OutboxMessage
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_HEADER = "X-HireFlow-Key"
+
+
+def _render(message):
+    payload = message.payload
+    if "template" not in payload:
+        # Queued before templated emails
+        return {
+            "to_email": payload["to_email"],
+            "subject": payload["subject"],
+            "html_content": payload["html_content"],
+        }
+    # Rendered at send time: a template fix also reaches queued retries
+    email = render_email(payload["template"], payload["context"])
+    return {
+        "to_email": payload["to_email"],
+        "subject": email.subject,
+        "html_content": email.html,
+        "text_content": email.text,
+    }
+
+
+def _send_emails(messages):
+    """
+    Up to OUTBOX_SEND_BATCH emails in one API call. A lone email is sent
+    on its own so it carries its idempotency key header (batch versions
+    can't have headers). Returns True when the API accepted them.
+    """
+    emails = [_render(message) for message in messages]
+    if len(emails) == 1:
+        return send_brevo_email(**emails[0], headers={IDEMPOTENCY_HEADER: messages[0].key})
+    return send_brevo_batch(emails)
+
+
+# kind -> handler(list of messages) returning True once the side effect
+# happened for all of them
+HANDLERS = {
+    "email": _send_emails,
+}
+
+
+# =====================================================
+# Enqueue (inside the caller's transaction)
+# =====================================================
+def enqueue(kind, key, payload):
+    """
+    Record a side effect. A second call with the same key is a no-op, so
+    retried requests never queue it twice. Returns the OutboxMessage.
+    """
+    message, _ = OutboxMessage.objects.get_or_create(
+        key=key, defaults={"kind": kind, "payload": payload}
+    )
+    transaction.on_commit(wake_relay)
+    return message
+
+
+def enqueue_email(key, to_email, template, context):
+    """Queue templates/emails/<template>.* for `to_email`; `context` must be JSON-able."""
+    return enqueue(
+        "email",
+        key,
+        {"to_email": to_email, "template": template, "context": context},
+    )
+
+
+def enqueue_emails(emails):
+    """
+    Bulk enqueue_email() for (key, to_email, template, context) tuples:
+    one INSERT, keys already queued are skipped.
+    """
+    OutboxMessage.objects.bulk_create(
+        [
+            OutboxMessage(
+                kind="email",
+                key=key,
+                payload={"to_email": to_email, "template": template, "context": context},
+            )
+            for key, to_email, template, context in emails
+        ],
+        batch_size=1000,
+        ignore_conflicts=True,
+    )
+    transaction.on_commit(wake_relay)
+
+
+# =====================================================
+# Relay
+# =====================================================
+def _claim(limit):
+    """Lease up to `limit` due rows to this relay."""
+    now = timezone.now()
+    with transaction.atomic():
+        # skip_locked: concurrent relays (one per web worker) split the
+        # backlog instead of queueing on each other's rows (PostgreSQL)
+        ids = list(
+            OutboxMessage.objects.select_for_update(skip_locked=True)
+            .filter(status="pending", available_at__lte=now)
+            .order_by("available_at")
+            .values_list("pk", flat=True)[:limit]
+        )
+        if ids:
+            OutboxMessage.objects.filter(pk__in=ids).update(
+                available_at=now + timedelta(seconds=settings.OUTBOX_LEASE),
+                attempts=F("attempts") + 1,
+            )
+    return list(OutboxMessage.objects.filter(pk__in=ids))
+
+
+def _deliver(messages):
+    """Error per message ("" = delivered) for one chunk of one kind."""
+    try:
+        if HANDLERS[messages[0].kind](messages):
+            return [""] * len(messages)
+        error = "handler reported failure"
+    except Exception as e:
+        logger.exception(f"Outbox {messages[0].kind} batch of {len(messages)} failed")
+        error = str(e) or e.__class__.__name__
+    return [error] * len(messages)
+
+
+def _chunks(batch, size):
+    """Messages grouped by kind, `size` per chunk."""
+    by_kind = {}
+    for message in batch:
+        by_kind.setdefault(message.kind, []).append(message)
+    return [
+        messages[i:i + size]
+        for messages in by_kind.values()
+        for i in range(0, len(messages), size)
+    ]
+
+
+def _record(batch, errors):
+    now = timezone.now()
+    sent = [message.pk for message, error in zip(batch, errors) if not error]
+    OutboxMessage.objects.filter(pk__in=sent).update(status="sent", sent_at=now, last_error="")
+
+    for message, error in zip(batch, errors):
+        if not error:
+            continue
+        if message.attempts >= settings.OUTBOX_MAX_ATTEMPTS:
+            logger.error(f"Outbox {message.kind} {message.key} dropped after {message.attempts} attempts")
+            status, retry_at = "dead", now
+        else:
+            status = "pending"
+            retry_at = now + timedelta(seconds=settings.OUTBOX_RETRY_BASE * 2 ** (message.attempts - 1))
+        OutboxMessage.objects.filter(pk=message.pk).update(
+            status=status, available_at=retry_at, last_error=error
+        )
+    return len(sent)
+
+
+def relay_outbox(batch_size=None, workers=None, send_batch=None):
+    """
+    Deliver every due message: claimed OUTBOX_BATCH_SIZE at a time, sent
+    in chunks of OUTBOX_SEND_BATCH (one API call each),
+    OUTBOX_RELAY_WORKERS chunks in parallel. Returns (sent, failed).
+    """
+    batch_size = batch_size or settings.OUTBOX_BATCH_SIZE
+    workers = workers or settings.OUTBOX_RELAY_WORKERS
+    send_batch = send_batch or settings.OUTBOX_SEND_BATCH
+    sent = failed = 0
+
+    with ThreadPoolExecutor(workers, thread_name_prefix="outbox") as pool:
+        while True:
+            batch = _claim(batch_size)
+            if not batch:
+                return sent, failed
+            chunks = _chunks(batch, send_batch)
+            results = pool.map(_deliver, chunks)
+            messages = [message for chunk in chunks for message in chunk]
+            errors = [error for chunk_errors in results for error in chunk_errors]
+            ok = _record(messages, errors)
+            sent += ok
+            failed += len(messages) - ok
+
+
+def purge_outbox():
+    """Drop sent rows older than OUTBOX_KEEP_SENT seconds."""
+    cutoff = timezone.now() - timedelta(seconds=settings.OUTBOX_KEEP_SENT)
+    deleted, _ = OutboxMessage.objects.filter(status="sent", sent_at__lt=cutoff).delete()
+    return deleted
+
+
+_wake = threading.Event()
+_relay_lock = threading.Lock()
+_relay_started = False
+
+
+def wake_relay():
+    _wake.set()
+
+
+def _relay_forever(interval):
+    while True:
+        _wake.wait(interval)
+        _wake.clear()
+        try:
+            relay_outbox()
+        except Exception:
+            logger.exception("Outbox relay failed")
+        finally:
+            close_old_connections()
+
+
+def start_outbox_relay():
+    """Relay thread per web worker unless OUTBOX_RELAY_INTERVAL is 0."""
+    global _relay_started
+    interval = settings.OUTBOX_RELAY_INTERVAL
+    if interval <= 0:
+        return False
+
+    with _relay_lock:
+        if _relay_started:
+            return False
+        _relay_started = True
+
+    threading.Thread(
+        target=_relay_forever, args=(interval,), name="outbox-relay", daemon=True
+    ).start()
+    run_periodically("outbox-purge", 60 * 60, purge_outbox)
+    return True
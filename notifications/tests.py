@@ -0,0 +1,155 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.conf import settings
+from django.db import transaction
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from applications.models import Application
+from jobs.models import Job
+from notifications.digest import flush_digests, notify
+from notifications.emails import render_email, render_stats
+from notifications.models import NotificationEvent, OutboxMessage
+from notifications.outbox import IDEMPOTENCY_HEADER, enqueue_email, relay_outbox
+from users.models import User
+
+INVITE = {"signup_link": "https://hireflow.example/signup/?token=t", "valid_hours": 48}
+
+
+class OutboxTests(TestCase):
+
+    def setUp(self):
+        self.recruiter = User.objects.create_user(
+            email="rec@example.com", password="pw-12345!", role="RECRUITER", is_active=True
+        )
+        job = Job.objects.create(
+            title="Backend", description="x", location="Pune", work_mode="onsite", created_by=self.recruiter,
+        )
+        self.application = Application.objects.create(
+            job=job, full_name="Asha Rao", email="asha@example.com", phone="9876543210",
+        )
+        self.client.force_login(self.recruiter)
+
+    @mock.patch("notifications.outbox.send_brevo_email", return_value=True)
+    def test_status_change_email_is_sent_by_relay_exactly_once(self, send):
+        url = reverse("recruiter_status_update", args=[self.application.pk])
+        self.client.post(url, {"status": "review"})
+        self.client.post(url, {"status": "review"})  # no change -> no email
+        send.assert_not_called()  # nothing from the request itself
+
+        self.assertEqual(relay_outbox(), (0, 0))  # digest window still open
+        flush_digests(now=timezone.now() + timedelta(seconds=settings.NOTIFICATION_DIGEST_WINDOW))
+        self.assertEqual(relay_outbox(), (1, 0))
+        self.assertEqual(relay_outbox(), (0, 0))
+
+        kwargs = send.call_args.kwargs
+        self.assertEqual(kwargs["to_email"], "asha@example.com")
+        self.assertIn("<strong>New Status:</strong> Review", kwargs["html_content"])
+        self.assertIn("New Status: Review", kwargs["text_content"])
+        self.assertTrue(kwargs["headers"][IDEMPOTENCY_HEADER].startswith("digest:candidate:"))
+        self.assertEqual(OutboxMessage.objects.get().status, "sent")
+
+    def test_rolled_back_change_leaves_no_message_and_keys_dedupe(self):
+        with self.assertRaises(RuntimeError), transaction.atomic():
+            enqueue_email("invite:1", "a@example.com", "recruiter_invite", INVITE)
+            raise RuntimeError
+
+        enqueue_email("invite:2", "a@example.com", "recruiter_invite", INVITE)
+        enqueue_email("invite:2", "a@example.com", "recruiter_invite", INVITE)
+        self.assertEqual(list(OutboxMessage.objects.values_list("key", flat=True)), ["invite:2"])
+
+    @override_settings(OUTBOX_MAX_ATTEMPTS=2, OUTBOX_RETRY_BASE=60)
+    def test_failures_retry_with_backoff_then_give_up(self):
+        message = enqueue_email("invite:3", "a@example.com", "recruiter_invite", INVITE)
+
+        with mock.patch("notifications.outbox.send_brevo_email", return_value=False):
+            self.assertEqual(relay_outbox(), (0, 1))
+            message.refresh_from_db()
+            self.assertEqual((message.status, message.attempts), ("pending", 1))
+            self.assertGreater(message.available_at, timezone.now() + timedelta(seconds=50))
+            self.assertEqual(relay_outbox(), (0, 0))  # not due yet
+
+            OutboxMessage.objects.update(available_at=timezone.now())
+            with self.assertLogs("notifications.outbox", "ERROR"):
+                self.assertEqual(relay_outbox(), (0, 1))
+
+        message.refresh_from_db()
+        self.assertEqual((message.status, message.attempts), ("dead", 2))
+
+
+class EmailTemplateTests(TestCase):
+
+    def test_html_is_escaped_and_text_and_subject_are_not(self):
+        email = render_email("status_changed", {
+            "full_name": "Asha <script>",
+            "job_title": "R&D Engineer",
+            "status": "Interview",
+            "track_url": "https://hireflow.example/t/?a=1&b=2",
+        })
+
+        self.assertEqual(email.subject, "Application Status Updated – HireFlow")
+        self.assertIn("Hi Asha &lt;script&gt;,", email.html)
+        self.assertIn("<strong>R&amp;D Engineer</strong>", email.html)
+        self.assertIn("Hi Asha <script>,", email.text)
+        self.assertIn("https://hireflow.example/t/?a=1&b=2\n", email.text)
+        self.assertNotIn("<p>", email.text)
+        self.assertGreaterEqual(render_stats()["status_changed"]["count"], 1)
+
+
+class DigestTests(TestCase):
+
+    def status(self, email, job_title, status):
+        notify("candidate", email, "status_changed", {
+            "full_name": "Asha Rao",
+            "job_title": job_title,
+            "status": status,
+            "track_url": f"https://hireflow.example/t/{job_title}/",
+        })
+
+    @mock.patch("notifications.outbox.send_brevo_batch", return_value=True)
+    @mock.patch("notifications.outbox.send_brevo_email", return_value=True)
+    def test_updates_coalesce_per_candidate_and_send_in_one_call(self, send, send_batch):
+        self.status("asha@example.com", "Backend", "Review")
+        self.status("asha@example.com", "Backend", "Interview")
+        self.status("asha@example.com", "Frontend", "Rejected")
+        for i in range(3):
+            self.status(f"c{i}@example.com", "Backend", "Rejected")
+
+        self.assertEqual(flush_digests(), (0, 0))  # window still open
+        later = timezone.now() + timedelta(seconds=settings.NOTIFICATION_DIGEST_WINDOW)
+        self.assertEqual(flush_digests(now=later), (6, 4))
+        self.assertFalse(NotificationEvent.objects.exists())
+
+        self.assertEqual(relay_outbox(), (4, 0))
+        send.assert_not_called()
+        emails = {email["to_email"]: email for email in send_batch.call_args.args[0]}
+        self.assertEqual(send_batch.call_count, 1)
+        self.assertEqual(len(emails), 4)
+
+        asha = emails["asha@example.com"]
+        self.assertEqual(asha["subject"], "Updates on your applications – HireFlow")
+        self.assertIn("- Backend: Interview", asha["text_content"])
+        self.assertIn("- Frontend: Rejected", asha["text_content"])
+        self.assertNotIn("Review", asha["text_content"])
+        self.assertEqual(emails["c0@example.com"]["subject"], "Application Status Updated – HireFlow")
+
+    def test_recruiter_daily_digest_groups_new_applicants_by_job(self):
+        for i in range(7):
+            notify("recruiter_daily", "rec@example.com", "new_application", {
+                "job_id": i % 2,
+                "job_title": ["Backend", "Frontend"][i % 2],
+                "applications_url": f"https://hireflow.example/jobs/{i % 2}/",
+                "full_name": f"Candidate {i}",
+            })
+
+        due = NotificationEvent.objects.first().due_at
+        self.assertEqual(timezone.localtime(due).hour, settings.RECRUITER_DIGEST_HOUR)
+        self.assertEqual(flush_digests(now=due), (7, 1))
+
+        context = OutboxMessage.objects.get().payload["context"]
+        self.assertEqual(context["total"], 7)
+        self.assertEqual([(job["job_title"], job["count"]) for job in context["jobs"]], [("Backend", 4), ("Frontend", 3)])
+        email = render_email("new_applicants_digest", context)
+        self.assertEqual(email.subject, "7 new applicants – HireFlow")
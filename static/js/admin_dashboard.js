@@ -15,3 +15,59 @@ document.querySelectorAll(".dashboard-card").forEach(card => {
 console.info("HireFlow Admin Dashboard loaded");
 
 
+
+// Trend charts: one small JSON response per chart (analytics/series.py)
+
+const CHART_COLORS = ["#6366f1", "#f59e0b", "#0ea5e9", "#8b5cf6", "#10b981", "#ef4444", "#94a3b8"];
+const SVG_NS = "http://www.w3.org/2000/svg";
+
+function drawChart(container, payload) {
+    const width = 600, height = 200, pad = 24;
+    const max = Math.max(1, ...payload.datasets.flatMap(ds => ds.data));
+    const step = payload.points.length > 1 ? (width - pad * 2) / (payload.points.length - 1) : 0;
+
+    const svg = document.createElementNS(SVG_NS, "svg");
+    svg.setAttribute("viewBox", `0 0 ${width} ${height}`);
+    svg.setAttribute("preserveAspectRatio", "none");
+
+    payload.datasets.forEach((ds, i) => {
+        const line = document.createElementNS(SVG_NS, "polyline");
+        line.setAttribute("points", ds.data.map((value, x) =>
+            `${pad + x * step},${height - pad - (value / max) * (height - pad * 2)}`
+        ).join(" "));
+        line.setAttribute("fill", "none");
+        line.setAttribute("stroke", CHART_COLORS[i % CHART_COLORS.length]);
+        line.setAttribute("stroke-width", "2");
+        svg.appendChild(line);
+    });
+
+    const legend = document.createElement("div");
+    legend.className = "chart-legend";
+    payload.datasets.forEach((ds, i) => {
+        const item = document.createElement("span");
+        item.style.setProperty("--swatch", CHART_COLORS[i % CHART_COLORS.length]);
+        item.textContent = `${ds.label} (${ds.data.reduce((a, b) => a + b, 0)})`;
+        legend.appendChild(item);
+    });
+
+    container.replaceChildren(svg, legend);
+    container.title = `${payload.start} – ${payload.end}, per ${payload.bucket}`;
+}
+
+function loadCharts() {
+    const range = document.getElementById("chart-range");
+    const days = range ? range.value : 90;
+
+    document.querySelectorAll(".chart[data-chart-url]").forEach(container => {
+        fetch(`${container.dataset.chartUrl}?days=${days}`)
+            .then(response => response.json())
+            .then(payload => drawChart(container, payload))
+            .catch(() => { container.textContent = "Chart unavailable"; });
+    });
+}
+
+const chartRange = document.getElementById("chart-range");
+if (chartRange) {
+    chartRange.addEventListener("change", loadCharts);
+    loadCharts();
+}
@@ -12,6 +12,7 @@ from users.views.auth import (
 )          
 from users.views.admin import (
         admin_dashboard, recruiter_management,
+        admin_analytics, admin_chart_data,
         suspend_recruiter, activate_recruiter,
         invite_page,
         # admin_application_detail,
@@ -21,7 +22,12 @@ from users.views.admin import (
         # admin_job_applications,
 
     )        
-from users.views.recruiter import recruiter_dashboard,recruiter_job_applications
+from users.views.recruiter import (
+    recruiter_dashboard,
+    recruiter_job_applications,
+    download_job_resumes,
+    resume_archive_status,
+)
 
 
 urlpatterns = [                    
@@ -44,6 +50,8 @@ urlpatterns = [
 
 
     path("dashboard/admin/", admin_dashboard, name="admin_dashboard"),
+    path("dashboard/admin/analytics/", admin_analytics, name="admin_analytics"),
+    path("dashboard/admin/charts/<str:name>/", admin_chart_data, name="admin_chart_data"),
     path("dashboard/recruiter/", recruiter_dashboard, name="recruiter_dashboard"),
 
     path("dashboard/admin/recruiter-management/", recruiter_management, name="recruiter_management"),
@@ -61,4 +69,6 @@ urlpatterns = [
 
     # RECRUITER job-specific applications list
     path("recruiter/applications/<int:id>/applications/", recruiter_job_applications, name="recruiter_job_applications"),
+    path("recruiter/applications/<int:id>/resumes.zip", download_job_resumes, name="download_job_resumes"),
+    path("recruiter/resume-archives/<int:pk>/", resume_archive_status, name="resume_archive_status"),
 ]
\ No newline at end of file
@@ -7,13 +7,17 @@ from django.contrib import messages
 from django.core.paginator import Paginator
 from django.views.decorators.http import require_POST
 from django.http import JsonResponse
+from django.conf import settings
+from django.db import transaction
 import uuid
 import logging 
 
 from users.models import User, Invite
 from jobs.models import Job
 from applications.models import Application
-from core.utils.email import send_brevo_email
+from notifications.outbox import enqueue_email
+from analytics.rollups import funnel_totals, time_to_hire, top_scopes
+from analytics.series import SOURCES as SERIES_SOURCES, chart_series
 
 logger = logging.getLogger(__name__)
 
@@ -81,6 +85,72 @@ def admin_dashboard(request):
     },
     )
 
+# ===============================
+# HIRING ANALYTICS (ROLLUPS ONLY)
+# ===============================
+@login_required
+def admin_analytics(request):
+    """
+    Admin can:
+    - View the hiring funnel for the last N days
+    - View time-to-hire percentiles
+    - View top jobs / recruiters by applications and hires
+    Everything is read from analytics rollups, never from raw events.
+    """
+
+    if request.user.role not in ["ADMIN", "SUPERUSER"]:
+        raise PermissionDenied()
+
+    try:
+        days = min(max(int(request.GET.get("days", 30)), 1), 730)
+    except ValueError:
+        days = 30
+    end = timezone.localdate()
+    start = end - timedelta(days=days - 1)
+
+    top_jobs = top_scopes("job", "applied", start, end)
+    top_recruiters = top_scopes("recruiter", "hired", start, end)
+    job_titles = dict(Job.objects.filter(id__in=[i for i, _ in top_jobs]).values_list("id", "title"))
+    recruiter_emails = dict(
+        User.objects.filter(id__in=[i for i, _ in top_recruiters]).values_list("id", "email")
+    )
+
+    return render(
+        request,
+        "admin/analytics.html",
+        {
+            "days": days,
+            "start": start,
+            "end": end,
+            "funnel": funnel_totals("global", 0, start, end),
+            "time_to_hire": time_to_hire("global", 0, start, end),
+            "top_jobs": [(job_titles.get(i, f"Job #{i}"), n) for i, n in top_jobs],
+            "top_recruiters": [(recruiter_emails.get(i, f"Recruiter #{i}"), n) for i, n in top_recruiters],
+        },
+    )
+
+@login_required
+def admin_chart_data(request, name):
+    """
+    JSON for the admin dashboard charts (static/js/admin_dashboard.js).
+    ?days=90&bucket=auto|day|week|month
+    """
+
+    if request.user.role not in ["ADMIN", "SUPERUSER"]:
+        raise PermissionDenied()
+
+    if name not in SERIES_SOURCES:
+        return JsonResponse({"error": "Unknown series"}, status=404)
+
+    try:
+        days = min(max(int(request.GET.get("days", 90)), 1), settings.ANALYTICS_SERIES_DAYS)
+    except ValueError:
+        days = 90
+    end = timezone.localdate()
+    start = end - timedelta(days=days - 1)
+
+    return JsonResponse(chart_series(name, start, end, request.GET.get("bucket", "auto")))
+
 # ========================
 # RECRUITER MANAGEMENT (LIST RECRUITER USERS)
 # ========================
@@ -197,34 +267,23 @@ def invite_page(request):
             f"/signup/?token={token}"  # generated token passed here  
         )
 
-        email_sent = send_brevo_email(
-            to_email=email,
-            subject="HireFlow RECRUITER Invitation",
-            html_content=f"""
-                <p>Hello,</p>
-                <p>You have been invited to join <strong>HireFlow</strong> as a RECRUITER user.</p>
-                <p>
-                    <a href="{signup_link}">
-                        Click here to create your account
-                    </a>
-                </p>
-                <p>This link is valid for 48 hours.</p>
-            """,
-        )
-
-        if not email_sent: 
-            messages.error(
-                request, "Failed to send email. Try again later."
+        # Invite row + outbox email commit together; the relay sends
+        # (and retries) the email after commit
+        with transaction.atomic():
+            Invite.objects.create(
+                email=email,
+                token=token,
+                created_by=request.user,   
+                created_by_email=request.user.email,
+                expires_at=timezone.now() + timedelta(hours=48),
             )
-            return redirect("invite")
 
-        Invite.objects.create(
-            email=email,
-            token=token,
-            created_by=request.user,   
-            created_by_email=request.user.email,
-            expires_at=timezone.now() + timedelta(hours=48),
-        )
+            enqueue_email(
+                key=f"invite:{token}",
+                to_email=email,
+                template="recruiter_invite",
+                context={"signup_link": signup_link, "valid_hours": 48},
+            )
 
         messages.success(
             request, f"Invite sent successfully to {email}"
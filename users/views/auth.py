@@ -6,11 +6,11 @@ from django.utils import timezone
 from django.conf import settings
 from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError
-from django.db import IntegrityError
+from django.db import IntegrityError, transaction
 
 from users.models import User, Invite, PasswordReset, EmailVerificationToken
 
-from core.utils.email import send_brevo_email  # Brevo logic (API key goes in settings)
+from notifications.outbox import enqueue_email  # sent by the outbox relay (Brevo)
 
 from datetime import timedelta
 import uuid
@@ -275,21 +275,20 @@ def forgot_password_request(request):
         token = uuid.uuid4()
         reset_link = request.build_absolute_uri (f"/reset-password/?token={token}")
 
-        # NOTE: Add your Brevo API key in settings.py
-        send_brevo_email(
-            to_email=email,
-            subject="Reset your HireFlow password",
-            html_content=f"""
-                <p>Click below to reset your password:</p>
-                <a href="{reset_link}">Reset Password</a>
-            """,
-        )  
-
-        PasswordReset.objects.create(   
-            user=user,
-            token=token,
-            expires_at=timezone.now() + timedelta(minutes=15),
-        )   
+        # Reset token + outbox email commit together
+        with transaction.atomic():
+            PasswordReset.objects.create(   
+                user=user,
+                token=token,
+                expires_at=timezone.now() + timedelta(minutes=15),
+            )   
+
+            enqueue_email(
+                key=f"password-reset:{token}",
+                to_email=email,
+                template="password_reset",
+                context={"reset_link": reset_link, "valid_minutes": 15},
+            )  
 
         messages.success(request, "Password reset link sent.")
         return redirect("forgot_password")
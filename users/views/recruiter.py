@@ -1,8 +1,14 @@
+from django.conf import settings
 from django.shortcuts import render, get_object_or_404,redirect
 from django.contrib.auth.decorators import login_required
 from django.core.exceptions import PermissionDenied
+from django.http import StreamingHttpResponse
+from django.views.decorators.http import require_POST
 from jobs.models import Job
-from applications.models import Application
+from applications.models import Application, ResumeArchive
+from applications.matching import sort_by_match
+from applications.resume_archive import archive_entries, job_resumes, request_archive, stream_zip
+from applications.resume_preview import signed_urls
 import logging
 
 logger = logging.getLogger(__name__)
@@ -129,13 +135,79 @@ def recruiter_job_applications(request, id):
         job=job
     ).order_by("-applied_at")
 
+    # ?sort=match -> best resume match first
+    sort = request.GET.get("sort", "")
+    if sort == "match":
+        applications = sort_by_match(applications)
+
     return render(
         request,
         "recruiter/applications/job_applications.html",
         {
             "job": job,
             "applications": applications,
+            "sort": sort,
             "hide_sidebar": True,
 
         }
-    )
\ No newline at end of file
+    )
+
+# ===============================================================
+#            RECRUITER – DOWNLOAD ALL RESUMES FOR A JOB
+# ===============================================================
+@login_required
+@require_POST
+def download_job_resumes(request, id):
+    """
+    ZIP of every resume for the job, streamed as it is built. Jobs over
+    RESUME_ARCHIVE_STREAM_LIMIT resumes get a background-built archive
+    (a POST, since that creates one).
+    """
+
+    if request.user.role != "RECRUITER":
+        raise PermissionDenied()
+
+    job = get_object_or_404(Job, id=id, created_by=request.user, is_deleted=False)
+    applications = job_resumes(job)
+
+    if applications.count() > settings.RESUME_ARCHIVE_STREAM_LIMIT:
+        archive = request_archive(job, request.user)
+        return redirect("resume_archive_status", pk=archive.pk)
+
+    response = StreamingHttpResponse(
+        stream_zip(archive_entries(applications)),
+        content_type="application/zip",
+    )
+    response["Content-Disposition"] = f'attachment; filename="{job.slug}-resumes.zip"'
+    return response
+
+
+@login_required
+def resume_archive_status(request, pk):
+
+    if request.user.role != "RECRUITER":
+        raise PermissionDenied()
+
+    archive = get_object_or_404(
+        ResumeArchive.objects.select_related("job"),
+        pk=pk,
+        job__created_by=request.user,
+    )
+
+    urls = signed_urls(part["path"] for part in archive.parts)
+    parts = [
+        {"number": n, "count": part["count"], "url": urls.get(part["path"])}
+        for n, part in enumerate(archive.parts, start=1)
+    ]
+
+    return render(
+        request,
+        "recruiter/applications/resume_archive.html",
+        {
+            "archive": archive,
+            "job": archive.job,
+            "parts": parts,
+            "done": sum(part["count"] for part in archive.parts),
+            "hide_sidebar": True,
+        }
+    )